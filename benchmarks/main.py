@@ -0,0 +1,370 @@
+"""
+Benchmarks de los caminos críticos de las reglas.
+
+Mide, sobre posiciones fijas (apertura, contacto en el medio juego, entrada
+desde la barra y bear off) con una tirada fija:
+
+    es_movimiento_valido         todos los pares (desde, hasta) posibles con los dados
+    hacer_movimiento             un movimiento legal y su deshacer
+    tiene_movimientos_disponibles
+    get_punto                    los 24 puntos del tablero
+    clonar, snapshot_restaurar   copiar el juego con Game.clonar y con una instantánea
+    deepcopy                     copiar el juego con copy.deepcopy, como referencia
+    expectiminimax_N             una búsqueda completa de ExpectiminimaxBot a
+                                 profundidad N, con la tabla de transposición vacía
+    jugada_interactiva           la jugada más lenta del bot con el límite de tiempo
+                                 de la CLI, con la tirada fija y con dobles
+
+y además partidas completas al azar con semillas fijas. Cada medición se repite
+y se queda con la más rápida (la menos afectada por el resto del sistema).
+
+Los resultados se escriben en JSON; con --comparar se contrastan con una línea
+base guardada y el proceso termina con código 1 si algo empeoró más que el umbral.
+También termina con código 1 si alguna jugada interactiva supera --limite-jugada
+o si clonar no es al menos --razon-copia veces más rápido que deepcopy.
+
+    python -m benchmarks.main --salida base.json
+    python -m benchmarks.main --comparar base.json --umbral 0.15
+"""
+import argparse
+import copy
+import json
+import platform
+import random
+import sys
+import time
+
+from core import position_id
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.expectiminimax import LIMITE_SEGUNDOS_INTERACTIVO, ExpectiminimaxBot
+from core.game import Game
+from core.game_record import DadosGrabados
+
+VERSION_FORMATO = 1
+TABLEROS = {'board': Board, 'compacto': CompactBoard}
+
+# Segundos que puede tardar una jugada del bot contra una persona
+LIMITE_JUGADA_SEGUNDOS = 1.0
+# Los dobles chicos generan la mayor cantidad de jugadas distintas
+DOBLES_INTERACTIVOS = ((2, 2), (4, 4))
+# Cuántas veces más rápido que copy.deepcopy tiene que ser Game.clonar
+RAZON_MINIMA_COPIA = 20.0
+
+
+def _identificador(blancas, negras, barra_white=0, barra_black=0, color_turno='white'):
+    """Arma el identificador de una posición a partir de {punto: fichas} por color."""
+    conteos = [0] * 24
+    for punto, cantidad in blancas.items():
+        conteos[punto - 1] = cantidad
+    for punto, cantidad in negras.items():
+        conteos[punto - 1] = -cantidad
+    return position_id.codificar(conteos, barra_white, barra_black, color_turno)
+
+
+# Posiciones fijas: (identificador, tirada). Mueven siempre las blancas.
+POSICIONES = {
+    'apertura': (
+        _identificador({1: 2, 12: 5, 17: 3, 19: 5}, {6: 5, 8: 3, 13: 5, 24: 2}),
+        (3, 1)),
+    'contacto': (
+        _identificador({1: 1, 4: 2, 12: 3, 17: 2, 19: 3, 20: 2, 21: 2},
+                       {5: 2, 6: 4, 7: 2, 8: 2, 11: 1, 13: 4}),
+        (6, 4)),
+    'barra': (
+        _identificador({1: 1, 12: 4, 17: 3, 19: 3, 20: 2},
+                       {2: 2, 3: 2, 4: 2, 6: 3, 8: 3, 13: 3}, barra_white=2),
+        (5, 1)),
+    'bear_off': (
+        _identificador({19: 3, 20: 3, 21: 3, 22: 2, 23: 2, 24: 1},
+                       {1: 3, 2: 3, 3: 3, 4: 2, 5: 2, 6: 2}),
+        (6, 2)),
+}
+
+
+def preparar_posicion(nombre, clase_tablero=CompactBoard, tirada=None):
+    """
+    Crea el Game de una posición fija con su tirada ya hecha.
+
+    Args:
+        tirada (tuple or None): Tirada a usar en lugar de la fija de la posición
+
+    Returns:
+        Game: Juego listo para mover
+    """
+    identificador, fija = POSICIONES[nombre]
+    tirada = tirada or fija
+    game = Game.desde_posicion_id(identificador, dados=DadosGrabados([tirada]),
+                                  clase_tablero=clase_tablero)
+    game.tirar_dados()
+    return game
+
+
+def medir(funcion, numero, repeticiones):
+    """
+    Ejecuta funcion() 'numero' veces por repetición y retorna la mejor repetición.
+
+    Returns:
+        float: Segundos por llamada de la repetición más rápida
+    """
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for _ in range(numero):
+            funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor / numero
+
+
+def _casos_posicion(game):
+    """Arma las funciones a medir sobre una posición y cuántas operaciones hace cada una."""
+    dados = set(game.get_movimientos_disponibles())
+    pares = [(desde, min(desde + dado, 25) if desde else dado)
+             for desde in range(25) for dado in dados]
+    desde, hasta = game.generar_jugadas()[0][0]
+    board = game.get_board()
+
+    def es_movimiento_valido():
+        for par in pares:
+            game.es_movimiento_valido(*par)
+
+    def hacer_movimiento():
+        game.hacer_movimiento(desde, hasta)
+        game.deshacer()
+
+    def get_punto():
+        for posicion in range(1, 25):
+            board.get_punto(posicion)
+
+    return {
+        'es_movimiento_valido': (es_movimiento_valido, len(pares)),
+        'hacer_movimiento': (hacer_movimiento, 1),
+        'tiene_movimientos_disponibles': (game.tiene_movimientos_disponibles, 1),
+        'get_punto': (get_punto, 24),
+    }
+
+
+def _casos_copia(game):
+    """Arma las formas de copiar el juego a medir; deepcopy comparte los dados como clonar."""
+    dados = game.get_dice()
+
+    def snapshot_restaurar():
+        game.restaurar(game.snapshot())
+
+    return {
+        'clonar': (game.clonar, 1),
+        'snapshot_restaurar': (snapshot_restaurar, 1),
+        'deepcopy': (lambda: copy.deepcopy(game, {id(dados): dados}), 1),
+    }
+
+
+def _casos_busqueda(game, profundidad):
+    """Arma la búsqueda a medir sobre una posición, con un bot nuevo en cada llamada."""
+    def buscar():
+        ExpectiminimaxBot(profundidad).elegir_jugada(game)
+
+    return {f'expectiminimax_{profundidad}': (buscar, 1)}
+
+
+def peor_jugada_interactiva(nombre, clase_tablero, profundidad):
+    """
+    Mide la jugada más lenta del bot con el límite de tiempo de la CLI.
+
+    Returns:
+        tuple: (segundos de la jugada más lenta, jugadas medidas)
+    """
+    tiradas = (POSICIONES[nombre][1],) + DOBLES_INTERACTIVOS
+    peor = 0.0
+    for tirada in tiradas:
+        game = preparar_posicion(nombre, clase_tablero, tirada)
+        bot = ExpectiminimaxBot(profundidad, limite_segundos=LIMITE_SEGUNDOS_INTERACTIVO)
+        inicio = time.perf_counter()
+        bot.elegir_jugada(game)
+        peor = max(peor, time.perf_counter() - inicio)
+    return peor, len(tiradas)
+
+
+def excedidos(actual, limite=LIMITE_JUGADA_SEGUNDOS):
+    """
+    Retorna las jugadas interactivas que tardaron más que el límite.
+
+    Returns:
+        list: (nombre, segundos) de cada posición que superó el límite
+    """
+    return [(nombre, medicion['ns_por_op'] / 1e9)
+            for nombre, medicion in actual['resultados'].items()
+            if nombre.endswith('.jugada_interactiva') and medicion['ns_por_op'] > limite * 1e9]
+
+
+def copias_lentas(actual, razon_minima=RAZON_MINIMA_COPIA):
+    """
+    Retorna las posiciones donde clonar no es lo bastante más rápido que deepcopy.
+
+    Returns:
+        list: (posición, razón deepcopy/clonar) de cada posición por debajo del mínimo
+    """
+    resultados = actual['resultados']
+    lentas = []
+    for posicion in POSICIONES:
+        clonar = resultados.get(f'{posicion}.clonar')
+        referencia = resultados.get(f'{posicion}.deepcopy')
+        if clonar and referencia:
+            razon = referencia['ns_por_op'] / clonar['ns_por_op']
+            if razon < razon_minima:
+                lentas.append((posicion, razon))
+    return lentas
+
+
+def jugar_partida_al_azar(semilla, clase_tablero):
+    """Juega una partida completa con jugadas al azar; retorna la cantidad de turnos."""
+    rng = random.Random(semilla)
+    game = Game(clase_tablero)
+    game.iniciar_juego("Blancas", "Negras", Dice(semilla=rng.getrandbits(64)))
+    turnos = 0
+    while not game.esta_terminado():
+        game.tirar_dados()
+        jugadas = game.generar_jugadas()
+        if jugadas:
+            game.aplicar(jugadas[rng.randrange(len(jugadas))])
+        game.cambiar_turno()
+        turnos += 1
+    return turnos
+
+
+def ejecutar(clase_tablero=CompactBoard, numero=2000, repeticiones=5, partidas=20,
+             busquedas=1, profundidad=2):
+    """
+    Corre todos los benchmarks.
+
+    Args:
+        clase_tablero (type): Tablero con el que se arman los juegos
+        numero (int): Llamadas por repetición en los benchmarks de posiciones
+        repeticiones (int): Repeticiones de cada medición (se toma la mejor)
+        partidas (int): Partidas al azar por repetición del benchmark de partidas
+        busquedas (int): Búsquedas del bot por repetición en cada posición; 0 las
+            omite, junto con la jugada interactiva
+        profundidad (int): Profundidad de esas búsquedas y de la jugada interactiva
+
+    Returns:
+        dict: Resultados listos para guardar en JSON; cada benchmark tiene
+              'ns_por_op' (nanosegundos por operación) y 'operaciones'
+    """
+    resultados = {}
+    for nombre in POSICIONES:
+        game = preparar_posicion(nombre, clase_tablero)
+        casos = [(caso, numero) + medicion for caso, medicion in _casos_posicion(game).items()]
+        # Copiar el juego es mucho más caro que una consulta: se hacen menos llamadas
+        casos += [(caso, max(numero // 20, 1)) + medicion
+                  for caso, medicion in _casos_copia(game).items()]
+        if busquedas:
+            casos += [(caso, busquedas) + medicion
+                      for caso, medicion in _casos_busqueda(game, profundidad).items()]
+        for caso, llamadas, funcion, operaciones in casos:
+            segundos = medir(funcion, llamadas, repeticiones)
+            resultados[f'{nombre}.{caso}'] = {
+                'ns_por_op': segundos / operaciones * 1e9,
+                'operaciones': llamadas * operaciones,
+            }
+        if busquedas:
+            segundos, jugadas = peor_jugada_interactiva(nombre, clase_tablero, profundidad)
+            resultados[f'{nombre}.jugada_interactiva'] = {
+                'ns_por_op': segundos * 1e9,
+                'operaciones': jugadas,
+            }
+
+    contador = iter(range(10 ** 9))
+    segundos = medir(lambda: jugar_partida_al_azar(next(contador) % partidas, clase_tablero),
+                     partidas, repeticiones)
+    resultados['partida_completa'] = {'ns_por_op': segundos * 1e9, 'operaciones': partidas}
+
+    return {
+        'version': VERSION_FORMATO,
+        'python': platform.python_version(),
+        'tablero': clase_tablero.__name__,
+        'resultados': resultados,
+    }
+
+
+def comparar(actual, base, umbral=0.10):
+    """
+    Compara dos corridas y detecta regresiones.
+
+    Args:
+        actual (dict): Resultado de ejecutar()
+        base (dict): Línea base guardada con el mismo formato
+        umbral (float): Empeoramiento relativo tolerado (0.10 = 10% más lento)
+
+    Returns:
+        list: Una fila por benchmark en ambas corridas: (nombre, ns base,
+              ns actual, cambio relativo, es_regresion)
+    """
+    if base.get('version') != VERSION_FORMATO:
+        raise ValueError("La línea base tiene otro formato de resultados")
+    filas = []
+    for nombre, medicion in actual['resultados'].items():
+        anterior = base['resultados'].get(nombre)
+        if anterior is None:
+            continue
+        cambio = medicion['ns_por_op'] / anterior['ns_por_op'] - 1
+        filas.append((nombre, anterior['ns_por_op'], medicion['ns_por_op'], cambio,
+                      cambio > umbral))
+    return filas
+
+
+def main(argumentos=None):
+    """Ejecuta los benchmarks desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Benchmarks de las reglas de Backgammon")
+    parser.add_argument('--tablero', choices=sorted(TABLEROS), default='compacto')
+    parser.add_argument('--numero', type=int, default=2000)
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--partidas', type=int, default=20)
+    parser.add_argument('--busquedas', type=int, default=1,
+                        help="Búsquedas del bot por repetición en cada posición (0 las omite)")
+    parser.add_argument('--profundidad', type=int, choices=(0, 1, 2), default=2)
+    parser.add_argument('--salida', default=None, help="Archivo JSON donde guardar los resultados")
+    parser.add_argument('--comparar', default=None, help="Línea base JSON contra la que comparar")
+    parser.add_argument('--umbral', type=float, default=0.10)
+    parser.add_argument('--limite-jugada', type=float, default=LIMITE_JUGADA_SEGUNDOS,
+                        help="Segundos máximos de una jugada interactiva del bot")
+    parser.add_argument('--razon-copia', type=float, default=RAZON_MINIMA_COPIA,
+                        help="Cuántas veces más rápido que deepcopy debe ser clonar")
+    opciones = parser.parse_args(argumentos)
+
+    actual = ejecutar(TABLEROS[opciones.tablero], opciones.numero, opciones.repeticiones,
+                      opciones.partidas, opciones.busquedas, opciones.profundidad)
+    if opciones.salida:
+        with open(opciones.salida, 'w', encoding='utf-8') as archivo:
+            json.dump(actual, archivo, indent=2)
+
+    lentas = excedidos(actual, opciones.limite_jugada)
+    for nombre, segundos in lentas:
+        print(f"{nombre}: {segundos:.2f} s supera el límite de {opciones.limite_jugada:.2f} s",
+              file=sys.stderr)
+    copias = copias_lentas(actual, opciones.razon_copia)
+    for posicion, razon in copias:
+        print(f"{posicion}: clonar es {razon:.1f}x más rápido que deepcopy, "
+              f"se esperaba al menos {opciones.razon_copia:.0f}x", file=sys.stderr)
+    fallas = bool(lentas or copias)
+
+    if not opciones.comparar:
+        if not opciones.salida:
+            print(json.dumps(actual, indent=2))
+        return 1 if fallas else 0
+
+    with open(opciones.comparar, encoding='utf-8') as archivo:
+        base = json.load(archivo)
+    if base.get('tablero') != actual['tablero']:
+        print(f"Atención: la línea base se midió con {base.get('tablero')} "
+              f"y esta corrida con {actual['tablero']}")
+    regresiones = 0
+    for nombre, anterior, ahora, cambio, es_regresion in comparar(actual, base, opciones.umbral):
+        marca = "REGRESIÓN" if es_regresion else ""
+        print(f"{nombre:45} {anterior:12.0f} ns -> {ahora:12.0f} ns  {cambio:+7.1%}  {marca}")
+        regresiones += es_regresion
+    print(f"\n{regresiones} regresiones con umbral {opciones.umbral:.0%}")
+    return 1 if regresiones or fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
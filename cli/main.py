@@ -1,3 +1,4 @@
+from core.expectiminimax import LIMITE_SEGUNDOS_INTERACTIVO, ExpectiminimaxBot
 from core.game import Game
 
 class BackgammonCLI:
@@ -10,6 +11,7 @@ class BackgammonCLI:
         """Inicializa la interfaz CLI."""
         self.__game__ = Game()
         self.__jugando__ = False
+        self.__bot__ = None
     
     def iniciar(self):
         """Punto de entrada principal de la CLI."""
@@ -49,7 +51,14 @@ class BackgammonCLI:
         print("="*60)
         
         nombre1 = input("\n👤 Nombre del Jugador 1 (fichas blancas): ").strip() or "Jugador 1"
-        nombre2 = input("👤 Nombre del Jugador 2 (fichas negras): ").strip() or "Jugador 2"
+        contra_computadora = input("🤖 ¿Jugar contra la computadora? (s/n): ").strip().lower() == 's'
+        if contra_computadora:
+            nombre2 = "Computadora"
+            self.__bot__ = ExpectiminimaxBot(self.__pedir_profundidad__(),
+                                             limite_segundos=LIMITE_SEGUNDOS_INTERACTIVO)
+        else:
+            nombre2 = input("👤 Nombre del Jugador 2 (fichas negras): ").strip() or "Jugador 2"
+            self.__bot__ = None
         
         self.__game__.iniciar_juego(nombre1, nombre2)
         self.__jugando__ = True
@@ -70,6 +79,10 @@ class BackgammonCLI:
             
             self.__mostrar_tablero__()
             
+            if self.__bot__ is not None and jugador.get_color() == 'black':
+                self.__turno_computadora__()
+                continue
+            
             # Tirar dados
             if not self.__tirar_dados__():
                 continue
@@ -80,6 +93,25 @@ class BackgammonCLI:
         if self.__game__.esta_terminado():
             self.__mostrar_resultado_final__()
     
+    def __pedir_profundidad__(self):
+        """Pregunta la profundidad de búsqueda de la computadora (0-2)."""
+        opcion = input("🤖 Dificultad (0=fácil, 1=media, 2=difícil) [1]: ").strip()
+        return int(opcion) if opcion in ('0', '1', '2') else 1
+    
+    def __turno_computadora__(self):
+        """Tira los dados y juega la jugada elegida por la computadora."""
+        dados = self.__game__.tirar_dados()
+        print(f"\n🎲 Dados de la computadora: {dados}")
+        
+        jugada, equity = self.__bot__.elegir_jugada(self.__game__)
+        if jugada is None:
+            print("❌ La computadora no tiene movimientos válidos. Turno perdido.")
+        else:
+            self.__game__.aplicar(jugada)
+            movimientos = ", ".join(f"{desde}→{hasta}" for desde, hasta in jugada)
+            print(f"🤖 La computadora juega {movimientos} (equity {equity:+.3f})")
+        self.__game__.cambiar_turno()
+    
     def __tirar_dados__(self):
         """Maneja la tirada de dados."""
         input("\n🎲 Presiona ENTER para tirar los dados...")
@@ -200,6 +232,8 @@ class BackgammonCLI:
         home_white = len(self.__game__.get_home('white'))
         home_black = len(self.__game__.get_home('black'))
         print(f"\n🏠 Casa Blancas: {home_white}/15 | Casa Negras: {home_black}/15 🏠")
+        print(f"📏 Pips Blancas: {self.__game__.get_pip_count('white')} | "
+              f"Pips Negras: {self.__game__.get_pip_count('black')}")
     
     def __mostrar_ayuda_movimiento__(self):
         """Muestra ayuda sobre cómo realizar movimientos."""
@@ -0,0 +1,276 @@
+"""
+Base de datos de bear off de un solo lado.
+
+Cuando todas las fichas de un jugador están en su casa (la condición de
+Game.__puede_bear_off__), la cantidad esperada de tiradas para sacarlas todas
+se puede calcular exactamente. Este módulo genera, para las 54.264 formas de
+repartir hasta 15 fichas en los 6 puntos de la casa, las tiradas esperadas
+jugando de forma óptima, y las guarda en un archivo binario compacto que luego
+se abre con mmap para consultas O(1).
+
+La base es de un solo lado: ignora al rival, así que es exacta en carreras.
+
+Uso:
+    python -m core.bearoff --salida core/bearoff.bin
+"""
+import argparse
+import mmap
+import os
+import struct
+from array import array
+from math import comb
+
+from .dice import TIRADAS
+from .move_generator import a_perspectiva, generar_jugadas_perspectiva, _MOVIMIENTOS
+
+PUNTOS_CASA = 6
+MAX_FICHAS = 15
+CANTIDAD_POSICIONES = comb(MAX_FICHAS + PUNTOS_CASA, PUNTOS_CASA)  # 54.264
+
+MAGIA = b'BKBO'
+VERSION = 1
+_CABECERA = struct.Struct('<4sHHI')  # magia, versión, máximo de fichas, cantidad de posiciones
+_VALOR = struct.Struct('<f')
+
+RUTA_POR_DEFECTO = os.path.join(os.path.dirname(__file__), 'bearoff.bin')
+
+
+def indice_posicion(conteos):
+    """
+    Retorna el índice (0 a 54.263) de un reparto de fichas en la casa.
+
+    Usa el sistema combinatorio: las fichas y los 6 separadores entre puntos
+    ocupan 21 casillas, y el índice es el rango de las casillas de los separadores.
+
+    Args:
+        conteos (sequence): Fichas en los puntos a 1..6 pips de salir (total <= 15)
+
+    Returns:
+        int: Índice de la posición
+    """
+    indice = 0
+    acumulado = 0
+    for k, cantidad in enumerate(conteos):
+        acumulado += cantidad
+        indice += comb(acumulado + k, k + 1)
+    return indice
+
+
+def cantidad_posiciones(max_fichas=MAX_FICHAS):
+    """Retorna cuántos repartos hay de hasta max_fichas fichas en los 6 puntos."""
+    return comb(max_fichas + PUNTOS_CASA, PUNTOS_CASA)
+
+
+def _posiciones(max_fichas=MAX_FICHAS):
+    """Genera todos los repartos de hasta max_fichas fichas en 6 puntos."""
+    def repartir(punto, restantes):
+        if punto == PUNTOS_CASA:
+            yield ()
+            return
+        for cantidad in range(restantes + 1):
+            for resto in repartir(punto + 1, restantes - cantidad):
+                yield (cantidad,) + resto
+    return repartir(0, max_fichas)
+
+
+def _movimientos(conteos, dado):
+    """Retorna las posiciones distintas a las que se llega moviendo una ficha con un dado."""
+    mas_lejana = PUNTOS_CASA
+    while mas_lejana > 0 and conteos[mas_lejana - 1] == 0:
+        mas_lejana -= 1
+
+    resultados = set()
+    for pip in range(1, mas_lejana + 1):
+        if conteos[pip - 1] == 0:
+            continue
+        destino = pip - dado
+        if destino < 0 and pip != mas_lejana:
+            continue
+        nueva = list(conteos)
+        nueva[pip - 1] -= 1
+        if destino > 0:
+            nueva[destino - 1] += 1
+        resultados.add(tuple(nueva))
+    return resultados
+
+
+def _finales(conteos, movimientos):
+    """Retorna las posiciones finales posibles al jugar los dados en el orden dado."""
+    actuales = {conteos}
+    for dado in movimientos:
+        siguientes = set()
+        for posicion in actuales:
+            nuevas = _movimientos(posicion, dado)
+            siguientes.update(nuevas if nuevas else (posicion,))
+        actuales = siguientes
+    return actuales
+
+
+def calcular_tiradas_esperadas(max_fichas=MAX_FICHAS):
+    """
+    Calcula las tiradas esperadas para sacar todas las fichas en cada posición.
+
+    Los repartos con menos fichas tienen los índices más bajos, así que una base
+    con max_fichas menor es un prefijo de la base completa.
+
+    Args:
+        max_fichas (int): Máximo de fichas en la casa (15 para la base completa)
+
+    Returns:
+        array: Valores float indexados por indice_posicion
+    """
+    esperadas = array('f', [0.0]) * cantidad_posiciones(max_fichas)
+    # Moverse siempre reduce los pips: se calculan primero las posiciones con menos pips
+    posiciones = sorted(_posiciones(max_fichas),
+                        key=lambda c: sum((i + 1) * n for i, n in enumerate(c)))
+    for conteos in posiciones:
+        if not any(conteos):
+            continue
+        valor = 1.0
+        for tirada in TIRADAS:
+            finales = _finales(conteos, tirada.movimientos)
+            if tirada.dado1 != tirada.dado2:
+                finales |= _finales(conteos, tirada.movimientos[::-1])
+            valor += tirada.probabilidad * min(esperadas[indice_posicion(f)] for f in finales)
+        esperadas[indice_posicion(conteos)] = valor
+    return esperadas
+
+
+def generar_base(ruta=RUTA_POR_DEFECTO, max_fichas=MAX_FICHAS):
+    """
+    Genera la base de datos y la escribe en un archivo binario.
+
+    Formato: cabecera (magia, versión, máximo de fichas, cantidad) y un float32
+    little-endian por posición. La base completa ocupa unos 212 KB y tarda
+    alrededor de un minuto en generarse.
+
+    Args:
+        ruta (str): Archivo de salida
+        max_fichas (int): Máximo de fichas en la casa (1-15)
+
+    Returns:
+        str: Ruta del archivo escrito
+    """
+    if not 1 <= max_fichas <= MAX_FICHAS:
+        raise ValueError(f"El máximo de fichas debe estar entre 1 y {MAX_FICHAS}")
+    esperadas = calcular_tiradas_esperadas(max_fichas)
+    if esperadas.itemsize != 4:  # pragma: no cover
+        raise RuntimeError("Se necesita un float de 4 bytes para el formato del archivo")
+    if struct.pack('=I', 1) != struct.pack('<I', 1):  # pragma: no cover
+        esperadas.byteswap()
+    with open(ruta, 'wb') as archivo:
+        archivo.write(_CABECERA.pack(MAGIA, VERSION, max_fichas, len(esperadas)))
+        esperadas.tofile(archivo)
+    return ruta
+
+
+class BearoffDatabase:
+    """
+    Base de datos de bear off abierta con mmap.
+
+    El archivo no se carga en memoria: cada consulta lee 4 bytes del mapa.
+    """
+
+    def __init__(self, ruta=RUTA_POR_DEFECTO):
+        """
+        Abre una base de datos generada con generar_base.
+
+        Args:
+            ruta (str): Ruta del archivo binario
+        """
+        self.__archivo__ = open(ruta, 'rb')
+        try:
+            self.__mapa__ = mmap.mmap(self.__archivo__.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.__archivo__.close()
+            raise ValueError("El archivo de bear off está vacío")
+
+        if len(self.__mapa__) < _CABECERA.size:
+            self.cerrar()
+            raise ValueError("El archivo no es una base de bear off válida")
+        magia, version, max_fichas, cantidad = _CABECERA.unpack_from(self.__mapa__, 0)
+        if (magia != MAGIA or version != VERSION
+                or cantidad != cantidad_posiciones(max_fichas)
+                or len(self.__mapa__) != _CABECERA.size + _VALOR.size * cantidad):
+            self.cerrar()
+            raise ValueError("El archivo no es una base de bear off válida")
+        self.__max_fichas__ = max_fichas
+
+    def get_max_fichas(self):
+        """Retorna el máximo de fichas en la casa que cubre la base."""
+        return self.__max_fichas__
+
+    def get_tiradas_esperadas(self, conteos):
+        """
+        Retorna las tiradas esperadas para sacar todas las fichas.
+
+        Args:
+            conteos (sequence): Fichas en los puntos a 1..6 pips de salir
+
+        Returns:
+            float: Tiradas esperadas con juego óptimo (0 si no quedan fichas)
+        """
+        if sum(conteos) > self.__max_fichas__:
+            raise ValueError("La posición tiene más fichas de las que cubre la base")
+        desplazamiento = _CABECERA.size + _VALOR.size * indice_posicion(conteos)
+        return _VALOR.unpack_from(self.__mapa__, desplazamiento)[0]
+
+    def mejor_jugada(self, game):
+        """
+        Elige la jugada que minimiza las tiradas esperadas del jugador actual.
+
+        Solo aplica cuando todas las fichas del jugador están en su casa. Si el
+        rival todavía tiene fichas en esa casa la base ignora el contacto, así
+        que la jugada es la mejor para la carrera, no necesariamente la óptima.
+
+        Args:
+            game (Game): Juego con los dados ya tirados
+
+        Returns:
+            tuple or None: Movimientos (desde, hasta) para Game.aplicar, o None
+                           si no hay dados, la posición no es de bear off o
+                           tiene más fichas de las que cubre la base
+        """
+        color = game.get_jugador_actual().get_color()
+        dados = game.get_movimientos_disponibles()
+        if not dados or game.get_board().get_fuera_de_casa(color) != 0:
+            return None
+        if 15 - len(game.get_home(color)) > self.__max_fichas__:
+            return None
+
+        pos = a_perspectiva(game.get_board().get_conteos(), 0,
+                            len(game.get_home(color)), color)
+        jugadas = generar_jugadas_perspectiva(pos, dados)
+        if not jugadas:
+            return None
+        # La clave de cada jugada trae las fichas del rival como conteos negativos:
+        # la base es de un solo lado y se consulta solo con las fichas propias
+        final = min(jugadas, key=lambda clave: self.get_tiradas_esperadas(
+            [max(cantidad, 0) for cantidad in clave[1:7]]))
+        tabla = _MOVIMIENTOS[color]
+        return tuple(tabla[origen][destino] for origen, destino, _ in jugadas[final])
+
+    def cerrar(self):
+        """Cierra el mapa de memoria y el archivo."""
+        self.__mapa__.close()
+        self.__archivo__.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def main(argumentos=None):
+    """Punto de entrada para generar la base desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Genera la base de datos de bear off")
+    parser.add_argument('--salida', default=RUTA_POR_DEFECTO)
+    parser.add_argument('--fichas', type=int, default=MAX_FICHAS)
+    args = parser.parse_args(argumentos)
+    ruta = generar_base(args.salida, args.fichas)
+    print(f"Base de bear off escrita en {ruta} ({os.path.getsize(ruta)} bytes)")
+
+
+if __name__ == '__main__':
+    main()
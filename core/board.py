@@ -1,6 +1,24 @@
 from .checker import Checker
 
 
+# Las fichas solo tienen color: al restaurar un estado se comparten
+_FICHAS = {'white': Checker('white'), 'black': Checker('black')}
+
+
+def distancia_a_salir(posicion, color):
+    """
+    Retorna cuántos pips le faltan a una ficha en un punto para salir del tablero.
+    
+    Las blancas salen por el punto 24 y las negras por el punto 1.
+    """
+    return 25 - posicion if color == 'white' else posicion
+
+
+def punto_desde_pips(pips, color):
+    """Retorna el punto (1-24) en el que a una ficha le faltan cierta cantidad de pips."""
+    return 25 - pips if color == 'white' else pips
+
+
 class Board:
     def __init__(self):
         """
@@ -22,6 +40,40 @@ class Board:
         self.__puntos__[7] = [Checker('black') for _ in range(3)]   # Punto 8: 3 fichas negras
         self.__puntos__[12] = [Checker('black') for _ in range(5)]  # Punto 13: 5 fichas negras
         self.__puntos__[23] = [Checker('black') for _ in range(2)]  # Punto 24: 2 fichas negras
+        
+        # Cantidad de fichas en la barra y fuera del tablero (las mantiene Game)
+        self.__barra__ = {'white': 0, 'black': 0}
+        self.__fuera__ = {'white': 0, 'black': 0}
+        
+        # Contadores incrementales: pips, fichas fuera de casa y ficha más lejana
+        self.__pips__ = {'white': 0, 'black': 0}
+        self.__fuera_de_casa__ = {'white': 0, 'black': 0}
+        self.__mas_lejana__ = {'white': 0, 'black': 0}
+        for posicion in range(1, 25):
+            for ficha in self.__puntos__[posicion - 1]:
+                self.__contar_ficha__(posicion, ficha.get_color(), 1)
+    
+    @classmethod
+    def desde_conteos(cls, conteos):
+        """
+        Arma un tablero a partir de conteos con signo por punto.
+        
+        Args:
+            conteos (sequence): 24 enteros; positivo = fichas blancas, negativo = negras
+            
+        Returns:
+            Board: Tablero con esas fichas (barra y fichas fuera en 0)
+        """
+        tablero = cls()
+        tablero.__puntos__ = [[] for _ in range(24)]
+        tablero.__pips__ = {'white': 0, 'black': 0}
+        tablero.__fuera_de_casa__ = {'white': 0, 'black': 0}
+        tablero.__mas_lejana__ = {'white': 0, 'black': 0}
+        for posicion, cantidad in enumerate(conteos, 1):
+            color = 'white' if cantidad > 0 else 'black'
+            for _ in range(abs(cantidad)):
+                tablero.agregar_ficha(posicion, Checker(color))
+        return tablero
     
     def get_puntos(self):
         """Retorna la lista de puntos del tablero."""
@@ -97,6 +149,7 @@ class Board:
             raise ValueError("No se pueden mezclar fichas de diferentes colores en un punto")
         
         self.__puntos__[posicion - 1].append(ficha)
+        self.__contar_ficha__(posicion, ficha.get_color(), 1)
     
     def quitar_ficha(self, posicion):
         """
@@ -110,9 +163,136 @@ class Board:
         """
         punto = self.get_punto(posicion)
         if punto:
-            return self.__puntos__[posicion - 1].pop()
+            ficha = punto.pop()
+            self.__contar_ficha__(posicion, ficha.get_color(), -1)
+            return ficha
         return None
     
+    def __contar_ficha__(self, posicion, color, cambio):
+        """Actualiza los contadores al agregar (+1) o quitar (-1) una ficha de un punto."""
+        pips = distancia_a_salir(posicion, color)
+        self.__pips__[color] += cambio * pips
+        if pips > 6:
+            self.__fuera_de_casa__[color] += cambio
+        if cambio > 0:
+            if pips > self.__mas_lejana__[color]:
+                self.__mas_lejana__[color] = pips
+        elif pips == self.__mas_lejana__[color]:
+            # Si se vació el punto más lejano, se busca el siguiente hacia casa
+            while pips > 0 and not self.__tiene_color__(punto_desde_pips(pips, color), color):
+                pips -= 1
+            self.__mas_lejana__[color] = pips
+    
+    def __tiene_color__(self, posicion, color):
+        """Verifica si un punto tiene fichas de un color."""
+        fichas = self.__puntos__[posicion - 1]
+        return bool(fichas) and fichas[0].get_color() == color
+    
+    @classmethod
+    def desde_estado(cls, estado):
+        """Crea un tablero directamente desde un estado de get_estado."""
+        tablero = cls.__new__(cls)
+        tablero.set_estado(estado)
+        return tablero
+    
+    def copiar(self):
+        """
+        Retorna un tablero independiente en la misma posición.
+        
+        Las listas de cada punto se copian y las fichas se comparten: solo tienen
+        color, igual que las que arma set_estado.
+        """
+        tablero = type(self).__new__(type(self))
+        tablero.__puntos__ = list(map(list.copy, self.__puntos__))
+        tablero.__barra__ = self.__barra__.copy()
+        tablero.__fuera__ = self.__fuera__.copy()
+        tablero.__pips__ = self.__pips__.copy()
+        tablero.__fuera_de_casa__ = self.__fuera_de_casa__.copy()
+        tablero.__mas_lejana__ = self.__mas_lejana__.copy()
+        return tablero
+    
+    def get_estado(self):
+        """
+        Retorna el estado completo del tablero como tupla plana de 34 enteros.
+        
+        Returns:
+            tuple: 24 conteos con signo, barra y fichas fuera (blancas y negras),
+                   y los contadores de pips, fuera de casa y ficha más lejana
+                   (el mismo formato que CompactBoard.get_estado)
+        """
+        return (tuple(self.get_conteos()) +
+                (self.__barra__['white'], self.__barra__['black'],
+                 self.__fuera__['white'], self.__fuera__['black'],
+                 self.__pips__['white'], self.__pips__['black'],
+                 self.__fuera_de_casa__['white'], self.__fuera_de_casa__['black'],
+                 self.__mas_lejana__['white'], self.__mas_lejana__['black']))
+    
+    def set_estado(self, estado):
+        """
+        Restaura un estado obtenido con get_estado, sin recalcular los contadores.
+        
+        Args:
+            estado (tuple): Tupla plana de 34 enteros (ver get_estado)
+        """
+        blanca, negra = _FICHAS['white'], _FICHAS['black']
+        self.__puntos__ = [[blanca] * cantidad if cantidad > 0 else [negra] * -cantidad
+                           for cantidad in estado[:24]]
+        (barra_white, barra_black, fuera_white, fuera_black, pips_white, pips_black,
+         casa_white, casa_black, lejana_white, lejana_black) = estado[24:]
+        self.__barra__ = {'white': barra_white, 'black': barra_black}
+        self.__fuera__ = {'white': fuera_white, 'black': fuera_black}
+        self.__pips__ = {'white': pips_white, 'black': pips_black}
+        self.__fuera_de_casa__ = {'white': casa_white, 'black': casa_black}
+        self.__mas_lejana__ = {'white': lejana_white, 'black': lejana_black}
+    
+    def get_conteos(self):
+        """
+        Retorna la posición como conteos con signo por punto.
+        
+        Returns:
+            list: 24 enteros; positivo = fichas blancas, negativo = fichas negras
+        """
+        conteos = []
+        for fichas in self.__puntos__:
+            if not fichas:
+                conteos.append(0)
+            elif fichas[0].get_color() == 'white':
+                conteos.append(len(fichas))
+            else:
+                conteos.append(-len(fichas))
+        return conteos
+    
+    def get_barra(self, color):
+        """Retorna la cantidad de fichas de un color en la barra."""
+        return self.__barra__[color]
+    
+    def set_barra(self, color, cantidad):
+        """Establece la cantidad de fichas de un color en la barra."""
+        cambio = cantidad - self.__barra__[color]
+        self.__barra__[color] = cantidad
+        self.__pips__[color] += 25 * cambio
+        self.__fuera_de_casa__[color] += cambio
+    
+    def get_fuera(self, color):
+        """Retorna la cantidad de fichas de un color que ya salieron del tablero."""
+        return self.__fuera__[color]
+    
+    def set_fuera(self, color, cantidad):
+        """Establece la cantidad de fichas de un color que salieron del tablero."""
+        self.__fuera__[color] = cantidad
+    
+    def get_pip_count(self, color):
+        """Retorna la cantidad de pips que le faltan a un color (incluye la barra)."""
+        return self.__pips__[color]
+    
+    def get_fuera_de_casa(self, color):
+        """Retorna cuántas fichas de un color están fuera de su casa (incluye la barra)."""
+        return self.__fuera_de_casa__[color]
+    
+    def get_mas_lejana(self, color):
+        """Retorna los pips de la ficha más lejana de un color en el tablero (0 si no hay)."""
+        return self.__mas_lejana__[color]
+    
     def __str__(self):
         """Representación en string del tablero."""
         resultado = "Tablero de Backgammon:\n"
@@ -0,0 +1,259 @@
+from array import array
+
+from .board import distancia_a_salir, punto_desde_pips
+from .checker import Checker
+
+
+# Celdas del buffer: 0-23 puntos, luego barra y fichas fuera de cada color
+BARRA_WHITE = 24
+BARRA_BLACK = 25
+FUERA_WHITE = 26
+FUERA_BLACK = 27
+CANTIDAD_CELDAS = 28
+
+# Contadores incrementales; a cada índice se le suma 1 para las negras
+PIPS = 0
+FUERA_DE_CASA = 2
+MAS_LEJANA = 4
+
+# Posición inicial como conteos con signo (positivo = blancas, negativo = negras)
+POSICION_INICIAL = (
+    2, 0, 0, 0, 0, -5, 0, -3, 0, 0, 0, 5,
+    -5, 0, 0, 0, 3, 0, 5, 0, 0, 0, 0, -2,
+    0, 0, 0, 0,
+)
+
+# Las fichas no tienen más estado que su color, así que se comparten
+_FICHAS = {'white': Checker('white'), 'black': Checker('black')}
+
+
+class CompactBoard:
+    """
+    Tablero de backgammon guardado como un único buffer de enteros con signo.
+
+    Cada punto guarda cuántas fichas tiene (positivo = blancas, negativo = negras),
+    y al final del buffer se guardan la barra y las fichas fuera de cada color.
+    Expone la misma interfaz que Board, por lo que puede usarse en Game y en las UIs.
+    """
+
+    __slots__ = ('__celdas__', '__contadores__')
+
+    def __init__(self, celdas=POSICION_INICIAL):
+        """
+        Arma el tablero a partir de los conteos de sus 28 celdas.
+
+        Args:
+            celdas (iterable): Conteos con signo; por defecto la posición inicial
+        """
+        self.__celdas__ = array('b', celdas)
+        if len(self.__celdas__) != CANTIDAD_CELDAS:
+            raise ValueError(f"El tablero compacto necesita {CANTIDAD_CELDAS} celdas")
+
+        self.__contadores__ = array('h', [0] * 6)
+        for posicion in range(1, 25):
+            cantidad = self.__celdas__[posicion - 1]
+            for _ in range(abs(cantidad)):
+                self.__contar_ficha__(posicion, 0 if cantidad > 0 else 1, 1)
+        for negras, celda in ((0, BARRA_WHITE), (1, BARRA_BLACK)):
+            self.__contadores__[PIPS + negras] += 25 * self.__celdas__[celda]
+            self.__contadores__[FUERA_DE_CASA + negras] += self.__celdas__[celda]
+
+    @classmethod
+    def desde_conteos(cls, conteos):
+        """Arma un tablero a partir de 24 conteos con signo (barra y fuera en 0)."""
+        return cls(list(conteos) + [0, 0, 0, 0])
+
+    def get_celdas(self):
+        """Retorna el buffer interno con las 28 celdas del tablero."""
+        return self.__celdas__
+
+    def get_puntos(self):
+        """Retorna la lista de puntos del tablero como listas de fichas."""
+        return [self.get_punto(i) for i in range(1, 25)]
+
+    def get_punto(self, posicion):
+        """
+        Retorna las fichas de un punto específico.
+
+        La lista se construye en cada llamada: modificarla no cambia el tablero.
+
+        Args:
+            posicion (int): Número del punto (1-24)
+
+        Returns:
+            list: Lista de objetos Checker en ese punto, o lista vacía si no hay fichas
+        """
+        if not 1 <= posicion <= 24:
+            raise ValueError("La posición debe estar entre 1 y 24")
+        cantidad = self.__celdas__[posicion - 1]
+        if cantidad > 0:
+            return [_FICHAS['white']] * cantidad
+        if cantidad < 0:
+            return [_FICHAS['black']] * -cantidad
+        return []
+
+    def tiene_fichas(self, posicion):
+        """Verifica si un punto (1-24) tiene fichas."""
+        if not 1 <= posicion <= 24:
+            raise ValueError("La posición debe estar entre 1 y 24")
+        return self.__celdas__[posicion - 1] != 0
+
+    def get_color_punto(self, posicion):
+        """Retorna el color de las fichas en un punto (1-24) o None si está vacío."""
+        if not 1 <= posicion <= 24:
+            raise ValueError("La posición debe estar entre 1 y 24")
+        cantidad = self.__celdas__[posicion - 1]
+        if cantidad > 0:
+            return 'white'
+        if cantidad < 0:
+            return 'black'
+        return None
+
+    def get_cantidad_fichas(self, posicion):
+        """Retorna la cantidad de fichas en un punto específico (1-24)."""
+        if not 1 <= posicion <= 24:
+            raise ValueError("La posición debe estar entre 1 y 24")
+        return abs(self.__celdas__[posicion - 1])
+
+    def agregar_ficha(self, posicion, ficha):
+        """
+        Agrega una ficha a un punto específico.
+
+        Args:
+            posicion (int): Número del punto (1-24)
+            ficha (Checker): Ficha a agregar
+        """
+        if not isinstance(ficha, Checker):
+            raise ValueError("Solo se pueden agregar objetos Checker")
+        if not 1 <= posicion <= 24:
+            raise ValueError("La posición debe estar entre 1 y 24")
+
+        cantidad = self.__celdas__[posicion - 1]
+        if ficha.get_color() == 'white':
+            if cantidad < 0:
+                raise ValueError("No se pueden mezclar fichas de diferentes colores en un punto")
+            self.__celdas__[posicion - 1] = cantidad + 1
+            self.__contar_ficha__(posicion, 0, 1)
+        else:
+            if cantidad > 0:
+                raise ValueError("No se pueden mezclar fichas de diferentes colores en un punto")
+            self.__celdas__[posicion - 1] = cantidad - 1
+            self.__contar_ficha__(posicion, 1, 1)
+
+    def quitar_ficha(self, posicion):
+        """
+        Quita una ficha de un punto específico.
+
+        Args:
+            posicion (int): Número del punto (1-24)
+
+        Returns:
+            Checker or None: La ficha quitada o None si el punto está vacío
+        """
+        if not 1 <= posicion <= 24:
+            raise ValueError("La posición debe estar entre 1 y 24")
+        cantidad = self.__celdas__[posicion - 1]
+        if cantidad > 0:
+            self.__celdas__[posicion - 1] = cantidad - 1
+            self.__contar_ficha__(posicion, 0, -1)
+            return _FICHAS['white']
+        if cantidad < 0:
+            self.__celdas__[posicion - 1] = cantidad + 1
+            self.__contar_ficha__(posicion, 1, -1)
+            return _FICHAS['black']
+        return None
+
+    def __contar_ficha__(self, posicion, negras, cambio):
+        """Actualiza los contadores al agregar (+1) o quitar (-1) una ficha de un punto."""
+        color = 'black' if negras else 'white'
+        contadores = self.__contadores__
+        pips = distancia_a_salir(posicion, color)
+        contadores[PIPS + negras] += cambio * pips
+        if pips > 6:
+            contadores[FUERA_DE_CASA + negras] += cambio
+        if cambio > 0:
+            if pips > contadores[MAS_LEJANA + negras]:
+                contadores[MAS_LEJANA + negras] = pips
+        elif pips == contadores[MAS_LEJANA + negras]:
+            # Si se vació el punto más lejano, se busca el siguiente hacia casa
+            signo = -1 if negras else 1
+            while pips > 0 and self.__celdas__[punto_desde_pips(pips, color) - 1] * signo <= 0:
+                pips -= 1
+            contadores[MAS_LEJANA + negras] = pips
+
+    @classmethod
+    def desde_estado(cls, estado):
+        """Crea un tablero directamente desde un estado de get_estado."""
+        tablero = cls.__new__(cls)
+        tablero.set_estado(estado)
+        return tablero
+
+    def copiar(self):
+        """Retorna un tablero independiente en la misma posición, copiando los buffers."""
+        tablero = type(self).__new__(type(self))
+        tablero.__celdas__ = self.__celdas__[:]
+        tablero.__contadores__ = self.__contadores__[:]
+        return tablero
+
+    def get_estado(self):
+        """
+        Retorna el estado completo del tablero como tupla plana de 34 enteros.
+
+        Son las 28 celdas seguidas de los 6 contadores; Board usa el mismo formato,
+        así que el estado se puede restaurar en cualquiera de los dos tableros.
+        """
+        return tuple(self.__celdas__) + tuple(self.__contadores__)
+
+    def set_estado(self, estado):
+        """Restaura un estado obtenido con get_estado, sin recalcular los contadores."""
+        self.__celdas__ = array('b', estado[:CANTIDAD_CELDAS])
+        self.__contadores__ = array('h', estado[CANTIDAD_CELDAS:])
+
+    def get_conteos(self):
+        """Retorna los conteos con signo de los 24 puntos."""
+        return self.__celdas__[:24].tolist()
+
+    def get_barra(self, color):
+        """Retorna la cantidad de fichas de un color en la barra."""
+        return self.__celdas__[BARRA_WHITE if color == 'white' else BARRA_BLACK]
+
+    def set_barra(self, color, cantidad):
+        """Establece la cantidad de fichas de un color en la barra."""
+        celda = BARRA_WHITE if color == 'white' else BARRA_BLACK
+        negras = 0 if color == 'white' else 1
+        cambio = cantidad - self.__celdas__[celda]
+        self.__celdas__[celda] = cantidad
+        self.__contadores__[PIPS + negras] += 25 * cambio
+        self.__contadores__[FUERA_DE_CASA + negras] += cambio
+
+    def get_fuera(self, color):
+        """Retorna la cantidad de fichas de un color que ya salieron del tablero."""
+        return self.__celdas__[FUERA_WHITE if color == 'white' else FUERA_BLACK]
+
+    def set_fuera(self, color, cantidad):
+        """Establece la cantidad de fichas de un color que salieron del tablero."""
+        self.__celdas__[FUERA_WHITE if color == 'white' else FUERA_BLACK] = cantidad
+
+    def get_pip_count(self, color):
+        """Retorna la cantidad de pips que le faltan a un color (incluye la barra)."""
+        return self.__contadores__[PIPS if color == 'white' else PIPS + 1]
+
+    def get_fuera_de_casa(self, color):
+        """Retorna cuántas fichas de un color están fuera de su casa (incluye la barra)."""
+        return self.__contadores__[FUERA_DE_CASA if color == 'white' else FUERA_DE_CASA + 1]
+
+    def get_mas_lejana(self, color):
+        """Retorna los pips de la ficha más lejana de un color en el tablero (0 si no hay)."""
+        return self.__contadores__[MAS_LEJANA if color == 'white' else MAS_LEJANA + 1]
+
+    def __str__(self):
+        """Representación en string del tablero."""
+        resultado = "Tablero de Backgammon:\n"
+        for i in range(24):
+            cantidad = self.__celdas__[i]
+            if cantidad:
+                color = 'white' if cantidad > 0 else 'black'
+                resultado += f"Punto {i + 1:2d}: {abs(cantidad)} fichas {color}\n"
+            else:
+                resultado += f"Punto {i + 1:2d}: vacío\n"
+        return resultado
@@ -1,15 +1,86 @@
 import random
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él los bloques se generan con random
+    np = None
+
+
+def expandir_tirada(dado1, dado2):
+    """
+    Retorna los movimientos que permite una tirada: los dos dados, o cuatro veces
+    el mismo valor si es un doble.
+    """
+    if dado1 == dado2:
+        return [dado1, dado1, dado1, dado1]
+    return [dado1, dado2]
+
+
+# Una de las 21 tiradas distintas: 'peso' es sobre 36 (1 los dobles, 2 el resto)
+Tirada = namedtuple('Tirada', ['dado1', 'dado2', 'movimientos', 'peso', 'probabilidad'])
+
+# Tabla inmutable de las 21 tiradas distintas para los nodos de azar de los evaluadores
+TIRADAS = tuple(
+    Tirada(dado1, dado2, tuple(expandir_tirada(dado1, dado2)),
+           1 if dado1 == dado2 else 2, (1 if dado1 == dado2 else 2) / 36)
+    for dado1 in range(1, 7)
+    for dado2 in range(1, dado1 + 1)
+)
 
 
 class Dice:
-    def __init__(self):
+    def __init__(self, rng=None, semilla=None, bloque=0):
         """
         Inician los dados del backgammon
         En backgammon se usan dos dados de 6 caras
+        
+        Args:
+            rng (random.Random, optional): Generador a usar; por defecto el módulo random
+            semilla (int, optional): Si no se pasa rng, crea uno propio con esta semilla
+                para que la secuencia de tiradas sea reproducible
+            bloque (int): Si es mayor a 0, se sortean de a 'bloque' tiradas por vez
+                (con NumPy si está instalado) y se entregan desde un buffer
         """
+        # Solo con una semilla entera y un generador propio se pueden reconstruir los dados
+        self.__semilla__ = semilla if rng is None and isinstance(semilla, int) else None
+        self.__tiradas__ = 0
+        if rng is None:
+            rng = random.Random(semilla) if semilla is not None else random
+        if bloque < 0:
+            raise ValueError("El tamaño de bloque no puede ser negativo")
+        self.__rng__ = rng
+        self.__bloque__ = bloque
+        self.__buffer__ = []
+        self.__indice__ = 0
+        self.__np_rng__ = None
+        if bloque and np is not None:
+            # El generador de NumPy se siembra desde el rng para seguir siendo reproducible
+            self.__np_rng__ = np.random.default_rng(rng.getrandbits(64))
         self.__dado1__ = None
         self.__dado2__ = None
     
+    def __siguiente_par__(self):
+        """Retorna el próximo par de valores, del buffer o del generador."""
+        if not self.__bloque__:
+            return self.__rng__.randint(1, 6), self.__rng__.randint(1, 6)
+        
+        if self.__indice__ >= len(self.__buffer__):
+            self.__rellenar_buffer__()
+        par = self.__buffer__[self.__indice__]
+        self.__indice__ += 1
+        return par
+    
+    def __rellenar_buffer__(self):
+        """Sortea un bloque completo de tiradas de una sola vez."""
+        if self.__np_rng__ is not None:
+            self.__buffer__ = [tuple(par) for par in
+                               self.__np_rng__.integers(1, 7, size=(self.__bloque__, 2)).tolist()]
+        else:
+            randint = self.__rng__.randint
+            self.__buffer__ = [(randint(1, 6), randint(1, 6)) for _ in range(self.__bloque__)]
+        self.__indice__ = 0
+    
     def tirar(self):
         """
         Tira los dos dados y devuelve una lista con los valores.
@@ -20,15 +91,59 @@ class Dice:
             list: Lista con los valores de los dados. Si hay dobles, 
                   retorna 4 elementos iguales.
         """
-        self.__dado1__ = random.randint(1, 6)
-        self.__dado2__ = random.randint(1, 6)
+        self.__dado1__, self.__dado2__ = self.__siguiente_par__()
+        self.__tiradas__ += 1
         
         # Si ambos dados son iguales (dobles), se repite el valor 4 veces
-        if self.__dado1__ == self.__dado2__:
-            return [self.__dado1__, self.__dado1__, self.__dado1__, self.__dado1__]
-        else:
-            return [self.__dado1__, self.__dado2__]
+        return expandir_tirada(self.__dado1__, self.__dado2__)
     
+    def derivar_semilla(self):
+        """
+        Retorna una semilla de 64 bits sacada del generador de estos dados.
+
+        Sirve para seguir con dados nuevos cuando estos no se pueden reconstruir
+        con get_estado. Como consume del generador, después de llamarla estos
+        dados tampoco se pueden reconstruir.
+        """
+        self.__semilla__ = None
+        return self.__rng__.getrandbits(64)
+
+    def get_estado(self):
+        """
+        Retorna lo necesario para reconstruir estos dados exactamente.
+
+        Los dados se vuelven a crear con la misma semilla y se descartan las
+        tiradas ya hechas, así que la secuencia sigue igual que si no se
+        hubieran reconstruido.
+
+        Returns:
+            tuple or None: (semilla, bloque, tiradas hechas, dado1, dado2), o None si
+                           los dados no se crearon con una semilla entera propia
+        """
+        if self.__semilla__ is None:
+            return None
+        return (self.__semilla__, self.__bloque__, self.__tiradas__,
+                self.__dado1__, self.__dado2__)
+
+    @classmethod
+    def desde_estado(cls, estado):
+        """
+        Crea dados en el estado retornado por get_estado().
+
+        Args:
+            estado (tuple): (semilla, bloque, tiradas hechas, dado1, dado2)
+
+        Returns:
+            Dice: Dados que siguen la misma secuencia desde el mismo punto
+        """
+        semilla, bloque, tiradas, dado1, dado2 = estado
+        dados = cls(semilla=semilla, bloque=bloque)
+        for _ in range(tiradas):
+            dados.__siguiente_par__()
+        dados.__tiradas__ = tiradas
+        dados.__dado1__, dados.__dado2__ = dado1, dado2
+        return dados
+
     def get_dado1(self):
         """Retorna el valor del primer dado."""
         return self.__dado1__
@@ -0,0 +1,196 @@
+"""
+Cache LRU de evaluaciones de posiciones.
+
+Envuelve cualquier evaluador de posiciones con una cache acotada por cantidad
+de entradas o por bytes aproximados. Las claves son la posición en perspectiva
+del jugador empaquetada en bytes, más el color que recibe el evaluador: como
+ExpectiminimaxBot siempre pasa el color, por defecto las blancas y las negras no
+comparten entradas. Con un evaluador que no usa el color (evaluar_heuristica),
+con_color=False lo deja fuera de la clave y la misma posición en perspectiva se
+comparte entre ambos colores. La clave también dice quién tiene el turno: el
+evaluador de posiciones recibe la posición del jugador que acaba de mover y
+evaluar_juego la del jugador que tiene el turno, así que los mismos bytes de
+posición son posiciones distintas en cada caso.
+
+Ejemplo:
+    cache = EvaluationCache(evaluar_heuristica, max_entradas=50_000, con_color=False)
+    bot = ExpectiminimaxBot(2, evaluador=cache)
+    ...
+    cache.get_estadisticas()['tasa_aciertos']
+"""
+import sys
+from array import array
+from collections import OrderedDict
+
+from .move_generator import a_perspectiva
+
+# Memoria aproximada de cada nodo del OrderedDict, además de la clave y el valor
+_COSTO_ENTRADA = 100
+
+# Byte final de la clave: color del dueño de la perspectiva y si tiene el turno
+_COLORES = {None: 0, 'white': 1, 'black': 2}
+_AL_TURNO = 4
+
+
+def clave_canonica(pos, fuera_rival, color=None, al_turno=False):
+    """
+    Retorna la clave canónica de una posición en perspectiva.
+
+    Args:
+        pos (sequence): Posición de 26 enteros (ver core.move_generator)
+        fuera_rival (int): Fichas que el rival ya sacó
+        color (str or None): Color del dueño de la perspectiva, si el evaluador
+            lo usa; None para compartir la clave entre ambos colores
+        al_turno (bool): True si el dueño de la perspectiva tiene el turno, False
+            si acaba de mover (la perspectiva de los evaluadores de posiciones)
+
+    Returns:
+        bytes: 28 bytes con los conteos, las fichas fuera del rival y un byte
+               con el color y el turno
+    """
+    clave = array('b', pos)
+    clave.append(fuera_rival)
+    clave.append(_COLORES[color] | (_AL_TURNO if al_turno else 0))
+    return clave.tobytes()
+
+
+def clave_juego(game, con_color=False):
+    """
+    Retorna la clave canónica de la posición de un juego para el jugador con turno.
+
+    Args:
+        game (Game): Juego iniciado
+        con_color (bool): Si la clave distingue el color del jugador con turno
+    """
+    color = game.get_jugador_actual().get_color()
+    rival = 'black' if color == 'white' else 'white'
+    pos = a_perspectiva(game.get_board().get_conteos(), len(game.get_bar(color)),
+                        len(game.get_home(color)), color)
+    return clave_canonica(pos, len(game.get_home(rival)), color if con_color else None,
+                          al_turno=True)
+
+
+class EvaluationCache:
+    """
+    Cache LRU con límite de entradas y/o de bytes para un evaluador de posiciones.
+
+    Se puede llamar como el evaluador que envuelve, (pos, fuera_rival, color) ->
+    valor, por lo que sirve directamente como evaluador de ExpectiminimaxBot.
+    """
+
+    def __init__(self, evaluador=None, max_entradas=100_000, max_bytes=None, con_color=True):
+        """
+        Args:
+            evaluador (callable or None): (pos, fuera_rival, color) -> valor; solo
+                hace falta para llamar a la cache como evaluador
+            max_entradas (int or None): Máximo de posiciones guardadas
+            max_bytes (int or None): Máximo de memoria aproximada en bytes
+            con_color (bool): Si la clave de __call__ incluye el color; False solo
+                para evaluadores que no lo usan, así ambos colores comparten entradas
+        """
+        if max_entradas is None and max_bytes is None:
+            raise ValueError("La cache necesita un límite de entradas o de bytes")
+        if (max_entradas is not None and max_entradas < 1) or \
+                (max_bytes is not None and max_bytes < 1):
+            raise ValueError("Los límites de la cache deben ser positivos")
+        self.__evaluador__ = evaluador
+        self.__max_entradas__ = max_entradas
+        self.__max_bytes__ = max_bytes
+        self.__con_color__ = con_color
+        self.__entradas__ = OrderedDict()
+        self.__bytes__ = 0
+        self.__aciertos__ = 0
+        self.__fallos__ = 0
+        self.__desalojos__ = 0
+
+    def __call__(self, pos, fuera_rival, color=None):
+        """Evalúa una posición usando la cache; el color siempre se pasa al evaluador."""
+        return self.obtener(clave_canonica(pos, fuera_rival,
+                                           color if self.__con_color__ else None),
+                            lambda: self.__evaluador__(pos, fuera_rival, color))
+
+    def evaluar_juego(self, game, evaluar, con_color=False):
+        """
+        Evalúa la posición de un juego usando la cache.
+
+        Las claves se guardan con el jugador con turno como dueño de la
+        perspectiva, separadas de las de __call__ aunque la posición coincida.
+
+        Args:
+            game (Game): Juego cuya posición se evalúa
+            evaluar (callable): game -> valor; solo se llama si la posición no está
+            con_color (bool): Si el valor depende del color del jugador con turno
+
+        Returns:
+            object: Valor guardado o recién calculado
+        """
+        return self.obtener(clave_juego(game, con_color), lambda: evaluar(game))
+
+    def obtener(self, clave, calcular):
+        """
+        Retorna el valor de una clave, calculándolo y guardándolo si no está.
+
+        Args:
+            clave (hashable): Clave canónica de la posición
+            calcular (callable): Función sin argumentos que calcula el valor
+
+        Returns:
+            object: Valor guardado o recién calculado
+        """
+        entradas = self.__entradas__
+        if clave in entradas:
+            entradas.move_to_end(clave)
+            self.__aciertos__ += 1
+            return entradas[clave]
+
+        self.__fallos__ += 1
+        valor = calcular()
+        entradas[clave] = valor
+        self.__bytes__ += self.__tamano__(clave, valor)
+        self.__recortar__()
+        return valor
+
+    def __tamano__(self, clave, valor):
+        """Memoria aproximada de una entrada."""
+        return sys.getsizeof(clave) + sys.getsizeof(valor) + _COSTO_ENTRADA
+
+    def __recortar__(self):
+        """Desaloja las entradas usadas hace más tiempo hasta respetar los límites."""
+        entradas = self.__entradas__
+        while entradas and (
+                (self.__max_entradas__ is not None and len(entradas) > self.__max_entradas__) or
+                (self.__max_bytes__ is not None and self.__bytes__ > self.__max_bytes__)):
+            clave, valor = entradas.popitem(last=False)
+            self.__bytes__ -= self.__tamano__(clave, valor)
+            self.__desalojos__ += 1
+
+    def __contains__(self, clave):
+        return clave in self.__entradas__
+
+    def __len__(self):
+        return len(self.__entradas__)
+
+    def limpiar(self):
+        """Vacía la cache y reinicia los contadores."""
+        self.__entradas__.clear()
+        self.__bytes__ = 0
+        self.__aciertos__ = 0
+        self.__fallos__ = 0
+        self.__desalojos__ = 0
+
+    def get_estadisticas(self):
+        """
+        Retorna los contadores de uso de la cache.
+
+        Returns:
+            dict: entradas, bytes, aciertos, fallos, desalojos y tasa_aciertos
+        """
+        consultas = self.__aciertos__ + self.__fallos__
+        return {
+            'entradas': len(self.__entradas__),
+            'bytes': self.__bytes__,
+            'aciertos': self.__aciertos__,
+            'fallos': self.__fallos__,
+            'desalojos': self.__desalojos__,
+            'tasa_aciertos': self.__aciertos__ / consultas if consultas else 0.0,
+        }
@@ -0,0 +1,280 @@
+"""
+Bot de backgammon con búsqueda expectiminimax.
+
+La búsqueda trabaja sobre posiciones en perspectiva (ver core.move_generator):
+después de cada jugada la posición se da vuelta para el rival, cuyas fichas
+en la barra se deducen de las que tiene en el tablero y las que ya sacó.
+
+- Profundidad 0: cada jugada se juzga con la evaluación estática.
+- Profundidad 1: se promedia sobre las 21 tiradas del rival, que responde
+  con su mejor jugada según la evaluación estática.
+- Profundidad 2: además se promedia sobre la tirada siguiente propia.
+
+En la raíz se buscan todas las jugadas (salvo que se pida podarla con
+`ancho_raiz`); en los nodos de decisión internos solo se expanden las `ancho`
+jugadas mejor evaluadas estáticamente, y los valores ya calculados se guardan
+en una tabla de transposición LRU acotada, indexada por la clave Zobrist de la
+posición (la misma de Game.get_hash) y la profundidad.
+
+Con `limite_segundos` la búsqueda se profundiza de a una tirada (0, 1, 2) y
+cada pasada recorre primero las mejores jugadas de la anterior; si se acaba el
+tiempo, se elige entre las jugadas que la última pasada llegó a evaluar.
+"""
+import time
+from collections import OrderedDict
+from math import tanh
+
+from .dice import TIRADAS
+from .move_generator import _MOVIMIENTOS, a_perspectiva, generar_jugadas_perspectiva
+from .zobrist import clave_perspectiva
+
+FICHAS = 15
+
+# Segundos por jugada del bot cuando juega contra una persona (la meta es menos de 1 s)
+LIMITE_SEGUNDOS_INTERACTIVO = 0.8
+
+
+class _TiempoAgotado(Exception):
+    """Corta una pasada de la búsqueda cuando se pasa el límite de tiempo."""
+
+
+def dar_vuelta(pos, fuera_rival):
+    """
+    Retorna la posición vista por el rival.
+
+    Args:
+        pos (sequence): Posición en perspectiva del jugador que acaba de mover
+        fuera_rival (int): Fichas que el rival ya sacó
+
+    Returns:
+        list: Posición en perspectiva del rival (su barra se deduce del resto)
+    """
+    vuelta = [fuera_rival] + [-pos[25 - i] for i in range(1, 25)] + [0]
+    en_tablero = sum(c for c in vuelta[1:25] if c > 0)
+    vuelta[25] = FICHAS - fuera_rival - en_tablero
+    return vuelta
+
+
+def evaluar_heuristica(pos, fuera_rival, color=None):
+    """
+    Evaluación estática de una posición para el jugador que acaba de mover.
+
+    Combina la ventaja de pips, las fichas sueltas al alcance del rival, los
+    puntos hechos en casa y las fichas en la barra. En una carrera solo cuenta
+    la ventaja de pips, descontando que el rival tira primero.
+
+    Args:
+        pos (sequence): Posición en perspectiva del jugador que acaba de mover
+        fuera_rival (int): Fichas que el rival ya sacó
+        color (str or None): Color del jugador que acaba de mover; la heurística
+            no depende de él
+
+    Returns:
+        float: Equity estimada entre -1 y 1
+    """
+    mis_pips = 25 * pos[25]
+    rival_pips = 0
+    rival_en_tablero = 0
+    mi_mas_lejana = 25 if pos[25] else 0
+    rival_mas_cercana = 25
+    sueltas = []
+    puntos_casa = 0
+    for i, c in enumerate(pos[1:25], 1):
+        if c > 0:
+            mis_pips += i * c
+            mi_mas_lejana = i
+            if c == 1:
+                sueltas.append(i)
+            elif i <= 6:
+                puntos_casa += 1
+        elif c < 0:
+            rival_pips += (25 - i) * -c
+            rival_en_tablero -= c
+            if rival_mas_cercana == 25:
+                rival_mas_cercana = i
+    rival_barra = FICHAS - fuera_rival - rival_en_tablero
+    rival_pips += 25 * rival_barra
+    if rival_barra:
+        rival_mas_cercana = 0
+
+    if mi_mas_lejana <= rival_mas_cercana:
+        # Carrera: el rival tira primero, lo que vale unos 4 pips
+        diferencia = rival_pips - mis_pips - 4
+        return tanh(diferencia / (4 + 0.05 * (mis_pips + rival_pips)))
+
+    valor = 0.02 * (rival_pips - mis_pips) + 0.1 * puntos_casa
+    for i in sueltas:
+        if i > rival_mas_cercana:
+            # Ficha suelta que alguna ficha rival puede alcanzar
+            valor -= 0.12 if i > 6 else 0.2
+    valor += 0.15 * rival_barra - 0.15 * pos[25]
+    return tanh(valor)
+
+
+class ExpectiminimaxBot:
+    """
+    Elige jugadas con una búsqueda expectiminimax de profundidad 0, 1 o 2.
+
+    La equity se expresa en puntos para el jugador que mueve: 1 por ganar,
+    2 por ganar con gammon (negativo si pierde).
+    """
+
+    def __init__(self, profundidad=1, ancho=2, evaluador=evaluar_heuristica,
+                 capacidad_tabla=200_000, ancho_raiz=None, limite_segundos=None):
+        """
+        Args:
+            profundidad (int): Tiradas futuras que se promedian (0, 1 o 2)
+            ancho (int): Jugadas que se expanden en cada nodo de decisión interno
+            evaluador (callable): (pos, fuera_rival, color) -> equity del que acaba
+                de mover, con el color de ese jugador
+            capacidad_tabla (int): Máximo de entradas en la tabla de transposición
+            ancho_raiz (int or None): Si se indica, en la raíz solo se buscan las
+                `ancho_raiz` jugadas mejor evaluadas estáticamente (más rápido,
+                pero la búsqueda no puede elegir una jugada que la evaluación
+                estática descarta); None busca todas
+            limite_segundos (float or None): Tiempo máximo por jugada; si se indica,
+                la búsqueda se profundiza de a una tirada hasta 'profundidad' y se
+                queda con la última pasada que alcanzó a evaluar alguna jugada
+        """
+        if profundidad not in (0, 1, 2):
+            raise ValueError("La profundidad debe ser 0, 1 o 2")
+        if ancho < 1 or (ancho_raiz is not None and ancho_raiz < 1):
+            raise ValueError("El ancho debe ser al menos 1")
+        if capacidad_tabla < 1:
+            raise ValueError("La capacidad de la tabla debe ser positiva")
+        if limite_segundos is not None and limite_segundos <= 0:
+            raise ValueError("El límite de tiempo debe ser positivo")
+        self.__profundidad__ = profundidad
+        self.__ancho__ = ancho
+        self.__ancho_raiz__ = ancho_raiz
+        self.__evaluador__ = evaluador
+        self.__capacidad_tabla__ = capacidad_tabla
+        self.__tabla__ = OrderedDict()
+        self.__limite_segundos__ = limite_segundos
+        self.__fin__ = None
+
+    def get_profundidad(self):
+        """Retorna la profundidad de búsqueda."""
+        return self.__profundidad__
+
+    def get_tamano_tabla(self):
+        """Retorna cuántas posiciones hay guardadas en la tabla de transposición."""
+        return len(self.__tabla__)
+
+    def limpiar_tabla(self):
+        """Vacía la tabla de transposición."""
+        self.__tabla__.clear()
+
+    def elegir_jugada(self, game):
+        """
+        Busca la mejor jugada para los dados disponibles del jugador actual.
+
+        Args:
+            game (Game): Juego con los dados ya tirados (no se modifica)
+
+        Returns:
+            tuple: (jugada, equity) con la jugada como tupla de movimientos
+                   (desde, hasta) para Game.aplicar; (None, None) si no hay
+                   jugadas posibles
+        """
+        color = game.get_jugador_actual().get_color()
+        rival = 'black' if color == 'white' else 'white'
+        pos = a_perspectiva(game.get_board().get_conteos(), len(game.get_bar(color)),
+                            len(game.get_home(color)), color)
+        jugadas = generar_jugadas_perspectiva(pos, game.get_movimientos_disponibles())
+        if not jugadas:
+            return None, None
+
+        fuera_rival = len(game.get_home(rival))
+        candidatas = list(jugadas)
+        if self.__ancho_raiz__ is not None:
+            candidatas = self.__filtrar__(candidatas, fuera_rival, self.__profundidad__,
+                                          self.__ancho_raiz__, color)
+        if self.__limite_segundos__ is None:
+            valor, final = max(
+                (self.__valor__(final, fuera_rival, self.__profundidad__, color), final)
+                for final in candidatas
+            )
+        else:
+            valor, final = self.__profundizar__(candidatas, fuera_rival, color)
+        tabla = _MOVIMIENTOS[color]
+        jugada = tuple(tabla[origen][destino] for origen, destino, _ in jugadas[final])
+        return jugada, valor
+
+    def __profundizar__(self, candidatas, fuera_rival, color):
+        """
+        Busca a profundidades crecientes hasta completar la pedida o agotar el tiempo.
+
+        Returns:
+            tuple: (valor, final) de la mejor jugada de la pasada más profunda
+        """
+        self.__fin__ = time.perf_counter() + self.__limite_segundos__
+        try:
+            mejor = None
+            for profundidad in range(self.__profundidad__ + 1):
+                valores = []
+                try:
+                    for final in candidatas:
+                        valores.append((self.__valor__(final, fuera_rival, profundidad, color),
+                                        final))
+                except _TiempoAgotado:
+                    # La pasada empezó por la mejor jugada de la anterior: se
+                    # comparan solo las que alcanzó a evaluar
+                    if valores:
+                        mejor = max(valores)
+                    break
+                mejor = max(valores)
+                candidatas = [final for _, final in sorted(valores, reverse=True)]
+            return mejor
+        finally:
+            self.__fin__ = None
+
+    def __filtrar__(self, finales, fuera_rival, profundidad, ancho, color):
+        """Deja las `ancho` jugadas mejor evaluadas si todavía queda búsqueda por hacer."""
+        if profundidad == 0 or len(finales) <= ancho:
+            return finales
+        finales = sorted(finales, key=lambda final: self.__valor__(final, fuera_rival, 0, color),
+                         reverse=True)
+        return finales[:ancho]
+
+    def __valor__(self, pos, fuera_rival, profundidad, color):
+        """
+        Equity de una posición para el jugador que acaba de mover, con el rival por tirar.
+
+        El color es el del jugador que acaba de mover: se pasa al evaluador y
+        forma parte de la clave Zobrist de la tabla de transposición.
+        """
+        if pos[0] == FICHAS:
+            return 1.0 if fuera_rival else 2.0
+        if profundidad == 0:
+            return self.__evaluador__(pos, fuera_rival, color)
+
+        if self.__fin__ is not None and time.perf_counter() > self.__fin__:
+            raise _TiempoAgotado()
+        tabla = self.__tabla__
+        clave = (clave_perspectiva(pos, fuera_rival, color), profundidad)
+        valor = tabla.get(clave)
+        if valor is not None:
+            tabla.move_to_end(clave)
+            return valor
+
+        rival = 'black' if color == 'white' else 'white'
+        vuelta = dar_vuelta(pos, fuera_rival)
+        mis_fuera = pos[0]
+        total = 0.0
+        for tirada in TIRADAS:
+            respuestas = generar_jugadas_perspectiva(vuelta, tirada.movimientos)
+            if not respuestas:
+                # El rival no puede mover: la posición queda igual con el turno propio
+                mejor = self.__valor__(tuple(vuelta), mis_fuera, profundidad - 1, rival)
+            else:
+                mejor = max(self.__valor__(final, mis_fuera, profundidad - 1, rival)
+                            for final in self.__filtrar__(list(respuestas), mis_fuera,
+                                                          profundidad - 1, self.__ancho__, rival))
+            total -= tirada.probabilidad * mejor
+
+        tabla[clave] = total
+        if len(tabla) > self.__capacidad_tabla__:
+            # Se descarta la entrada usada hace más tiempo
+            tabla.popitem(last=False)
+        return total
@@ -1,11 +1,48 @@
-from .board import Board
+import time
+
+from .board import Board, distancia_a_salir
+from .checker import Checker
 from .player import Player
 from .dice import Dice
+from .move_generator import generar_jugadas, jugada_aleatoria
+from . import position_id, zobrist
+
+
+# Las fichas solo tienen color: las de la barra y las de afuera se comparten al restaurar
+_FICHAS = {'white': Checker('white'), 'black': Checker('black')}
+
+# Una instantánea es el estado plano del tablero (34 enteros, ver Board.get_estado)
+# seguido de turno, clave Zobrist, última tirada y dados disponibles
+_LARGO_TABLERO = 34
+_BARRA_WHITE, _BARRA_BLACK, _FUERA_WHITE, _FUERA_BLACK = 24, 25, 26, 27
+
+# Métodos públicos que se miden con Game(instrumentar=True)
+_METODOS_INSTRUMENTADOS = (
+    'tirar_dados', 'hacer_movimiento', 'aplicar', 'deshacer', 'es_movimiento_valido',
+    'tiene_movimientos_disponibles', 'generar_jugadas', 'cambiar_turno', 'esta_terminado',
+    'get_estado_juego', 'snapshot', 'restaurar',
+)
+TIPOS_MOVIMIENTO = ('entrada_barra', 'bear_off', 'captura', 'normal')
 
 
 class Game:
-    def __init__(self):
-        """Inicializa una nueva partida de Backgammon."""
+    def __init__(self, clase_tablero=Board, verificar_hash=False, instrumentar=False):
+        """
+        Inicializa una nueva partida de Backgammon.
+        
+        Args:
+            clase_tablero (type): Implementación del tablero (Board o CompactBoard)
+            verificar_hash (bool): Modo depuración: compara la clave Zobrist
+                incremental con un recálculo completo después de cada cambio
+            instrumentar (bool): Cuenta llamadas y tiempo por método público y por
+                tipo de movimiento (ver get_metricas)
+        """
+        self.__clase_tablero__ = clase_tablero
+        self.__verificar_hash__ = verificar_hash
+        self.__metricas__ = None
+        if instrumentar:
+            self.__instrumentar__()
+        self.__clave_zobrist__ = 0
         self.__board__ = None
         self.__players__ = []
         self.__dice__ = None
@@ -14,24 +51,158 @@ class Game:
         self.__movimientos_disponibles__ = []
         self.__bar__ = {'white': [], 'black': []}  # Fichas capturadas
         self.__home__ = {'white': [], 'black': []}  # Fichas que salieron
+        self.__pila_deshacer__ = []  # Registros de las jugadas del turno actual
     
-    def iniciar_juego(self, nombre_jugador1="Jugador 1", nombre_jugador2="Jugador 2"):
-        """Prepara e inicializa todos los componentes del juego."""
-        self.__board__ = Board()
+    def iniciar_juego(self, nombre_jugador1="Jugador 1", nombre_jugador2="Jugador 2", dados=None):
+        """
+        Prepara e inicializa todos los componentes del juego.
+        
+        Args:
+            dados (Dice, optional): Dados a usar. Con Dice(semilla=...) toda la partida,
+                incluido el primer turno, se puede repetir exactamente
+        """
+        self.__board__ = self.__clase_tablero__()
         self.__players__ = [Player(nombre_jugador1, "white"), Player(nombre_jugador2, "black")]
-        self.__dice__ = Dice()
+        self.__dice__ = dados if dados is not None else Dice()
         self.__determinar_primer_turno__()
         self.__ultimo_roll__ = None
         self.__movimientos_disponibles__ = []
         self.__bar__ = {'white': [], 'black': []}
         self.__home__ = {'white': [], 'black': []}
+        self.__pila_deshacer__ = []
+        self.__clave_zobrist__ = self.__calcular_hash__()
+    
+    @classmethod
+    def desde_posicion_id(cls, identificador, nombre_jugador1="Jugador 1",
+                          nombre_jugador2="Jugador 2", dados=None, clase_tablero=Board,
+                          verificar_hash=False, instrumentar=False):
+        """
+        Crea un juego directamente en una posición, sin pasar por iniciar_juego.
+        
+        Args:
+            identificador (bytes or str): Identificador de core.position_id, en
+                bytes o en texto base64
+            dados (Dice, optional): Dados a usar; por defecto unos nuevos
+            
+        Returns:
+            Game: Juego en esa posición, con el turno indicado y sin dados tirados
+        """
+        if isinstance(identificador, str):
+            identificador = position_id.desde_texto(identificador)
+        conteos, barra, fuera, color_turno = position_id.decodificar(identificador)
+        
+        game = cls(clase_tablero, verificar_hash, instrumentar)
+        game.__board__ = clase_tablero.desde_conteos(conteos)
+        game.__players__ = [Player(nombre_jugador1, "white"), Player(nombre_jugador2, "black")]
+        game.__dice__ = dados if dados is not None else Dice()
+        game.__turno__ = 0 if color_turno == 'white' else 1
+        for color in ('white', 'black'):
+            game.__bar__[color] = [Checker(color) for _ in range(barra[color])]
+            game.__home__[color] = [Checker(color) for _ in range(fuera[color])]
+            game.__board__.set_barra(color, barra[color])
+            game.__board__.set_fuera(color, fuera[color])
+        game.__clave_zobrist__ = game.__calcular_hash__()
+        return game
+    
+    def get_posicion_id(self, como_texto=True):
+        """
+        Retorna el identificador canónico de la posición y el turno.
+        
+        Args:
+            como_texto (bool): Texto base64 de 15 caracteres o los 11 bytes
+            
+        Returns:
+            str or bytes: Identificador de la posición (ver core.position_id)
+        """
+        identificador = position_id.codificar(
+            self.__board__.get_conteos(), len(self.__bar__['white']),
+            len(self.__bar__['black']), self.get_jugador_actual().get_color())
+        return position_id.a_texto(identificador) if como_texto else identificador
+    
+    def snapshot(self):
+        """
+        Retorna una instantánea inmutable de la posición, el turno y los dados.
+        
+        Es una tupla plana de enteros (más la última tirada y los dados
+        disponibles como tuplas): no copia fichas, jugadores ni dados, por lo que
+        es mucho más barata que copy.deepcopy. La pila de deshacer no se guarda.
+        
+        Returns:
+            tuple: Instantánea para restaurar o clonar
+        """
+        ultimo_roll = tuple(self.__ultimo_roll__) if self.__ultimo_roll__ is not None else None
+        return self.__board__.get_estado() + (
+            self.__turno__, self.__clave_zobrist__, ultimo_roll,
+            tuple(self.__movimientos_disponibles__))
+    
+    def restaurar(self, snapshot):
+        """
+        Vuelve el juego a una instantánea tomada con snapshot().
+        
+        Los jugadores y los dados no cambian, y la pila de deshacer se vacía.
+        
+        Args:
+            snapshot (tuple): Instantánea de este juego o de otro con los mismos jugadores
+        """
+        estado = snapshot[:_LARGO_TABLERO]
+        if self.__board__ is None:
+            self.__board__ = self.__clase_tablero__.desde_estado(estado)
+        else:
+            self.__board__.set_estado(estado)
+        blanca, negra = _FICHAS['white'], _FICHAS['black']
+        self.__bar__ = {'white': [blanca] * estado[_BARRA_WHITE],
+                        'black': [negra] * estado[_BARRA_BLACK]}
+        self.__home__ = {'white': [blanca] * estado[_FUERA_WHITE],
+                         'black': [negra] * estado[_FUERA_BLACK]}
+        self.__turno__, self.__clave_zobrist__, ultimo_roll, movimientos = snapshot[_LARGO_TABLERO:]
+        self.__ultimo_roll__ = list(ultimo_roll) if ultimo_roll is not None else None
+        self.__movimientos_disponibles__ = list(movimientos)
+        self.__pila_deshacer__ = []
+        if self.__verificar_hash__:
+            self.__comprobar_hash__()
+    
+    def clonar(self, dados=None):
+        """
+        Crea una copia independiente del juego para análisis.
+        
+        El tablero, la barra, las fichas fuera, el turno y los dados disponibles se
+        copian; los jugadores se comparten porque el juego no los modifica.
+        
+        Args:
+            dados (Dice, optional): Dados de la copia; por defecto comparte los de
+                este juego, así que tirar en la copia avanza la misma secuencia
+                
+        Returns:
+            Game: Copia en la misma posición, con la pila de deshacer vacía
+        """
+        # Sin pasar por __init__ ni por la instantánea: el tablero se copia solo
+        copia = type(self).__new__(type(self))
+        copia.__clase_tablero__ = self.__clase_tablero__
+        copia.__verificar_hash__ = self.__verificar_hash__
+        copia.__metricas__ = None
+        if self.__metricas__ is not None:
+            copia.__instrumentar__()
+        copia.__clave_zobrist__ = self.__clave_zobrist__
+        copia.__board__ = self.__board__.copiar()
+        copia.__players__ = self.__players__
+        copia.__dice__ = dados if dados is not None else self.__dice__
+        copia.__turno__ = self.__turno__
+        copia.__ultimo_roll__ = (self.__ultimo_roll__[:]
+                                 if self.__ultimo_roll__ is not None else None)
+        copia.__movimientos_disponibles__ = self.__movimientos_disponibles__[:]
+        copia.__bar__ = {'white': self.__bar__['white'][:], 'black': self.__bar__['black'][:]}
+        copia.__home__ = {'white': self.__home__['white'][:], 'black': self.__home__['black'][:]}
+        copia.__pila_deshacer__ = []
+        return copia
     
     def __determinar_primer_turno__(self):
         """Determina qué jugador comienza la partida."""
+        # Cada jugador tira un dado: se usa una tirada del mismo flujo de los dados
         while True:
-            dados = [self.__dice__.tirar()[0] for _ in range(2)]
-            if dados[0] != dados[1]:
-                self.__turno__ = 0 if dados[0] > dados[1] else 1
+            self.__dice__.tirar()
+            dado_white, dado_black = self.__dice__.get_valores()
+            if dado_white != dado_black:
+                self.__turno__ = 0 if dado_white > dado_black else 1
                 break
     
     # Getters simplificados
@@ -49,11 +220,16 @@ class Game:
         self.__turno__ = 1 - self.__turno__
         self.__ultimo_roll__ = None
         self.__movimientos_disponibles__ = []
+        self.__pila_deshacer__ = []
+        self.__clave_zobrist__ ^= zobrist.TURNO_BLACK
+        if self.__verificar_hash__:
+            self.__comprobar_hash__()
     
     def tirar_dados(self):
         """Tira los dados y actualiza los movimientos disponibles."""
         self.__ultimo_roll__ = self.__dice__.tirar()
         self.__movimientos_disponibles__ = self.__ultimo_roll__.copy()
+        self.__pila_deshacer__ = []
         return self.__ultimo_roll__
     
     def hacer_movimiento(self, desde, hasta):
@@ -70,19 +246,66 @@ class Game:
         if not self.es_movimiento_valido(desde, hasta):
             return False
         
+        self.__pila_deshacer__.append((self.__ejecutar_movimiento__(desde, hasta),))
+        return True
+    
+    def aplicar(self, jugada):
+        """
+        Aplica una jugada completa y la guarda para poder deshacerla.
+        
+        Args:
+            jugada (tuple): Movimientos (desde, hasta), como los de generar_jugadas
+            
+        Returns:
+            bool: True si se aplicó; False si algún movimiento no era válido,
+                  en cuyo caso el juego queda como estaba
+        """
+        registros = []
+        for desde, hasta in jugada:
+            if not self.es_movimiento_valido(desde, hasta):
+                for registro in reversed(registros):
+                    self.__revertir_movimiento__(registro)
+                return False
+            registros.append(self.__ejecutar_movimiento__(desde, hasta))
+        self.__pila_deshacer__.append(tuple(registros))
+        return True
+    
+    def deshacer(self):
+        """
+        Deshace la última jugada aplicada (con aplicar o hacer_movimiento).
+        
+        Restaura el tablero, la barra, las fichas fuera y los dados disponibles.
+        La pila se vacía al tirar los dados o cambiar de turno.
+        
+        Returns:
+            bool: True si se deshizo una jugada, False si no había nada para deshacer
+        """
+        if not self.__pila_deshacer__:
+            return False
+        for registro in reversed(self.__pila_deshacer__.pop()):
+            self.__revertir_movimiento__(registro)
+        if self.__verificar_hash__:
+            self.__comprobar_hash__()
+        return True
+    
+    def __ejecutar_movimiento__(self, desde, hasta):
+        """
+        Ejecuta un movimiento ya validado.
+        
+        Returns:
+            tuple: Registro (desde, hasta, capturo, indice_dado, dado) para deshacerlo
+        """
         jugador_actual = self.get_jugador_actual()  # CORREGIDO: usar get_jugador_actual()
         color = jugador_actual.get_color()
+        # es_movimiento_valido ya verificó el dado; en bear off puede ser uno mayor
         distancia = self.__calcular_distancia__(desde, hasta, color)
-        
-        # Verificar que la distancia esté en movimientos disponibles
-        if distancia not in self.__movimientos_disponibles__:
-            return False
+        capturo = False
         
         # Mover desde barra
         if desde == 0:
             # Quitar ficha de la barra
             if self.__bar__[color]:
-                ficha = self.__bar__[color].pop()
+                ficha = self.__sacar_de_barra__(color)
                 
                 # Verificar captura en destino
                 if self.__board__.tiene_fichas(hasta):
@@ -90,17 +313,18 @@ class Game:
                         color_destino = self.__board__.get_color_punto(hasta)
                         if color_destino != color:
                             # Capturar ficha enemiga
-                            ficha_capturada = self.__board__.quitar_ficha(hasta)
+                            ficha_capturada = self.__quitar_de_punto__(hasta)
                             color_enemigo = 'white' if color == 'black' else 'black'
-                            self.__bar__[color_enemigo].append(ficha_capturada)
+                            self.__enviar_a_barra__(color_enemigo, ficha_capturada)
+                            capturo = True
                 
                 # Colocar ficha en destino
-                self.__board__.agregar_ficha(hasta, ficha)
+                self.__agregar_a_punto__(hasta, ficha)
         
         # Bear off (sacar ficha)
         elif hasta == 25:
-            ficha = self.__board__.quitar_ficha(desde)
-            self.__home__[color].append(ficha)
+            ficha = self.__quitar_de_punto__(desde)
+            self.__enviar_a_home__(color, ficha)
         
         # Movimiento normal
         else:
@@ -110,25 +334,139 @@ class Game:
                     color_destino = self.__board__.get_color_punto(hasta)
                     if color_destino != color:
                         # Capturar ficha enemiga
-                        ficha_capturada = self.__board__.quitar_ficha(hasta)
+                        ficha_capturada = self.__quitar_de_punto__(hasta)
                         color_enemigo = 'white' if color == 'black' else 'black'
-                        self.__bar__[color_enemigo].append(ficha_capturada)
+                        self.__enviar_a_barra__(color_enemigo, ficha_capturada)
+                        capturo = True
             
             # Mover ficha
-            ficha = self.__board__.quitar_ficha(desde)
-            self.__board__.agregar_ficha(hasta, ficha)
+            ficha = self.__quitar_de_punto__(desde)
+            self.__agregar_a_punto__(hasta, ficha)
         
         # Remover movimiento usado
-        try:
-            self.__movimientos_disponibles__.remove(distancia)
-        except ValueError:
+        indice, dado = None, None
+        if distancia in self.__movimientos_disponibles__:
+            indice = self.__movimientos_disponibles__.index(distancia)
+        else:
             # Si no está en la lista, podría ser un caso especial de bear-off
             # donde se usa un número mayor. Intentar remover cualquier valor mayor.
             movs_mayores = [m for m in self.__movimientos_disponibles__ if m >= distancia]
             if movs_mayores:
-                self.__movimientos_disponibles__.remove(max(movs_mayores))
+                indice = self.__movimientos_disponibles__.index(max(movs_mayores))
+        if indice is not None:
+            dado = self.__movimientos_disponibles__.pop(indice)
         
-        return True
+        if self.__verificar_hash__:
+            self.__comprobar_hash__()
+        return (desde, hasta, capturo, indice, dado)
+    
+    def __revertir_movimiento__(self, registro):
+        """Revierte un movimiento a partir de su registro."""
+        desde, hasta, capturo, indice, dado = registro
+        color = self.get_jugador_actual().get_color()
+        
+        if indice is not None:
+            self.__movimientos_disponibles__.insert(indice, dado)
+        
+        if hasta == 25:
+            ficha = self.__sacar_de_home__(color)
+        else:
+            ficha = self.__quitar_de_punto__(hasta)
+        
+        if desde == 0:
+            self.__enviar_a_barra__(color, ficha)
+        else:
+            self.__agregar_a_punto__(desde, ficha)
+        
+        if capturo:
+            color_enemigo = 'white' if color == 'black' else 'black'
+            self.__agregar_a_punto__(hasta, self.__sacar_de_barra__(color_enemigo))
+    
+    def __conteo_punto__(self, posicion):
+        """Retorna el conteo con signo de un punto (positivo = blancas)."""
+        cantidad = self.__board__.get_cantidad_fichas(posicion)
+        if cantidad and self.__board__.get_color_punto(posicion) == 'black':
+            return -cantidad
+        return cantidad
+    
+    def __quitar_de_punto__(self, posicion):
+        """Quita una ficha de un punto actualizando la clave Zobrist."""
+        antes = self.__conteo_punto__(posicion)
+        ficha = self.__board__.quitar_ficha(posicion)
+        despues = antes - 1 if antes > 0 else antes + 1
+        self.__clave_zobrist__ ^= (zobrist.clave_punto(posicion, antes) ^
+                                   zobrist.clave_punto(posicion, despues))
+        return ficha
+    
+    def __agregar_a_punto__(self, posicion, ficha):
+        """Agrega una ficha a un punto actualizando la clave Zobrist."""
+        antes = self.__conteo_punto__(posicion)
+        self.__board__.agregar_ficha(posicion, ficha)
+        despues = antes + 1 if ficha.get_color() == 'white' else antes - 1
+        self.__clave_zobrist__ ^= (zobrist.clave_punto(posicion, antes) ^
+                                   zobrist.clave_punto(posicion, despues))
+    
+    def __enviar_a_barra__(self, color, ficha):
+        """Pone una ficha capturada en la barra y actualiza el conteo del tablero."""
+        cantidad = len(self.__bar__[color])
+        self.__bar__[color].append(ficha)
+        self.__board__.set_barra(color, cantidad + 1)
+        self.__clave_zobrist__ ^= (zobrist.clave_barra(color, cantidad) ^
+                                   zobrist.clave_barra(color, cantidad + 1))
+    
+    def __sacar_de_barra__(self, color):
+        """Saca una ficha de la barra y actualiza el conteo del tablero."""
+        cantidad = len(self.__bar__[color])
+        ficha = self.__bar__[color].pop()
+        self.__board__.set_barra(color, cantidad - 1)
+        self.__clave_zobrist__ ^= (zobrist.clave_barra(color, cantidad) ^
+                                   zobrist.clave_barra(color, cantidad - 1))
+        return ficha
+    
+    def __enviar_a_home__(self, color, ficha):
+        """Saca una ficha del tablero y actualiza el conteo de fichas fuera."""
+        cantidad = len(self.__home__[color])
+        self.__home__[color].append(ficha)
+        self.__board__.set_fuera(color, cantidad + 1)
+        self.__clave_zobrist__ ^= (zobrist.clave_fuera(color, cantidad) ^
+                                   zobrist.clave_fuera(color, cantidad + 1))
+    
+    def __sacar_de_home__(self, color):
+        """Devuelve al tablero la última ficha sacada (solo al deshacer)."""
+        cantidad = len(self.__home__[color])
+        ficha = self.__home__[color].pop()
+        self.__board__.set_fuera(color, cantidad - 1)
+        self.__clave_zobrist__ ^= (zobrist.clave_fuera(color, cantidad) ^
+                                   zobrist.clave_fuera(color, cantidad - 1))
+        return ficha
+    
+    def get_hash(self):
+        """
+        Retorna la clave Zobrist de 64 bits de la posición actual.
+        
+        Incluye los puntos, la barra, las fichas fuera y el turno. Se mantiene
+        de forma incremental en cada movimiento, por lo que leerla es O(1).
+        """
+        if self.__verificar_hash__:
+            self.__comprobar_hash__()
+        return self.__clave_zobrist__
+    
+    def __calcular_hash__(self):
+        """Calcula la clave Zobrist completa desde cero."""
+        if self.__board__ is None:
+            return 0
+        return zobrist.calcular_clave(
+            self.__board__.get_conteos(),
+            {color: len(fichas) for color, fichas in self.__bar__.items()},
+            {color: len(fichas) for color, fichas in self.__home__.items()},
+            'white' if self.__turno__ == 0 else 'black')
+    
+    def __comprobar_hash__(self):
+        """Verifica que la clave incremental coincida con el recálculo completo."""
+        esperada = self.__calcular_hash__()
+        if self.__clave_zobrist__ != esperada:
+            raise AssertionError(
+                f"Clave Zobrist desincronizada: {self.__clave_zobrist__:#018x} != {esperada:#018x}")
     
     def __calcular_distancia__(self, desde, hasta, color):
         """Calcula la distancia del movimiento."""
@@ -212,39 +550,28 @@ class Game:
     
     def __es_ficha_mas_lejana__(self, desde, color):
         """Verifica si la ficha es la más lejana en la casa."""
-        if color == 'white':
-            # Para blancas, verificar puntos menores a 'desde' en el rango 19-24
-            for i in range(19, desde):
-                if (self.__board__.tiene_fichas(i) and 
-                    self.__board__.get_color_punto(i) == color):
-                    return False
-        else:
-            # Para negras, verificar puntos mayores a 'desde' en el rango 1-6
-            for i in range(desde + 1, 7):
-                if (self.__board__.tiene_fichas(i) and 
-                    self.__board__.get_color_punto(i) == color):
-                    return False
-        return True
+        # El tablero mantiene la distancia de la ficha más lejana: consulta O(1)
+        return distancia_a_salir(desde, color) >= self.__board__.get_mas_lejana(color)
     
     def __puede_bear_off__(self, color):
         """Verifica si puede sacar fichas del tablero."""
         if self.__bar__[color]:
             return False
         
-        # Definir rangos de casa según el color
-        if color == 'white':
-            home_board = range(19, 25)  # Puntos 19-24 para blancas
-        else:
-            home_board = range(1, 7)    # Puntos 1-6 para negras
-        
-        # Verificar que TODAS las fichas de este color estén en casa o en home
-        for i in range(1, 25):
-            if (self.__board__.tiene_fichas(i) and 
-                self.__board__.get_color_punto(i) == color and 
-                i not in home_board):
-                return False
+        # Todas las fichas de este color deben estar en casa (el tablero lleva la cuenta)
+        return self.__board__.get_fuera_de_casa(color) == 0
+    
+    def get_pip_count(self, color):
+        """
+        Retorna el pip count de un color: los pips que le faltan para sacar todas sus fichas.
         
-        return True
+        Args:
+            color (str): Color del jugador ('white' o 'black')
+            
+        Returns:
+            int: Pips restantes, contando 25 por cada ficha en la barra
+        """
+        return self.__board__.get_pip_count(color)
     
     def tiene_movimientos_disponibles(self):
         """Verifica si hay movimientos disponibles."""
@@ -276,6 +603,44 @@ class Game:
                         return True
         return False
     
+    def generar_jugadas(self):
+        """
+        Genera todas las jugadas completas distintas con los dados disponibles.
+        
+        Las jugadas que llevan a la misma posición se cuentan una sola vez, y se
+        respeta la obligación de usar ambos dados (o el mayor si solo entra uno).
+        
+        Returns:
+            list: Jugadas como tuplas de movimientos (desde, hasta), listas para
+                  aplicar con hacer_movimiento; lista vacía si no se puede mover
+        """
+        if not self.__movimientos_disponibles__:
+            return []
+        color = self.get_jugador_actual().get_color()
+        return generar_jugadas(self.__board__.get_conteos(), len(self.__bar__[color]),
+                               len(self.__home__[color]), color,
+                               self.__movimientos_disponibles__)
+    
+    def jugada_aleatoria(self, rng):
+        """
+        Elige una jugada completa legal al azar sin generar todas las jugadas.
+        
+        Es mucho más barata que elegir de generar_jugadas(), pero no es uniforme
+        entre las jugadas distintas (ver move_generator.jugada_aleatoria_perspectiva).
+        
+        Args:
+            rng (random.Random): Generador para las elecciones
+            
+        Returns:
+            tuple: Movimientos (desde, hasta) para aplicar; vacía si no se puede mover
+        """
+        if not self.__movimientos_disponibles__:
+            return ()
+        color = self.get_jugador_actual().get_color()
+        return jugada_aleatoria(self.__board__.get_conteos(), len(self.__bar__[color]),
+                                len(self.__home__[color]), color,
+                                self.__movimientos_disponibles__, rng)
+    
     def esta_terminado(self):
         """Verifica si el juego terminó."""
         return any(len(self.__home__[jugador.get_color()]) == 15 for jugador in self.__players__)
@@ -289,7 +654,51 @@ class Game:
     
     def reiniciar_juego(self):
         """Reinicia el juego."""
-        self.__init__()
+        self.__init__(self.__clase_tablero__, self.__verificar_hash__,
+                      self.__metricas__ is not None)
+    
+    def __instrumentar__(self):
+        """
+        Pasa esta instancia a GameInstrumentado, cuyos métodos medidos cuentan
+        llamadas y tiempo en self.__metricas__. Game no cambia: sin instrumentar
+        no hay costo, y como no se guardan funciones en la instancia, las copias
+        con deepcopy o pickle miden sobre sí mismas.
+        """
+        self.__metricas__ = {
+            'metodos': {nombre: [0, 0.0] for nombre in _METODOS_INSTRUMENTADOS},
+            'movimientos': {tipo: [0, 0.0] for tipo in TIPOS_MOVIMIENTO},
+        }
+        if not isinstance(self, GameInstrumentado):
+            self.__class__ = GameInstrumentado
+    
+    def get_metricas(self):
+        """
+        Retorna las métricas de un juego creado con instrumentar=True.
+        
+        Los tiempos son inclusivos: aplicar incluye sus llamadas a
+        es_movimiento_valido y a la ejecución de cada movimiento.
+        
+        Returns:
+            dict or None: {'metodos': {nombre: {'llamadas', 'segundos'}},
+                           'movimientos': {tipo: {'llamadas', 'segundos'}}} con los
+                          tipos entrada_barra, bear_off, captura y normal; None si
+                          el juego no está instrumentado
+        """
+        if self.__metricas__ is None:
+            return None
+        return {
+            grupo: {nombre: {'llamadas': llamadas, 'segundos': segundos}
+                    for nombre, (llamadas, segundos) in valores.items()}
+            for grupo, valores in self.__metricas__.items()
+        }
+    
+    def reiniciar_metricas(self):
+        """Pone en cero las métricas sin dejar de instrumentar."""
+        if self.__metricas__ is not None:
+            for valores in self.__metricas__.values():
+                for acumulado in valores.values():
+                    acumulado[0] = 0
+                    acumulado[1] = 0.0
     
     def get_estado_juego(self):
         """Estado actual del juego."""
@@ -301,6 +710,8 @@ class Game:
             'bar_black': len(self.__bar__['black']),
             'home_white': len(self.__home__['white']),
             'home_black': len(self.__home__['black']),
+            'pips_white': self.get_pip_count('white') if self.__board__ else None,
+            'pips_black': self.get_pip_count('black') if self.__board__ else None,
             'terminado': self.esta_terminado(),
             'ganador': self.get_ganador().get_nombre() if self.get_ganador() else None
         }
@@ -316,4 +727,55 @@ class Game:
                 f"Movimientos: {estado['movimientos_disponibles']} | "
                 f"Bar B/N: {estado['bar_white']}/{estado['bar_black']} | "
                 f"Home B/N: {estado['home_white']}/{estado['home_black']} | "
-                f"{'Terminado' if estado['terminado'] else 'En progreso'}")
\ No newline at end of file
+                f"{'Terminado' if estado['terminado'] else 'En progreso'}")
+
+
+def _medir(nombre, metodo):
+    """Envuelve un método de Game para acumular llamadas y segundos en las métricas del juego."""
+    def medido(self, *args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return metodo(self, *args, **kwargs)
+        finally:
+            acumulado = self.__metricas__['metodos'][nombre]
+            acumulado[0] += 1
+            acumulado[1] += time.perf_counter() - inicio
+    medido.__name__ = nombre
+    medido.__doc__ = metodo.__doc__
+    return medido
+
+
+class GameInstrumentado(Game):
+    """
+    Game con los métodos de _METODOS_INSTRUMENTADOS medidos.
+    
+    Game(instrumentar=True) devuelve una instancia de esta clase. Las métricas
+    se guardan en la instancia (ver Game.get_metricas).
+    """
+    
+    def __init__(self, clase_tablero=Board, verificar_hash=False, instrumentar=True):
+        """Inicializa la partida como Game; siempre queda instrumentada."""
+        super().__init__(clase_tablero, verificar_hash, True)
+    
+    def __ejecutar_movimiento__(self, desde, hasta):
+        """Ejecuta un movimiento y acumula su tiempo según el tipo de movimiento."""
+        inicio = time.perf_counter()
+        registro = super().__ejecutar_movimiento__(desde, hasta)
+        duracion = time.perf_counter() - inicio
+        if desde == 0:
+            tipo = 'entrada_barra'
+        elif hasta == 25:
+            tipo = 'bear_off'
+        elif registro[2]:
+            tipo = 'captura'
+        else:
+            tipo = 'normal'
+        acumulado = self.__metricas__['movimientos'][tipo]
+        acumulado[0] += 1
+        acumulado[1] += duracion
+        return registro
+
+
+for _nombre in _METODOS_INSTRUMENTADOS:
+    setattr(GameInstrumentado, _nombre, _medir(_nombre, getattr(Game, _nombre)))
+del _nombre
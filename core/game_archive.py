@@ -0,0 +1,248 @@
+"""
+Archivo de partidas con acceso aleatorio.
+
+Abre un registro de core.game_record con mmap y mantiene al lado un índice con
+la posición de cada partida y sus metadatos (ganador, turnos, gammon). Con el
+índice se accede a cualquier partida en O(1) y se filtra por metadatos sin
+decodificar los movimientos. El Game solo se reconstruye cuando se pide.
+
+El índice se guarda en '<registro>.idx' junto con los bytes del registro que
+cubre, el tamaño y la fecha de modificación del registro al indexarlo y el
+CRC-32 de los últimos bytes indexados (a lo sumo VENTANA_CRC). Si el registro
+creció desde que se armó el índice, solo se indexan las partidas nuevas; si se
+achicó, se reescribió sin crecer o esa ventana ya no coincide, el índice se
+arma de nuevo. Validarlo cuesta lo mismo con cualquier tamaño de registro.
+"""
+import mmap
+import os
+import struct
+import zlib
+from collections import namedtuple
+
+from .game_record import CABECERA, decodificar_cuerpo, leer_metadatos, leer_varint, reproducir
+
+MAGIA_INDICE = b'BKGI'
+VERSION_INDICE = 3
+# Magia, versión, bytes indexados, tamaño y mtime (ns) del registro, CRC-32 de la ventana
+_CABECERA_INDICE = struct.Struct('<4sHQQqI')
+_ENTRADA = struct.Struct('<QIB')  # inicio del cuerpo, turnos, metadatos
+VENTANA_CRC = 64 * 1024  # Bytes finales de la parte indexada que se verifican al abrir
+
+_TERMINADA = 1
+_GANAN_NEGRAS = 2
+_GAMMON = 4
+
+MetadatosPartida = namedtuple('MetadatosPartida', ['ganador', 'turnos', 'gammon'])
+
+
+def _empaquetar_metadatos(ganador, gammon):
+    """Junta el ganador y el gammon en un byte del índice."""
+    bandera = 0
+    if ganador is not None:
+        bandera |= _TERMINADA
+        if ganador == 'black':
+            bandera |= _GANAN_NEGRAS
+    if gammon:
+        bandera |= _GAMMON
+    return bandera
+
+
+def _desempaquetar_metadatos(turnos, bandera):
+    """Convierte una entrada del índice en MetadatosPartida."""
+    ganador = None
+    if bandera & _TERMINADA:
+        ganador = 'black' if bandera & _GANAN_NEGRAS else 'white'
+    return MetadatosPartida(ganador, turnos, bool(bandera & _GAMMON))
+
+
+def actualizar_indice(ruta_registro, ruta_indice=None):
+    """
+    Crea o completa el índice de un registro de partidas.
+
+    Solo se leen el largo y los metadatos de cada partida, nunca los turnos.
+
+    Args:
+        ruta_registro (str): Registro escrito con GameRecordWriter
+        ruta_indice (str or None): Archivo del índice; por defecto '<registro>.idx'
+
+    Returns:
+        str: Ruta del índice
+
+    Raises:
+        ValueError: Si el archivo no es un registro o tiene una partida corrupta
+    """
+    ruta_indice = ruta_indice or ruta_registro + '.idx'
+    with open(ruta_registro, 'rb') as registro:
+        if registro.read(len(CABECERA)) != CABECERA:
+            raise ValueError("El archivo no es un registro de partidas válido")
+        estado = os.fstat(registro.fileno())
+    tamano, mtime = estado.st_size, estado.st_mtime_ns
+
+    with open(ruta_registro, 'rb') as registro:
+        with mmap.mmap(registro.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+            indexado = _validar_indice(ruta_indice, datos, tamano, mtime)
+            if indexado is None:
+                indexado = len(CABECERA)
+                with open(ruta_indice, 'wb') as archivo:
+                    archivo.write(_cabecera(datos, indexado, tamano, mtime))
+
+            with open(ruta_indice, 'r+b') as indice:
+                indice.seek(0, os.SEEK_END)
+                posicion = indexado
+                while posicion < tamano:
+                    try:
+                        largo, inicio = leer_varint(datos, posicion)
+                    except ValueError:
+                        break  # El largo de la última partida todavía no está escrito entero
+                    if inicio + largo > tamano:
+                        break  # Partida todavía incompleta: se indexa en la próxima actualización
+                    ganador, gammon, turnos = leer_metadatos(datos[inicio:inicio + largo], 0)
+                    indice.write(_ENTRADA.pack(inicio, turnos,
+                                               _empaquetar_metadatos(ganador, gammon)))
+                    posicion = inicio + largo
+                indice.seek(0)
+                indice.write(_cabecera(datos, posicion, tamano, mtime))
+    return ruta_indice
+
+
+def _cabecera(datos, hasta, tamano, mtime):
+    """Arma la cabecera del índice para los bytes indexados hasta 'hasta'."""
+    return _CABECERA_INDICE.pack(MAGIA_INDICE, VERSION_INDICE, hasta, tamano, mtime,
+                                 _crc_ventana(datos, hasta))
+
+
+def _crc_ventana(datos, hasta):
+    """Calcula el CRC-32 de los últimos VENTANA_CRC bytes antes de 'hasta', sin copiarlos."""
+    with memoryview(datos) as vista, vista[max(hasta - VENTANA_CRC, 0):hasta] as parte:
+        return zlib.crc32(parte)
+
+
+def _validar_indice(ruta_indice, datos, tamano, mtime):
+    """
+    Lee la cabecera de un índice y la valida contra el registro.
+
+    Returns:
+        int or None: Bytes del registro ya indexados, o None si no hay índice
+                     o no corresponde al registro
+    """
+    if not os.path.exists(ruta_indice):
+        return None
+    with open(ruta_indice, 'rb') as archivo:
+        cabecera = archivo.read(_CABECERA_INDICE.size)
+        largo_entradas = os.fstat(archivo.fileno()).st_size - _CABECERA_INDICE.size
+    if len(cabecera) != _CABECERA_INDICE.size or largo_entradas % _ENTRADA.size:
+        return None
+    magia, version, hasta, tamano_visto, mtime_visto, crc = _CABECERA_INDICE.unpack(cabecera)
+    if magia != MAGIA_INDICE or version != VERSION_INDICE:
+        return None
+    if tamano < tamano_visto or (tamano == tamano_visto and mtime != mtime_visto):
+        return None  # El registro se truncó o se reescribió sin crecer
+    if _crc_ventana(datos, hasta) != crc:
+        return None
+    return hasta
+
+
+class GameArchive:
+    """
+    Lector de registros de partidas con acceso aleatorio por índice.
+
+    Soporta len(), archivo[i], archivo[inicio:fin] e iteración; las partidas se
+    decodifican recién cuando se piden.
+    """
+
+    def __init__(self, ruta, ruta_indice=None):
+        """
+        Abre un registro y su índice, creando o completando el índice si hace falta.
+
+        Args:
+            ruta (str): Registro escrito con GameRecordWriter
+            ruta_indice (str or None): Archivo del índice; por defecto '<registro>.idx'
+        """
+        ruta_indice = actualizar_indice(ruta, ruta_indice)
+        self.__archivo__ = open(ruta, 'rb')
+        self.__datos__ = mmap.mmap(self.__archivo__.fileno(), 0, access=mmap.ACCESS_READ)
+        # El índice (13 bytes por partida) también se mapea en lugar de leerse
+        self.__archivo_indice__ = open(ruta_indice, 'rb')
+        self.__indice__ = mmap.mmap(self.__archivo_indice__.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__cantidad__ = (len(self.__indice__) - _CABECERA_INDICE.size) // _ENTRADA.size
+
+    def __len__(self):
+        return self.__cantidad__
+
+    def __entrada__(self, indice):
+        """Retorna (inicio, turnos, bandera) de una partida."""
+        if indice < 0:
+            indice += self.__cantidad__
+        if not 0 <= indice < self.__cantidad__:
+            raise IndexError("Índice de partida fuera de rango")
+        return _ENTRADA.unpack_from(self.__indice__,
+                                    _CABECERA_INDICE.size + indice * _ENTRADA.size)
+
+    def __getitem__(self, clave):
+        if isinstance(clave, slice):
+            return [self[i] for i in range(*clave.indices(self.__cantidad__))]
+        inicio, _, _ = self.__entrada__(clave)
+        return decodificar_cuerpo(self.__datos__, inicio)
+
+    def __iter__(self):
+        for i in range(self.__cantidad__):
+            yield self[i]
+
+    def get_metadatos(self, indice):
+        """
+        Retorna los metadatos de una partida sin decodificarla.
+
+        Returns:
+            MetadatosPartida: ganador ('white', 'black' o None), turnos y gammon
+        """
+        _, turnos, bandera = self.__entrada__(indice)
+        return _desempaquetar_metadatos(turnos, bandera)
+
+    def filtrar(self, ganador=None, gammon=None, min_turnos=None, max_turnos=None):
+        """
+        Retorna los índices de las partidas que cumplen los filtros.
+
+        Solo se recorre el índice; los movimientos no se decodifican.
+
+        Args:
+            ganador (str or None): 'white' o 'black'
+            gammon (bool or None): Solo partidas con (o sin) gammon
+            min_turnos (int or None): Turnos mínimos
+            max_turnos (int or None): Turnos máximos
+
+        Returns:
+            list: Índices de las partidas en orden
+        """
+        resultado = []
+        fin = _CABECERA_INDICE.size + self.__cantidad__ * _ENTRADA.size
+        with memoryview(self.__indice__) as vista:
+            entradas = _ENTRADA.iter_unpack(vista[_CABECERA_INDICE.size:fin])
+            for i, (_, turnos, bandera) in enumerate(entradas):
+                metadatos = _desempaquetar_metadatos(turnos, bandera)
+                if ganador is not None and metadatos.ganador != ganador:
+                    continue
+                if gammon is not None and metadatos.gammon != gammon:
+                    continue
+                if min_turnos is not None and turnos < min_turnos:
+                    continue
+                if max_turnos is not None and turnos > max_turnos:
+                    continue
+                resultado.append(i)
+        return resultado
+
+    def reproducir(self, indice, clase_tablero=None, hasta_turno=None):
+        """Reconstruye el Game de una partida (ver game_record.reproducir)."""
+        return reproducir(self[indice], clase_tablero, hasta_turno)
+
+    def cerrar(self):
+        """Cierra los mapas de memoria y los archivos."""
+        self.__datos__.close()
+        self.__archivo__.close()
+        self.__indice__.close()
+        self.__archivo_indice__.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
@@ -0,0 +1,352 @@
+"""
+Formato binario compacto para registrar partidas.
+
+Un archivo de registro empieza con una cabecera (b'BKGR' y la versión) y
+sigue con partidas una detrás de otra, solo agregando al final. Cada partida es:
+
+    varint  largo del cuerpo en bytes (permite saltar partidas sin decodificarlas)
+    byte    banderas: semilla presente, empiezan negras, terminada, ganan negras, gammon
+    varint  cantidad de turnos
+    varint  semilla (solo si está presente)
+    varint + UTF-8  nombre de las blancas, luego el de las negras
+    por turno:
+        byte  tirada y cantidad de movimientos: ((dado1 - 1) * 6 + dado2 - 1) * 5 + n
+        n bytes  movimientos: desde * 6 + pasos - 1
+
+Los movimientos son los argumentos de Game.hacer_movimiento: 'pasos' es lo que
+avanza la ficha en su sentido, y llegar a 25 (blancas) o a 0 (negras) es sacarla.
+Cada partida se decodifica sola, sin volver a jugarla: no depende de la semilla,
+del generador de los dados ni del orden en que se generan las jugadas. La
+semilla se guarda solo como dato. Una partida aleatoria ocupa unos 300 bytes:
+un byte por turno y uno por movimiento, sin otra compresión.
+"""
+import os
+from collections import namedtuple
+
+from .dice import Dice
+from .game import Game
+
+MAGIA = b'BKGR'
+VERSION = 3
+CABECERA = MAGIA + bytes([VERSION])
+
+_CON_SEMILLA = 1
+_EMPIEZAN_NEGRAS = 2
+_TERMINADA = 4
+_GANAN_NEGRAS = 8
+_GAMMON = 16
+
+# Un turno es la tirada (dado1, dado2) y los movimientos (desde, hasta) jugados
+Turno = namedtuple('Turno', ['dado1', 'dado2', 'movimientos'])
+
+GameRecord = namedtuple('GameRecord', [
+    'semilla', 'nombres', 'primer_color', 'turnos', 'ganador', 'gammon'
+])
+
+
+def escribir_varint(valor, salida):
+    """Agrega un entero no negativo como varint (7 bits por byte) a un bytearray."""
+    if valor < 0:
+        raise ValueError("Los varint solo representan enteros no negativos")
+    while valor >= 0x80:
+        salida.append((valor & 0x7F) | 0x80)
+        valor >>= 7
+    salida.append(valor)
+
+
+def leer_varint(datos, posicion):
+    """
+    Lee un varint desde una posición de un buffer.
+
+    Returns:
+        tuple: (valor, posición siguiente)
+
+    Raises:
+        ValueError: Si el buffer termina en medio del varint
+    """
+    valor = 0
+    desplazamiento = 0
+    while True:
+        if posicion >= len(datos):
+            raise ValueError("El registro de partidas está truncado o corrupto")
+        byte = datos[posicion]
+        posicion += 1
+        valor |= (byte & 0x7F) << desplazamiento
+        if byte < 0x80:
+            return valor, posicion
+        desplazamiento += 7
+
+
+def _leer_bytes(datos, posicion, largo):
+    """Retorna 'largo' bytes desde una posición, o ValueError si el buffer es más corto."""
+    if posicion + largo > len(datos):
+        raise ValueError("El registro de partidas está truncado o corrupto")
+    return bytes(datos[posicion:posicion + largo])
+
+
+def codificar_movimiento(desde, hasta, color):
+    """Convierte un movimiento (desde, hasta) en un byte."""
+    if color == 'white':
+        pasos = hasta - desde
+    else:
+        pasos = (25 if desde == 0 else desde) - (0 if hasta == 25 else hasta)
+    if not 0 <= desde <= 24 or not 1 <= pasos <= 6:
+        raise ValueError(f"Movimiento no representable: {desde} -> {hasta}")
+    return desde * 6 + pasos - 1
+
+
+def decodificar_movimiento(byte, color):
+    """Convierte un byte en el movimiento (desde, hasta)."""
+    desde, pasos = divmod(byte, 6)
+    if desde > 24:
+        raise ValueError(f"Movimiento inválido en el registro: {byte}")
+    pasos += 1
+    if color == 'white':
+        return desde, desde + pasos
+    hasta = (25 if desde == 0 else desde) - pasos
+    return desde, 25 if hasta == 0 else hasta
+
+
+def codificar_partida(registro):
+    """
+    Codifica una partida completa, incluido el largo del cuerpo.
+
+    Args:
+        registro (GameRecord): Partida a codificar
+
+    Returns:
+        bytes: Partida lista para agregar al archivo
+    """
+    banderas = 0
+    if registro.semilla is not None:
+        banderas |= _CON_SEMILLA
+    if registro.primer_color == 'black':
+        banderas |= _EMPIEZAN_NEGRAS
+    if registro.ganador is not None:
+        banderas |= _TERMINADA
+        if registro.ganador == 'black':
+            banderas |= _GANAN_NEGRAS
+        if registro.gammon:
+            banderas |= _GAMMON
+
+    cuerpo = bytearray([banderas])
+    escribir_varint(len(registro.turnos), cuerpo)
+    if registro.semilla is not None:
+        escribir_varint(registro.semilla, cuerpo)
+    for nombre in registro.nombres:
+        texto = nombre.encode('utf-8')
+        escribir_varint(len(texto), cuerpo)
+        cuerpo += texto
+
+    color = registro.primer_color
+    for dado1, dado2, movimientos in registro.turnos:
+        if not 1 <= dado1 <= 6 or not 1 <= dado2 <= 6 or len(movimientos) > 4:
+            raise ValueError("Turno no representable")
+        cuerpo.append(((dado1 - 1) * 6 + dado2 - 1) * 5 + len(movimientos))
+        for desde, hasta in movimientos:
+            cuerpo.append(codificar_movimiento(desde, hasta, color))
+        color = 'black' if color == 'white' else 'white'
+
+    partida = bytearray()
+    escribir_varint(len(cuerpo), partida)
+    return bytes(partida + cuerpo)
+
+
+def leer_metadatos(datos, posicion):
+    """
+    Lee solo los metadatos del cuerpo de una partida, sin decodificar los turnos.
+
+    Args:
+        datos (bytes-like): Buffer con el cuerpo de la partida
+        posicion (int): Inicio del cuerpo (después del varint de largo)
+
+    Returns:
+        tuple: (ganador o None, gammon, cantidad de turnos)
+    """
+    banderas = _leer_bytes(datos, posicion, 1)[0]
+    turnos, _ = leer_varint(datos, posicion + 1)
+    ganador = None
+    if banderas & _TERMINADA:
+        ganador = 'black' if banderas & _GANAN_NEGRAS else 'white'
+    return ganador, bool(banderas & _GAMMON), turnos
+
+
+def decodificar_cuerpo(datos, posicion=0, fin=None):
+    """
+    Decodifica el cuerpo de una partida.
+
+    Args:
+        datos (bytes-like): Buffer con el cuerpo de la partida
+        posicion (int): Inicio del cuerpo (después del varint de largo)
+        fin (int or None): Fin del cuerpo, si se conoce; se verifica que se lea completo
+
+    Returns:
+        GameRecord: Partida decodificada
+
+    Raises:
+        ValueError: Si la partida está truncada o corrupta
+    """
+    if fin is not None:
+        datos = memoryview(datos)[:fin]
+    banderas = _leer_bytes(datos, posicion, 1)[0]
+    cantidad_turnos, posicion = leer_varint(datos, posicion + 1)
+    semilla = None
+    if banderas & _CON_SEMILLA:
+        semilla, posicion = leer_varint(datos, posicion)
+    nombres = []
+    for _ in range(2):
+        largo, posicion = leer_varint(datos, posicion)
+        nombres.append(_leer_bytes(datos, posicion, largo).decode('utf-8'))
+        posicion += largo
+
+    color = 'black' if banderas & _EMPIEZAN_NEGRAS else 'white'
+    primer_color = color
+    turnos = []
+    for _ in range(cantidad_turnos):
+        tirada, cantidad = divmod(_leer_bytes(datos, posicion, 1)[0], 5)
+        if tirada >= 36:
+            raise ValueError("El registro de partidas tiene una tirada inválida")
+        dado1, dado2 = divmod(tirada, 6)
+        movimientos = tuple(decodificar_movimiento(byte, color)
+                            for byte in _leer_bytes(datos, posicion + 1, cantidad))
+        turnos.append(Turno(dado1 + 1, dado2 + 1, movimientos))
+        posicion += 1 + cantidad
+        color = 'black' if color == 'white' else 'white'
+    if fin is not None and posicion != fin:
+        raise ValueError("La partida tiene bytes de más: el registro está corrupto")
+
+    ganador = None
+    if banderas & _TERMINADA:
+        ganador = 'black' if banderas & _GANAN_NEGRAS else 'white'
+    gammon = bool(banderas & _GAMMON)
+    return GameRecord(semilla, tuple(nombres), primer_color, turnos, ganador, gammon)
+
+
+class GameRecordWriter:
+    """
+    Escritor de registros de partidas que agrega al final del archivo.
+
+    Cada partida se codifica y se escribe apenas se entrega; el escritor no
+    guarda partidas en memoria.
+    """
+
+    def __init__(self, ruta):
+        """
+        Abre (o crea) un archivo de registro para agregar partidas.
+
+        Args:
+            ruta (str): Ruta del archivo
+        """
+        existe = os.path.exists(ruta) and os.path.getsize(ruta) > 0
+        if existe:
+            with open(ruta, 'rb') as archivo:
+                if archivo.read(len(CABECERA)) != CABECERA:
+                    raise ValueError("El archivo no es un registro de partidas válido")
+        self.__archivo__ = open(ruta, 'ab')
+        if not existe:
+            self.__archivo__.write(CABECERA)
+        self.__partidas__ = 0
+
+    def escribir(self, registro):
+        """Codifica una partida y la agrega al archivo."""
+        self.__archivo__.write(codificar_partida(registro))
+        self.__partidas__ += 1
+
+    def get_partidas_escritas(self):
+        """Retorna cuántas partidas escribió este escritor."""
+        return self.__partidas__
+
+    def cerrar(self):
+        """Cierra el archivo."""
+        self.__archivo__.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def leer_partidas(ruta):
+    """
+    Itera las partidas de un archivo de registro de a una.
+
+    Args:
+        ruta (str): Ruta del archivo
+
+    Yields:
+        GameRecord: Cada partida en el orden en que se escribió
+    """
+    with open(ruta, 'rb') as archivo:
+        if archivo.read(len(CABECERA)) != CABECERA:
+            raise ValueError("El archivo no es un registro de partidas válido")
+        while True:
+            largo = _leer_varint_archivo(archivo)
+            if largo is None:
+                return
+            cuerpo = archivo.read(largo)
+            if len(cuerpo) != largo:
+                raise ValueError("El registro de partidas está truncado")
+            yield decodificar_cuerpo(cuerpo, 0, largo)
+
+
+def _leer_varint_archivo(archivo):
+    """Lee un varint desde un archivo; retorna None al final del archivo."""
+    valor = 0
+    desplazamiento = 0
+    while True:
+        byte = archivo.read(1)
+        if not byte:
+            if desplazamiento:
+                raise ValueError("El registro de partidas está truncado")
+            return None
+        valor |= (byte[0] & 0x7F) << desplazamiento
+        if byte[0] < 0x80:
+            return valor
+        desplazamiento += 7
+
+
+class DadosGrabados(Dice):
+    """Dados que repiten una secuencia de tiradas ya registrada."""
+
+    def __init__(self, pares):
+        """
+        Args:
+            pares (iterable): Pares (dado1, dado2) en el orden en que se tiraron
+        """
+        super().__init__()
+        self.__pares__ = iter(pares)
+
+    def __siguiente_par__(self):
+        """Retorna la siguiente tirada registrada."""
+        return next(self.__pares__)
+
+
+def reproducir(registro, clase_tablero=None, hasta_turno=None):
+    """
+    Reconstruye un Game jugando los turnos de una partida registrada.
+
+    Args:
+        registro (GameRecord): Partida a reproducir
+        clase_tablero (type or None): Clase de tablero para el Game
+        hasta_turno (int or None): Cantidad de turnos a jugar; por defecto todos
+
+    Returns:
+        Game: Juego en la posición después del último turno jugado
+    """
+    turnos = registro.turnos if hasta_turno is None else registro.turnos[:hasta_turno]
+    # La primera tirada decide quién empieza: el dado de las blancas es el primero
+    apertura = (2, 1) if registro.primer_color == 'white' else (1, 2)
+    dados = DadosGrabados([apertura] + [(t.dado1, t.dado2) for t in turnos])
+
+    game = Game(clase_tablero) if clase_tablero is not None else Game()
+    game.iniciar_juego(registro.nombres[0], registro.nombres[1], dados)
+    for indice, turno in enumerate(turnos):
+        game.tirar_dados()
+        for desde, hasta in turno.movimientos:
+            if not game.hacer_movimiento(desde, hasta):
+                raise ValueError(f"Movimiento inválido en el turno {indice}: {desde} -> {hasta}")
+        if game.esta_terminado():
+            break
+        game.cambiar_turno()
+    return game
@@ -0,0 +1,275 @@
+"""
+Generador de jugadas completas para un turno de backgammon.
+
+Trabaja sobre una posición "en perspectiva" del jugador que mueve: una lista de
+26 enteros donde el índice es la cantidad de pips que le faltan a la ficha para
+salir (1-24), el índice 25 es la barra y el índice 0 las fichas ya sacadas.
+Los valores positivos son fichas propias y los negativos fichas del rival.
+"""
+from .board import punto_desde_pips
+
+BARRA = 25
+FUERA = 0
+
+
+def a_perspectiva(conteos, barra, fuera, color):
+    """
+    Convierte los conteos del tablero a la posición en perspectiva de un color.
+
+    Args:
+        conteos (list): 24 conteos con signo (positivo = blancas, negativo = negras)
+        barra (int): Fichas propias en la barra
+        fuera (int): Fichas propias ya sacadas
+        color (str): Color del jugador que mueve
+
+    Returns:
+        list: Posición de 26 enteros en perspectiva del jugador
+    """
+    if color == 'white':
+        # Las blancas salen por el punto 24: al punto p le faltan 25 - p pips
+        pos = [fuera] + conteos[::-1] + [barra]
+    else:
+        pos = [fuera] + [-c for c in conteos] + [barra]
+    return pos
+
+
+def a_movimiento(origen, destino, color):
+    """
+    Convierte un movimiento en perspectiva a los argumentos de Game.hacer_movimiento.
+
+    Returns:
+        tuple: (desde, hasta) con 0 = barra y 25 = sacar ficha
+    """
+    desde = 0 if origen == BARRA else punto_desde_pips(origen, color)
+    hasta = 25 if destino == FUERA else punto_desde_pips(destino, color)
+    return (desde, hasta)
+
+
+# Conversiones precalculadas: la tabla se indexa por color, origen y destino
+_MOVIMIENTOS = {
+    color: tuple(tuple(a_movimiento(origen, destino, color) for destino in range(26))
+                 for origen in range(26))
+    for color in ('white', 'black')
+}
+
+
+def movimientos_simples(pos, dado):
+    """
+    Lista los movimientos de una ficha permitidos con un dado.
+
+    Args:
+        pos (list): Posición en perspectiva del jugador que mueve
+        dado (int): Valor del dado
+
+    Returns:
+        list: Pares (origen, destino) en pips; destino 0 significa sacar la ficha
+    """
+    # Con fichas en la barra solo se puede entrar
+    if pos[BARRA] > 0:
+        destino = BARRA - dado
+        return [(BARRA, destino)] if pos[destino] >= -1 else []
+
+    mas_lejana = 24
+    while mas_lejana > 0 and pos[mas_lejana] <= 0:
+        mas_lejana -= 1
+
+    movimientos = []
+    for origen in range(mas_lejana, 0, -1):
+        if pos[origen] <= 0:
+            continue
+        destino = origen - dado
+        if destino > 0:
+            if pos[destino] >= -1:
+                movimientos.append((origen, destino))
+        elif mas_lejana <= 6 and (destino == 0 or origen == mas_lejana):
+            # Bear off: exacto, o con dado mayor desde la ficha más lejana
+            movimientos.append((origen, FUERA))
+    return movimientos
+
+
+def aplicar_movimiento(pos, origen, destino):
+    """
+    Retorna una nueva posición con el movimiento aplicado.
+
+    Returns:
+        list: Posición resultante (la original no se modifica)
+    """
+    nueva = pos[:]
+    nueva[origen] -= 1
+    if destino == FUERA:
+        nueva[FUERA] += 1
+    elif nueva[destino] == -1:
+        # Captura: la ficha rival sale del tablero hacia su barra
+        nueva[destino] = 1
+    else:
+        nueva[destino] += 1
+    return nueva
+
+
+def _recorrer_dobles(pos, dado, restantes, tope, camino, resultados):
+    """Explora los dobles exigiendo orígenes no crecientes para evitar permutaciones."""
+    if restantes:
+        movimientos = [m for m in movimientos_simples(pos, dado) if m[0] <= tope]
+        if movimientos:
+            for origen, destino in movimientos:
+                _recorrer_dobles(aplicar_movimiento(pos, origen, destino), dado,
+                                 restantes - 1, origen, camino + ((origen, destino, dado),),
+                                 resultados)
+            return
+    clave = tuple(pos)
+    if clave not in resultados:
+        resultados[clave] = camino
+
+
+def _recorrer(pos, dados, camino, resultados):
+    """Explora los dados en el orden dado guardando cada posición final."""
+    if dados:
+        dado = dados[0]
+        movimientos = movimientos_simples(pos, dado)
+        if movimientos:
+            for origen, destino in movimientos:
+                _recorrer(aplicar_movimiento(pos, origen, destino), dados[1:],
+                          camino + ((origen, destino, dado),), resultados)
+            return
+    clave = tuple(pos)
+    if clave not in resultados:
+        resultados[clave] = camino
+
+
+def generar_jugadas_perspectiva(pos, dados):
+    """
+    Genera las jugadas completas distintas sobre una posición en perspectiva.
+
+    Aplica las reglas de uso obligatorio: se juega la mayor cantidad posible de
+    dados y, si solo se puede usar uno de dos dados distintos, debe ser el mayor.
+
+    Args:
+        pos (list): Posición en perspectiva del jugador que mueve
+        dados (list): Dados disponibles (2 distintos, o 1-4 iguales)
+
+    Returns:
+        dict: Posición final (tupla) -> jugada como tupla de (origen, destino, dado)
+    """
+    resultados = {}
+    if not dados:
+        return resultados
+
+    if all(d == dados[0] for d in dados):
+        _recorrer_dobles(pos, dados[0], len(dados), BARRA, (), resultados)
+    else:
+        _recorrer(pos, tuple(dados), (), resultados)
+        _recorrer(pos, tuple(reversed(dados)), (), resultados)
+
+    maximo = max(len(camino) for camino in resultados.values())
+    if maximo == 0:
+        return {}
+
+    jugadas = {clave: camino for clave, camino in resultados.items() if len(camino) == maximo}
+    if maximo == 1 and len(dados) == 2:
+        mayor = max(dados)
+        con_mayor = {clave: camino for clave, camino in jugadas.items() if camino[0][2] == mayor}
+        if con_mayor:
+            jugadas = con_mayor
+    return jugadas
+
+
+def _buscar_al_azar(pos, dados, tope, rng, camino):
+    """
+    Busca en orden aleatorio un camino que use todos los dados.
+
+    Con dobles (tope no None) se exigen orígenes no crecientes, como en
+    _recorrer_dobles, para no repetir permutaciones cuando ningún camino sirve.
+
+    Returns:
+        tuple or None: El primer camino completo encontrado, o None si no hay
+    """
+    if not dados:
+        return camino
+    dado = dados[0]
+    movimientos = movimientos_simples(pos, dado)
+    if tope is not None:
+        movimientos = [m for m in movimientos if m[0] <= tope]
+    rng.shuffle(movimientos)
+    for origen, destino in movimientos:
+        encontrado = _buscar_al_azar(aplicar_movimiento(pos, origen, destino), dados[1:],
+                                     None if tope is None else origen, rng,
+                                     camino + ((origen, destino, dado),))
+        if encontrado is not None:
+            return encontrado
+    return None
+
+
+def jugada_aleatoria_perspectiva(pos, dados, rng):
+    """
+    Elige una jugada legal al azar sin generar todas las jugadas.
+
+    Recorre los movimientos en orden aleatorio y se queda con el primer camino
+    que usa todos los dados, que casi siempre es el primero que se prueba. Solo
+    si ningún camino los usa todos se generan las jugadas completas para aplicar
+    las reglas de uso obligatorio. La elección no es uniforme entre las
+    jugadas distintas: cada movimiento se elige al azar entre los posibles.
+
+    Args:
+        pos (list): Posición en perspectiva del jugador que mueve
+        dados (list): Dados disponibles (2 distintos, o 1-4 iguales)
+        rng (random.Random): Generador para las elecciones
+
+    Returns:
+        tuple: Jugada como tupla de (origen, destino, dado); vacía si no se puede mover
+    """
+    if not dados:
+        return ()
+    if all(d == dados[0] for d in dados):
+        encontrado = _buscar_al_azar(pos, tuple(dados), BARRA, rng, ())
+    else:
+        ordenes = [tuple(dados), tuple(reversed(dados))]
+        if rng.random() < 0.5:
+            ordenes.reverse()
+        encontrado = None
+        for orden in ordenes:
+            encontrado = _buscar_al_azar(pos, orden, None, rng, ())
+            if encontrado is not None:
+                break
+    if encontrado is not None:
+        return encontrado
+
+    jugadas = list(generar_jugadas_perspectiva(pos, dados).values())
+    return jugadas[rng.randrange(len(jugadas))] if jugadas else ()
+
+
+def jugada_aleatoria(conteos, barra, fuera, color, dados, rng):
+    """
+    Elige una jugada legal al azar (ver jugada_aleatoria_perspectiva).
+
+    Returns:
+        tuple: Movimientos (desde, hasta) para Game.hacer_movimiento; vacía si
+               no se puede mover
+    """
+    pos = a_perspectiva(conteos, barra, fuera, color)
+    tabla = _MOVIMIENTOS[color]
+    return tuple([tabla[origen][destino]
+                  for origen, destino, _ in jugada_aleatoria_perspectiva(pos, dados, rng)])
+
+
+def generar_jugadas(conteos, barra, fuera, color, dados):
+    """
+    Genera todas las jugadas completas distintas para una tirada.
+
+    Args:
+        conteos (list): 24 conteos con signo del tablero
+        barra (int): Fichas del jugador en la barra
+        fuera (int): Fichas del jugador ya sacadas
+        color (str): Color del jugador que mueve
+        dados (list): Dados disponibles
+
+    Returns:
+        list: Jugadas como tuplas de movimientos (desde, hasta) para
+              Game.hacer_movimiento; lista vacía si no se puede mover
+    """
+    pos = a_perspectiva(conteos, barra, fuera, color)
+    jugadas = generar_jugadas_perspectiva(pos, dados)
+    tabla = _MOVIMIENTOS[color]
+    return [
+        tuple([tabla[origen][destino] for origen, destino, _ in camino])
+        for camino in jugadas.values()
+    ]
@@ -0,0 +1,210 @@
+"""
+Evaluador de posiciones con una red neuronal al estilo TD-Gammon.
+
+Cada posición se codifica en 198 entradas fijas y una red de una capa oculta
+estima la probabilidad de ganar y de ganar o perder con gammon. Las posiciones
+candidatas de una tirada se evalúan todas juntas: una multiplicación de
+matrices por capa en lugar de una llamada por posición.
+
+Codificación, siempre desde la perspectiva del jugador que acaba de mover (el
+dueño de las fichas positivas, cuyas probabilidades estima la red):
+- 4 unidades por punto y color (96 + 96): n >= 1, n >= 2, n >= 3 y (n - 3) / 2
+- Fichas en la barra / 2, propias y rivales (2)
+- Fichas fuera / 15, propias y rivales (2)
+- Color del jugador: blancas o negras (2)
+
+Requiere NumPy.
+"""
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional para el resto del paquete
+    np = None
+
+from .move_generator import _MOVIMIENTOS, a_perspectiva, generar_jugadas_perspectiva
+
+CANTIDAD_ENTRADAS = 198
+SALIDAS = ('victoria', 'gammon_ganado', 'gammon_perdido')
+FICHAS = 15
+
+
+def _requerir_numpy():
+    """Lanza un error claro si NumPy no está instalado."""
+    if np is None:
+        raise ImportError("El evaluador neuronal requiere NumPy (pip install numpy)")
+
+
+def codificar_lote(posiciones, fuera_rival, color):
+    """
+    Codifica varias posiciones en perspectiva como una matriz de entradas.
+
+    Args:
+        posiciones (sequence): Posiciones de 26 enteros (ver core.move_generator)
+        fuera_rival (int or sequence): Fichas sacadas por el rival, una o por posición
+        color (str): Color del jugador que acaba de mover, dueño de las fichas positivas
+
+    Returns:
+        numpy.ndarray: Matriz float32 de forma (len(posiciones), 198)
+    """
+    _requerir_numpy()
+    pos = np.asarray(posiciones, dtype=np.int16).reshape(-1, 26)
+    fuera_rival = np.broadcast_to(np.asarray(fuera_rival, dtype=np.float32), (len(pos),))
+    puntos = pos[:, 1:25]
+    propias = np.maximum(puntos, 0).astype(np.float32)
+    rivales = np.maximum(-puntos, 0).astype(np.float32)
+    barra_rival = FICHAS - fuera_rival - rivales.sum(axis=1)
+
+    entradas = np.empty((len(pos), CANTIDAD_ENTRADAS), dtype=np.float32)
+    for desplazamiento, fichas in ((0, propias), (96, rivales)):
+        bloque = entradas[:, desplazamiento:desplazamiento + 96].reshape(-1, 24, 4)
+        bloque[:, :, 0] = fichas >= 1
+        bloque[:, :, 1] = fichas >= 2
+        bloque[:, :, 2] = fichas >= 3
+        bloque[:, :, 3] = np.maximum(fichas - 3, 0) / 2
+    entradas[:, 192] = pos[:, 25] / 2
+    entradas[:, 193] = barra_rival / 2
+    entradas[:, 194] = pos[:, 0] / FICHAS
+    entradas[:, 195] = fuera_rival / FICHAS
+    entradas[:, 196] = color == 'white'
+    entradas[:, 197] = color == 'black'
+    return entradas
+
+
+def codificar_juego(game):
+    """
+    Codifica la posición actual de un juego.
+
+    Usa la misma perspectiva que codificar_lote: la del jugador que acaba de
+    mover, es decir, el que no tiene el turno.
+
+    Returns:
+        numpy.ndarray: Vector float32 de 198 entradas
+    """
+    rival = game.get_jugador_actual().get_color()
+    color = 'black' if rival == 'white' else 'white'
+    pos = a_perspectiva(game.get_board().get_conteos(), len(game.get_bar(color)),
+                        len(game.get_home(color)), color)
+    return codificar_lote([pos], len(game.get_home(rival)), color)[0]
+
+
+def equity(probabilidades):
+    """
+    Convierte salidas de la red en equity (puntos esperados).
+
+    Args:
+        probabilidades (numpy.ndarray): Matriz (N, 3) o vector con las SALIDAS
+
+    Returns:
+        numpy.ndarray: Equity de cada fila, entre -2 y 2
+    """
+    victoria = probabilidades[..., 0]
+    return 2 * victoria - 1 + probabilidades[..., 1] - probabilidades[..., 2]
+
+
+class NeuralEvaluator:
+    """
+    Perceptrón de una capa oculta que evalúa lotes de posiciones.
+
+    Sin pesos entrenados arranca con pesos aleatorios pequeños; los pesos se
+    pueden guardar y cargar con guardar() y cargar().
+    """
+
+    def __init__(self, ocultas=40, semilla=None, pesos=None):
+        """
+        Args:
+            ocultas (int): Neuronas de la capa oculta
+            semilla (int or None): Semilla para los pesos iniciales
+            pesos (dict or None): Matrices 'w1', 'b1', 'w2' y 'b2' ya entrenadas
+        """
+        _requerir_numpy()
+        if pesos is None:
+            rng = np.random.default_rng(semilla)
+            pesos = {
+                'w1': rng.normal(0, 0.1, (CANTIDAD_ENTRADAS, ocultas)),
+                'b1': np.zeros(ocultas),
+                'w2': rng.normal(0, 0.1, (ocultas, len(SALIDAS))),
+                'b2': np.zeros(len(SALIDAS)),
+            }
+        self.__w1__ = np.asarray(pesos['w1'], dtype=np.float32)
+        self.__b1__ = np.asarray(pesos['b1'], dtype=np.float32)
+        self.__w2__ = np.asarray(pesos['w2'], dtype=np.float32)
+        self.__b2__ = np.asarray(pesos['b2'], dtype=np.float32)
+        if self.__w1__.shape[0] != CANTIDAD_ENTRADAS or self.__w2__.shape[1] != len(SALIDAS):
+            raise ValueError("Los pesos no coinciden con las 198 entradas y 3 salidas")
+
+    def get_pesos(self):
+        """Retorna una copia de las matrices de pesos."""
+        return {'w1': self.__w1__.copy(), 'b1': self.__b1__.copy(),
+                'w2': self.__w2__.copy(), 'b2': self.__b2__.copy()}
+
+    def guardar(self, ruta):
+        """Guarda los pesos en un archivo .npz."""
+        np.savez(ruta, **self.get_pesos())
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Crea un evaluador con los pesos guardados en un archivo .npz."""
+        with np.load(ruta) as datos:
+            return cls(pesos={clave: datos[clave] for clave in ('w1', 'b1', 'w2', 'b2')})
+
+    def evaluar_lote(self, entradas):
+        """
+        Evalúa un lote de posiciones codificadas.
+
+        Args:
+            entradas (numpy.ndarray): Matriz (N, 198) de codificar_lote, o un
+                vector de 198 de codificar_juego (se evalúa como lote de uno)
+
+        Returns:
+            numpy.ndarray: Matriz (N, 3) con las probabilidades de SALIDAS
+        """
+        oculta = np.atleast_2d(entradas) @ self.__w1__
+        oculta += self.__b1__
+        oculta = 1 / (1 + np.exp(-oculta))
+        salida = oculta @ self.__w2__
+        salida += self.__b2__
+        salida = 1 / (1 + np.exp(-salida))
+        # Un gammon no puede ser más probable que la victoria (o la derrota) que lo incluye
+        salida[:, 1] = np.minimum(salida[:, 1], salida[:, 0])
+        salida[:, 2] = np.minimum(salida[:, 2], 1 - salida[:, 0])
+        return salida
+
+    def __call__(self, pos, fuera_rival, color):
+        """
+        Equity de una sola posición para el jugador que acaba de mover; permite
+        usar la red como evaluador de ExpectiminimaxBot.
+
+        Args:
+            pos (sequence): Posición de 26 enteros del jugador que acaba de mover
+            fuera_rival (int): Fichas que el rival ya sacó
+            color (str): Color del jugador que acaba de mover
+        """
+        return float(equity(self.evaluar_lote(codificar_lote([pos], fuera_rival, color)))[0])
+
+    def elegir_jugada(self, game):
+        """
+        Elige la jugada cuya posición resultante tiene mayor equity.
+
+        Todas las posiciones candidatas se codifican y evalúan en un solo lote.
+
+        Args:
+            game (Game): Juego con los dados ya tirados (no se modifica)
+
+        Returns:
+            tuple: (jugada, equity) con la jugada como tupla de movimientos
+                   (desde, hasta); (None, None) si no hay jugadas posibles
+        """
+        color = game.get_jugador_actual().get_color()
+        rival = 'black' if color == 'white' else 'white'
+        pos = a_perspectiva(game.get_board().get_conteos(), len(game.get_bar(color)),
+                            len(game.get_home(color)), color)
+        jugadas = generar_jugadas_perspectiva(pos, game.get_movimientos_disponibles())
+        if not jugadas:
+            return None, None
+
+        finales = list(jugadas)
+        valores = equity(self.evaluar_lote(
+            codificar_lote(finales, len(game.get_home(rival)), color)))
+        mejor = int(np.argmax(valores))
+        tabla = _MOVIMIENTOS[color]
+        jugada = tuple(tabla[origen][destino] for origen, destino, _ in jugadas[finales[mejor]])
+        return jugada, float(valores[mejor])
@@ -0,0 +1,108 @@
+"""
+Simulación de partidas repartida entre procesos.
+
+Las partidas se reparten en bloques entre los núcleos con ProcessPoolExecutor.
+Cada partida usa una semilla derivada de la semilla maestra y de su índice, así
+que el resultado de una corrida es el mismo con cualquier cantidad de procesos.
+Los bloques terminados se van combinando a medida que llegan.
+
+Uso:
+    python -m core.parallel_simulation --partidas 100000 --procesos 8 --semilla 1
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .simulation import (
+    POLITICAS, acumular, combinar, estadisticas, jugar_partida, nuevo_resumen,
+    politica_aleatoria, semilla_partida
+)
+
+
+def jugar_bloque(inicio, fin, politica_white, politica_black, semilla):
+    """
+    Juega las partidas con índices en [inicio, fin) dentro de un proceso.
+
+    Returns:
+        dict: Resumen acumulado del bloque (ver simulation.nuevo_resumen)
+    """
+    resumen = nuevo_resumen()
+    for indice in range(inicio, fin):
+        acumular(resumen, jugar_partida(politica_white, politica_black,
+                                        semilla_partida(semilla, indice)))
+    return resumen
+
+
+def simular_en_paralelo(n_partidas, politica_white=politica_aleatoria,
+                        politica_black=politica_aleatoria, semilla=None, procesos=None,
+                        tamano_bloque=500, al_recibir_bloque=None):
+    """
+    Juega partidas en varios procesos y combina sus estadísticas.
+
+    Args:
+        n_partidas (int): Cantidad total de partidas
+        politica_white (callable): Política de las blancas (debe poder serializarse)
+        politica_black (callable): Política de las negras
+        semilla (int or None): Semilla maestra de la corrida
+        procesos (int or None): Cantidad de procesos; por defecto todos los núcleos
+        tamano_bloque (int): Partidas por bloque enviado a cada proceso
+        al_recibir_bloque (callable or None): Se llama con el resumen de cada
+            bloque a medida que termina, para ir mostrando o guardando resultados
+
+    Returns:
+        dict: Estadísticas de simulation.estadisticas, más 'tasa_victorias_white',
+              'tasa_gammons' e 'histograma_movimientos' (movimientos -> partidas)
+    """
+    if n_partidas <= 0:
+        raise ValueError("La cantidad de partidas debe ser positiva")
+    if tamano_bloque <= 0:
+        raise ValueError("El tamaño de bloque debe ser positivo")
+
+    procesos = procesos or os.cpu_count() or 1
+    resumen = nuevo_resumen()
+    inicio = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=procesos) as executor:
+        futuros = [
+            executor.submit(jugar_bloque, desde, min(desde + tamano_bloque, n_partidas),
+                            politica_white, politica_black, semilla)
+            for desde in range(0, n_partidas, tamano_bloque)
+        ]
+        for futuro in as_completed(futuros):
+            bloque = futuro.result()
+            combinar(resumen, bloque)
+            if al_recibir_bloque is not None:
+                al_recibir_bloque(bloque)
+
+    resultado = estadisticas(resumen, time.perf_counter() - inicio)
+    resultado['procesos'] = procesos
+    resultado['tasa_victorias_white'] = resumen['victorias']['white'] / n_partidas
+    resultado['tasa_gammons'] = sum(resumen['gammons'].values()) / n_partidas
+    resultado['histograma_movimientos'] = dict(sorted(resumen['histograma_movimientos'].items()))
+    return resultado
+
+
+def main(argumentos=None):
+    """Punto de entrada para lanzar corridas paralelas desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Simulación paralela de Backgammon")
+    parser.add_argument('--partidas', type=int, default=1000)
+    parser.add_argument('--procesos', type=int, default=None)
+    parser.add_argument('--bloque', type=int, default=500)
+    parser.add_argument('--blancas', choices=sorted(POLITICAS), default='aleatoria')
+    parser.add_argument('--negras', choices=sorted(POLITICAS), default='aleatoria')
+    parser.add_argument('--semilla', type=int, default=None)
+    args = parser.parse_args(argumentos)
+
+    resultado = simular_en_paralelo(args.partidas, POLITICAS[args.blancas],
+                                    POLITICAS[args.negras], args.semilla,
+                                    args.procesos, args.bloque)
+    for clave, valor in resultado.items():
+        if clave == 'histograma_movimientos':
+            continue
+        print(f"{clave}: {valor:.3f}" if isinstance(valor, float) else f"{clave}: {valor}")
+    return resultado
+
+
+if __name__ == '__main__':
+    main()
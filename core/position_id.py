@@ -0,0 +1,115 @@
+"""
+Identificador compacto y canónico de posiciones.
+
+La posición (fichas en cada punto, barra y fichas fuera de ambos colores, y a
+quién le toca mover) se empaqueta en 11 bytes fijos:
+
+    bit 0        turno (0 = blancas, 1 = negras)
+    bits 1-80    por cada color, sus 24 puntos en orden de pips para salir y
+                 luego la barra: n fichas se escriben como n unos y un cero
+
+Las fichas fuera no se guardan: son las que faltan para llegar a 15. El texto
+es el base64 de los 11 bytes sin relleno (15 caracteres).
+"""
+import base64
+
+from .board import punto_desde_pips
+
+FICHAS = 15
+BYTES_ID = 11
+LARGO_TEXTO = 15
+
+# Índice de conteos (0-23) de cada casilla de 1 a 24 pips para cada color
+_INDICES = {
+    color: tuple(punto_desde_pips(pips, color) - 1 for pips in range(1, 25))
+    for color in ('white', 'black')
+}
+
+
+def codificar(conteos, barra_white, barra_black, color_turno):
+    """
+    Empaqueta una posición en los 11 bytes del identificador.
+
+    Args:
+        conteos (sequence): 24 conteos con signo (positivo = blancas, negativo = negras)
+        barra_white (int): Fichas blancas en la barra
+        barra_black (int): Fichas negras en la barra
+        color_turno (str): Color del jugador al que le toca mover
+
+    Returns:
+        bytes: Identificador de 11 bytes
+    """
+    bits = 1 if color_turno == 'black' else 0
+    posicion = 1
+    for signo, color, barra in ((1, 'white', barra_white), (-1, 'black', barra_black)):
+        inicio = posicion
+        for indice in _INDICES[color]:
+            cantidad = conteos[indice] * signo
+            if cantidad > 0:
+                bits |= ((1 << cantidad) - 1) << posicion
+                posicion += cantidad
+            posicion += 1
+        bits |= ((1 << barra) - 1) << posicion
+        posicion += barra + 1
+        # 25 ceros separadores más una marca por ficha
+        if posicion - inicio > 25 + FICHAS:
+            raise ValueError("La posición tiene más de 15 fichas de un color")
+    return bits.to_bytes(BYTES_ID, 'little')
+
+
+def decodificar(identificador):
+    """
+    Desempaqueta un identificador de posición.
+
+    Args:
+        identificador (bytes): Identificador de 11 bytes
+
+    Returns:
+        tuple: (conteos de 24 puntos, barra {color: n}, fuera {color: n}, color_turno)
+    """
+    if len(identificador) != BYTES_ID:
+        raise ValueError(f"El identificador debe tener {BYTES_ID} bytes")
+    bits = int.from_bytes(identificador, 'little')
+    color_turno = 'black' if bits & 1 else 'white'
+    bits >>= 1
+
+    conteos = [0] * 24
+    barra = {}
+    fuera = {}
+    for signo, color in ((1, 'white'), (-1, 'black')):
+        total = 0
+        for casilla in range(25):
+            cantidad = 0
+            while bits & 1:
+                cantidad += 1
+                bits >>= 1
+            bits >>= 1
+            total += cantidad
+            if casilla == 24:
+                barra[color] = cantidad
+            elif cantidad:
+                indice = _INDICES[color][casilla]
+                if conteos[indice]:
+                    raise ValueError("Identificador inválido: dos colores en un punto")
+                conteos[indice] = signo * cantidad
+        if total > FICHAS:
+            raise ValueError("Identificador inválido: más de 15 fichas de un color")
+        fuera[color] = FICHAS - total
+    if bits:
+        raise ValueError("Identificador inválido: sobran bits")
+    return conteos, barra, fuera, color_turno
+
+
+def a_texto(identificador):
+    """Convierte el identificador en texto base64 (15 caracteres)."""
+    return base64.b64encode(identificador).decode('ascii').rstrip('=')
+
+
+def desde_texto(texto):
+    """Convierte el texto base64 en el identificador de 11 bytes."""
+    if len(texto) != LARGO_TEXTO:
+        raise ValueError(f"El identificador en texto debe tener {LARGO_TEXTO} caracteres")
+    try:
+        return base64.b64decode(texto + '=', validate=True)
+    except ValueError as error:
+        raise ValueError("El identificador no es base64 válido") from error
@@ -0,0 +1,221 @@
+"""
+Análisis de posiciones por rollouts de Monte Carlo.
+
+Desde una posición se juegan muchas partidas hasta el final (o hasta cortar
+después de K jugadas) con una política rápida, y se reporta la equity media con
+su intervalo de confianza. Para reducir la varianza, la primera tirada de cada
+prueba no es aleatoria: las pruebas recorren en orden las 36 tiradas posibles.
+
+Cada prueba depende solo de su índice y de la semilla, así que el resultado es
+el mismo con cualquier cantidad de procesos.
+
+Uso:
+    python -m core.rollout --pruebas 1296 --procesos 8 --truncar 20
+"""
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .dice import TIRADAS, Dice
+from .expectiminimax import FICHAS, dar_vuelta, evaluar_heuristica
+from .game import Game
+from .move_generator import a_perspectiva, generar_jugadas_perspectiva
+from .simulation import semilla_partida
+
+TAMANO_BLOQUE_DADOS = 128
+Z_95 = 1.96
+
+# Las 36 tiradas ordenadas que recorre la primera jugada: cada una de las 21
+# tiradas distintas aparece tantas veces como su peso
+PRIMERAS_TIRADAS = tuple(tirada.movimientos for tirada in TIRADAS for _ in range(tirada.peso))
+
+
+def politica_heuristica(finales, fuera_rival, rng):
+    """Elige la posición final con mejor evaluación estática (0 ply)."""
+    return max(finales, key=lambda final: evaluar_heuristica(final, fuera_rival))
+
+
+def politica_aleatoria(finales, fuera_rival, rng):
+    """Elige una posición final al azar."""
+    return finales[rng.randrange(len(finales))]
+
+
+POLITICAS = {
+    'heuristica': politica_heuristica,
+    'aleatoria': politica_aleatoria,
+}
+
+
+def jugar_prueba(pos, fuera_rival, indice, semilla=None, truncar=None,
+                 politica=politica_heuristica, rotar_primera_tirada=True):
+    """
+    Juega una prueba del rollout desde una posición con el jugador por tirar.
+
+    Args:
+        pos (sequence): Posición en perspectiva del jugador que tiene el turno
+        fuera_rival (int): Fichas que el rival ya sacó
+        indice (int): Índice de la prueba (elige la primera tirada y la semilla)
+        semilla (int or None): Semilla maestra del rollout
+        truncar (int or None): Jugadas tras las cuales se corta y se evalúa estáticamente
+        politica (callable): (finales, fuera_rival, rng) -> posición final elegida
+        rotar_primera_tirada (bool): Si la primera tirada recorre las 36 combinaciones
+
+    Returns:
+        float: Resultado para el jugador que tenía el turno (±1, ±2 por gammon,
+               o la evaluación estática si se truncó)
+    """
+    rng = random.Random(semilla_partida(semilla, indice))
+    dados = Dice(semilla=rng.getrandbits(64), bloque=TAMANO_BLOQUE_DADOS)
+    actual = list(pos)
+    signo = 1
+    jugada = 0
+
+    while True:
+        if truncar is not None and jugada >= truncar:
+            # La evaluación estática es para quien acaba de mover, es decir el rival
+            return -signo * evaluar_heuristica(dar_vuelta(actual, fuera_rival), actual[0])
+
+        if jugada == 0 and rotar_primera_tirada:
+            movimientos = PRIMERAS_TIRADAS[indice % len(PRIMERAS_TIRADAS)]
+        else:
+            movimientos = dados.tirar()
+
+        jugadas = generar_jugadas_perspectiva(actual, movimientos)
+        if jugadas:
+            final = politica(list(jugadas), fuera_rival, rng)
+            if final[0] == FICHAS:
+                return signo * (1 if fuera_rival else 2)
+        else:
+            final = tuple(actual)
+
+        actual, fuera_rival = dar_vuelta(final, fuera_rival), final[0]
+        signo = -signo
+        jugada += 1
+
+
+def jugar_bloque(pos, fuera_rival, inicio, fin, semilla, truncar, politica,
+                 rotar_primera_tirada):
+    """
+    Juega las pruebas con índices en [inicio, fin) y acumula sus resultados.
+
+    Returns:
+        dict: Pruebas, suma, suma de cuadrados, victorias y gammons de cada lado
+    """
+    acumulado = {'pruebas': 0, 'suma': 0.0, 'suma_cuadrados': 0.0,
+                 'victorias': 0, 'gammons_ganados': 0, 'gammons_perdidos': 0}
+    for indice in range(inicio, fin):
+        resultado = jugar_prueba(pos, fuera_rival, indice, semilla, truncar, politica,
+                                 rotar_primera_tirada)
+        acumulado['pruebas'] += 1
+        acumulado['suma'] += resultado
+        acumulado['suma_cuadrados'] += resultado * resultado
+        acumulado['victorias'] += resultado > 0
+        acumulado['gammons_ganados'] += resultado == 2
+        acumulado['gammons_perdidos'] += resultado == -2
+    return acumulado
+
+
+def rollout(game, pruebas=1296, truncar=None, politica=politica_heuristica, semilla=None,
+            procesos=1, tamano_bloque=108, rotar_primera_tirada=True):
+    """
+    Estima la equity de la posición de un juego para el jugador que tiene el turno.
+
+    La posición se juega desde antes de tirar: los dados ya tirados se ignoran.
+
+    Args:
+        game (Game): Juego a analizar (no se modifica)
+        pruebas (int): Cantidad de partidas a jugar; múltiplos de 36 aprovechan la rotación
+        truncar (int or None): Cortar cada prueba después de esta cantidad de jugadas
+        politica (callable): Política de ambos jugadores (debe poder serializarse)
+        semilla (int or None): Semilla maestra para que el análisis sea reproducible
+        procesos (int or None): Procesos a usar; 1 juega en el proceso actual y
+                                None usa todos los núcleos
+        tamano_bloque (int): Pruebas por bloque enviado a cada proceso
+        rotar_primera_tirada (bool): Recorrer las 36 primeras tiradas en orden
+
+    Returns:
+        dict: equity, desviacion, error_estandar, intervalo_95 (mínimo, máximo),
+              fracción de pruebas favorables ('victorias') y de gammons,
+              pruebas, procesos y segundos
+    """
+    if pruebas <= 0:
+        raise ValueError("La cantidad de pruebas debe ser positiva")
+    if truncar is not None and truncar < 0:
+        raise ValueError("La truncación no puede ser negativa")
+    if tamano_bloque <= 0:
+        raise ValueError("El tamaño de bloque debe ser positivo")
+
+    color = game.get_jugador_actual().get_color()
+    rival = 'black' if color == 'white' else 'white'
+    pos = tuple(a_perspectiva(game.get_board().get_conteos(), len(game.get_bar(color)),
+                              len(game.get_home(color)), color))
+    fuera_rival = len(game.get_home(rival))
+    argumentos = (semilla, truncar, politica, rotar_primera_tirada)
+
+    inicio = time.perf_counter()
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1:
+        total = jugar_bloque(pos, fuera_rival, 0, pruebas, *argumentos)
+    else:
+        total = None
+        with ProcessPoolExecutor(max_workers=procesos) as executor:
+            futuros = [
+                executor.submit(jugar_bloque, pos, fuera_rival, desde,
+                                min(desde + tamano_bloque, pruebas), *argumentos)
+                for desde in range(0, pruebas, tamano_bloque)
+            ]
+            for futuro in as_completed(futuros):
+                bloque = futuro.result()
+                if total is None:
+                    total = bloque
+                else:
+                    for clave, valor in bloque.items():
+                        total[clave] += valor
+
+    media = total['suma'] / pruebas
+    varianza = max(total['suma_cuadrados'] / pruebas - media * media, 0.0)
+    if pruebas > 1:
+        varianza *= pruebas / (pruebas - 1)
+    desviacion = math.sqrt(varianza)
+    error = desviacion / math.sqrt(pruebas)
+    return {
+        'pruebas': pruebas,
+        'equity': media,
+        'desviacion': desviacion,
+        'error_estandar': error,
+        'intervalo_95': (media - Z_95 * error, media + Z_95 * error),
+        'victorias': total['victorias'] / pruebas,
+        'gammons_ganados': total['gammons_ganados'] / pruebas,
+        'gammons_perdidos': total['gammons_perdidos'] / pruebas,
+        'procesos': procesos,
+        'segundos': time.perf_counter() - inicio,
+    }
+
+
+def main(argumentos=None):
+    """Punto de entrada para analizar la posición inicial desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Rollout de la posición inicial")
+    parser.add_argument('--pruebas', type=int, default=1296)
+    parser.add_argument('--procesos', type=int, default=None)
+    parser.add_argument('--truncar', type=int, default=None)
+    parser.add_argument('--politica', choices=sorted(POLITICAS), default='heuristica')
+    parser.add_argument('--semilla', type=int, default=None)
+    args = parser.parse_args(argumentos)
+
+    game = Game()
+    game.iniciar_juego("Blancas", "Negras")
+    resultado = rollout(game, args.pruebas, args.truncar, POLITICAS[args.politica],
+                        args.semilla, args.procesos)
+    for clave, valor in resultado.items():
+        if isinstance(valor, tuple):
+            print(f"{clave}: ({valor[0]:.4f}, {valor[1]:.4f})")
+        else:
+            print(f"{clave}: {valor:.4f}" if isinstance(valor, float) else f"{clave}: {valor}")
+    return resultado
+
+
+if __name__ == '__main__':
+    main()
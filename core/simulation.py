@@ -0,0 +1,257 @@
+"""
+Simulación de partidas completas sin interfaz (self-play).
+
+Juega partidas de principio a fin sobre core.game.Game con políticas
+intercambiables y reporta estadísticas de rendimiento. Se usa para probar
+cambios de reglas bajo carga y para generar datos de entrenamiento.
+
+Uso:
+    python -m core.simulation --partidas 1000 --blancas pips --negras aleatoria
+"""
+import argparse
+import random
+import time
+from collections import Counter
+
+from .compact_board import CompactBoard
+from .dice import Dice
+from .expectiminimax import FICHAS
+from .game import Game
+from .game_record import GameRecord, GameRecordWriter, Turno
+from .move_generator import (
+    _MOVIMIENTOS, BARRA, a_perspectiva, generar_jugadas_perspectiva
+)
+
+# Tiradas sorteadas de una vez por partida (una partida dura unas 100 tiradas)
+TAMANO_BLOQUE_DADOS = 128
+
+
+def politica_aleatoria(game, rng):
+    """
+    Elige una jugada legal al azar.
+
+    Usa Game.jugada_aleatoria, que elige movimiento por movimiento sin generar
+    todas las jugadas completas (no es uniforme entre las jugadas distintas).
+    """
+    return game.jugada_aleatoria(rng)
+
+
+def politica_pips(game, rng):
+    """
+    Elige la jugada que deja la mayor ventaja de pips (pips rival - pips propios).
+
+    Las jugadas de una tirada avanzan los mismos pips (entrar desde la barra
+    cuenta como salir del punto 25), salvo al sacar fichas con un dado mayor que
+    la distancia, que avanza solo lo que faltaba. Por eso en la práctica prioriza
+    capturar y, al sacar, las jugadas que aprovechan todo el dado; a igual
+    ventaja prefiere la jugada que deja menos fichas sueltas.
+    Las candidatas se comparan como posiciones en perspectiva, sin tocar el juego.
+    """
+    color = game.get_jugador_actual().get_color()
+    rival = 'white' if color == 'black' else 'black'
+    pos = a_perspectiva(game.get_board().get_conteos(), len(game.get_bar(color)),
+                        len(game.get_home(color)), color)
+    fuera_rival = len(game.get_home(rival))
+    mejor, mejor_valor = None, None
+    for final, camino in generar_jugadas_perspectiva(pos, game.get_movimientos_disponibles()).items():
+        mis_pips = 25 * final[BARRA]
+        rival_pips = 0
+        rival_en_tablero = 0
+        sueltas = 0
+        for pips, conteo in enumerate(final[1:BARRA], 1):
+            if conteo > 0:
+                mis_pips += pips * conteo
+                sueltas += conteo == 1
+            elif conteo < 0:
+                rival_pips -= (25 - pips) * conteo
+                rival_en_tablero -= conteo
+        rival_pips += 25 * (FICHAS - fuera_rival - rival_en_tablero)
+        valor = (rival_pips - mis_pips, -sueltas)
+        if mejor_valor is None or valor > mejor_valor:
+            mejor, mejor_valor = camino, valor
+    if mejor is None:
+        return ()
+    tabla = _MOVIMIENTOS[color]
+    return tuple(tabla[origen][destino] for origen, destino, _ in mejor)
+
+
+POLITICAS = {
+    'aleatoria': politica_aleatoria,
+    'pips': politica_pips,
+}
+
+
+def semilla_partida(semilla, indice):
+    """
+    Deriva la semilla de una partida a partir de la semilla maestra y su índice.
+
+    Cada partida depende solo de su propia semilla, así que los resultados son
+    los mismos sin importar cómo se repartan las partidas entre procesos.
+    """
+    if semilla is None:
+        return None
+    return random.Random(f"{semilla}:{indice}").getrandbits(63)
+
+
+def jugar_partida(politica_white, politica_black, semilla=None, grabar=False):
+    """
+    Juega una partida completa entre dos políticas.
+
+    Args:
+        politica_white (callable): Política de las blancas (game, rng) -> jugada, con
+            los dados ya tirados; la jugada es una tupla vacía si no se puede mover
+        politica_black (callable): Política de las negras
+        semilla (int or None): Semilla de la partida (dados y decisiones de las políticas)
+        grabar (bool): Si se agrega al resultado el registro de la partida
+
+    Returns:
+        dict: ganador ('white'/'black'), gammon (bool), turnos y movimientos de fichas;
+              con grabar=True también 'registro' (game_record.GameRecord)
+    """
+    rng = random.Random(semilla)
+    # Los dados tienen su propio flujo, sorteado por bloques
+    dados = Dice(semilla=rng.getrandbits(64), bloque=TAMANO_BLOQUE_DADOS)
+
+    game = Game(CompactBoard)
+    game.iniciar_juego("Blancas", "Negras", dados)
+    politicas = (politica_white, politica_black)
+    primer_color = game.get_jugador_actual().get_color()
+    registro = [] if grabar else None
+    turnos = 0
+    movimientos = 0
+
+    while not game.esta_terminado():
+        game.tirar_dados()
+        jugada = politicas[game.get_turno_actual()](game, rng)
+        if jugada:
+            game.aplicar(jugada)
+            movimientos += len(jugada)
+        if registro is not None:
+            registro.append(Turno(*dados.get_valores(), jugada))
+        game.cambiar_turno()
+        turnos += 1
+
+    ganador = game.get_ganador().get_color()
+    perdedor = 'white' if ganador == 'black' else 'black'
+    resultado = {
+        'ganador': ganador,
+        'gammon': not game.get_home(perdedor),
+        'turnos': turnos,
+        'movimientos': movimientos,
+    }
+    if registro is not None:
+        resultado['registro'] = GameRecord(semilla, ("Blancas", "Negras"), primer_color,
+                                           registro, ganador, resultado['gammon'])
+    return resultado
+
+
+def nuevo_resumen():
+    """Retorna un resumen vacío para acumular resultados de partidas."""
+    return {
+        'partidas': 0,
+        'victorias': {'white': 0, 'black': 0},
+        'gammons': {'white': 0, 'black': 0},
+        'turnos': 0,
+        'movimientos': 0,
+        'histograma_movimientos': Counter(),
+    }
+
+
+def acumular(resumen, resultado):
+    """Suma el resultado de una partida a un resumen."""
+    resumen['partidas'] += 1
+    resumen['victorias'][resultado['ganador']] += 1
+    resumen['gammons'][resultado['ganador']] += resultado['gammon']
+    resumen['turnos'] += resultado['turnos']
+    resumen['movimientos'] += resultado['movimientos']
+    resumen['histograma_movimientos'][resultado['movimientos']] += 1
+
+
+def combinar(resumen, otro):
+    """Suma a un resumen los totales de otro (por ejemplo, el de otro proceso)."""
+    resumen['partidas'] += otro['partidas']
+    for color in ('white', 'black'):
+        resumen['victorias'][color] += otro['victorias'][color]
+        resumen['gammons'][color] += otro['gammons'][color]
+    resumen['turnos'] += otro['turnos']
+    resumen['movimientos'] += otro['movimientos']
+    resumen['histograma_movimientos'].update(otro['histograma_movimientos'])
+
+
+def estadisticas(resumen, segundos):
+    """
+    Convierte un resumen acumulado en las estadísticas que se reportan.
+
+    Returns:
+        dict: Victorias y gammons por color, turnos y movimientos promedio,
+              segundos totales y partidas por segundo
+    """
+    partidas = resumen['partidas']
+    return {
+        'partidas': partidas,
+        'victorias_white': resumen['victorias']['white'],
+        'victorias_black': resumen['victorias']['black'],
+        'gammons_white': resumen['gammons']['white'],
+        'gammons_black': resumen['gammons']['black'],
+        'turnos_promedio': resumen['turnos'] / partidas,
+        'movimientos_promedio': resumen['movimientos'] / partidas,
+        'segundos': segundos,
+        'partidas_por_segundo': partidas / segundos if segundos > 0 else float('inf'),
+    }
+
+
+def simular(n_partidas, politica_white=politica_aleatoria, politica_black=politica_aleatoria,
+            semilla=None, ruta_registro=None):
+    """
+    Juega varias partidas y reporta estadísticas de resultado y rendimiento.
+
+    Args:
+        n_partidas (int): Cantidad de partidas a jugar
+        politica_white (callable): Política de las blancas
+        politica_black (callable): Política de las negras
+        semilla (int or None): Semilla maestra para que la simulación sea reproducible
+        ruta_registro (str or None): Archivo donde se agregan las partidas jugadas
+            (ver core.game_record)
+
+    Returns:
+        dict: Estadísticas de la simulación (ver estadisticas())
+    """
+    if n_partidas <= 0:
+        raise ValueError("La cantidad de partidas debe ser positiva")
+
+    resumen = nuevo_resumen()
+    escritor = GameRecordWriter(ruta_registro) if ruta_registro is not None else None
+    inicio = time.perf_counter()
+    try:
+        for indice in range(n_partidas):
+            resultado = jugar_partida(politica_white, politica_black,
+                                      semilla_partida(semilla, indice), escritor is not None)
+            acumular(resumen, resultado)
+            if escritor is not None:
+                escritor.escribir(resultado['registro'])
+    finally:
+        if escritor is not None:
+            escritor.cerrar()
+    return estadisticas(resumen, time.perf_counter() - inicio)
+
+
+def main(argumentos=None):
+    """Punto de entrada para medir el rendimiento desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Simulación de partidas de Backgammon")
+    parser.add_argument('--partidas', type=int, default=100)
+    parser.add_argument('--blancas', choices=sorted(POLITICAS), default='aleatoria')
+    parser.add_argument('--negras', choices=sorted(POLITICAS), default='aleatoria')
+    parser.add_argument('--semilla', type=int, default=None)
+    parser.add_argument('--registro', default=None,
+                        help="Archivo binario donde se agregan las partidas jugadas")
+    args = parser.parse_args(argumentos)
+
+    resultado = simular(args.partidas, POLITICAS[args.blancas], POLITICAS[args.negras],
+                        args.semilla, args.registro)
+    for clave, valor in resultado.items():
+        print(f"{clave}: {valor:.2f}" if isinstance(valor, float) else f"{clave}: {valor}")
+    return resultado
+
+
+if __name__ == '__main__':
+    main()
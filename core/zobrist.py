@@ -0,0 +1,110 @@
+"""
+Claves Zobrist de 64 bits para posiciones de backgammon.
+
+La clave de una posición es el XOR de un número aleatorio por cada punto según
+su conteo con signo, por la cantidad de fichas en la barra y fuera de cada color
+y por el turno. Al mover una ficha solo cambian dos o tres términos, así que la
+clave se puede actualizar en O(1) en lugar de recalcularse.
+"""
+import random
+
+MAX_FICHAS = 15
+
+# Semilla fija: las claves tienen que ser las mismas en todos los procesos
+_generador = random.Random(0x5EED_BAC6)
+
+
+def _tabla(cantidad):
+    """Genera una tupla de claves aleatorias de 64 bits (la de conteo 0 es 0)."""
+    return (0,) + tuple(_generador.getrandbits(64) for _ in range(cantidad))
+
+
+# Por punto, índice = conteo con signo + 15 (de -15 a 15); el conteo 0 vale 0
+_PUNTOS = tuple(
+    tuple(_generador.getrandbits(64) for _ in range(MAX_FICHAS))
+    + (0,)
+    + tuple(_generador.getrandbits(64) for _ in range(MAX_FICHAS))
+    for _ in range(24)
+)
+_BARRA = {'white': _tabla(MAX_FICHAS), 'black': _tabla(MAX_FICHAS)}
+_FUERA = {'white': _tabla(MAX_FICHAS), 'black': _tabla(MAX_FICHAS)}
+TURNO_BLACK = _generador.getrandbits(64)
+
+# Las mismas claves indexadas por la posición en perspectiva (ver core.move_generator):
+# para las blancas el índice i es el punto 25 - i, para las negras el punto i con
+# el signo del conteo invertido (la tabla del punto se recorre al revés)
+_PUNTOS_PERSPECTIVA = {
+    'white': tuple(_PUNTOS[24 - i] for i in range(1, 25)),
+    'black': tuple(_PUNTOS[i - 1][::-1] for i in range(1, 25)),
+}
+
+
+def clave_punto(posicion, conteo):
+    """Retorna la clave de un punto (1-24) con un conteo con signo."""
+    return _PUNTOS[posicion - 1][conteo + MAX_FICHAS]
+
+
+def clave_barra(color, cantidad):
+    """Retorna la clave de tener cierta cantidad de fichas de un color en la barra."""
+    return _BARRA[color][cantidad]
+
+
+def clave_fuera(color, cantidad):
+    """Retorna la clave de tener cierta cantidad de fichas de un color fuera."""
+    return _FUERA[color][cantidad]
+
+
+def calcular_clave(conteos, barra, fuera, color_turno):
+    """
+    Calcula la clave completa de una posición desde cero.
+
+    Args:
+        conteos (list): 24 conteos con signo (positivo = blancas, negativo = negras)
+        barra (dict): Cantidad de fichas en la barra por color
+        fuera (dict): Cantidad de fichas fuera del tablero por color
+        color_turno (str): Color del jugador que mueve
+
+    Returns:
+        int: Clave de 64 bits
+    """
+    clave = 0
+    for i, conteo in enumerate(conteos):
+        clave ^= _PUNTOS[i][conteo + MAX_FICHAS]
+    for color in ('white', 'black'):
+        clave ^= _BARRA[color][barra[color]] ^ _FUERA[color][fuera[color]]
+    if color_turno == 'black':
+        clave ^= TURNO_BLACK
+    return clave
+
+
+def clave_perspectiva(pos, fuera_rival, color):
+    """
+    Calcula la clave de una posición en perspectiva con el rival por mover.
+
+    Es la misma clave que Game.get_hash() tendría después de jugar esa posición
+    y cambiar el turno, así que sirve para buscar posiciones de la búsqueda en
+    tablas indexadas por la clave del juego.
+
+    Args:
+        pos (sequence): Posición de 26 enteros del jugador que acaba de mover
+        fuera_rival (int): Fichas que el rival ya sacó
+        color (str): Color del jugador que acaba de mover
+
+    Returns:
+        int: Clave de 64 bits
+    """
+    rival = 'black' if color == 'white' else 'white'
+    tabla = _PUNTOS_PERSPECTIVA[color]
+    clave = 0
+    rival_en_tablero = 0
+    for i in range(1, 25):
+        conteo = pos[i]
+        clave ^= tabla[i - 1][conteo + MAX_FICHAS]
+        if conteo < 0:
+            rival_en_tablero -= conteo
+    rival_barra = MAX_FICHAS - fuera_rival - rival_en_tablero
+    clave ^= (_BARRA[color][pos[25]] ^ _FUERA[color][pos[0]] ^
+              _BARRA[rival][rival_barra] ^ _FUERA[rival][fuera_rival])
+    if rival == 'black':
+        clave ^= TURNO_BLACK
+    return clave
@@ -4,10 +4,16 @@ Renderer para el tablero de Backgammon.
 
 import pygame
 from .constants import *
+from .font_cache import get_font, render_text
 
 
 class BoardRenderer:
-    """Renderiza el tablero de backgammon."""
+    """
+    Renderiza el tablero de backgammon.
+    
+    El tablero no cambia durante la partida: se dibuja una sola vez en una
+    superficie fuera de pantalla y en cada frame solo se copia con un blit.
+    """
     
     def __init__(self, surface):
         """
@@ -17,26 +23,59 @@ class BoardRenderer:
             surface: Superficie de pygame donde dibujar
         """
         self.surface = surface
-        self.font = pygame.font.Font(None, 20)
-        self.font_large = pygame.font.Font(None, 32)
+        self.font = get_font(20)
+        self.font_large = get_font(32)
+        self.font_home = get_font(24)
+        self._static_surface = None
+    
+    def set_surface(self, surface):
+        """
+        Cambia la superficie destino (por ejemplo, al redimensionar la ventana).
+        
+        Args:
+            surface: Nueva superficie de pygame donde dibujar
+        """
+        self.surface = surface
+        self.invalidate()
+    
+    def invalidate(self):
+        """Descarta el tablero cacheado; se vuelve a dibujar en el próximo frame."""
+        self._static_surface = None
     
     def draw_board(self):
         """Dibuja el tablero completo."""
-        self.surface.fill(COLOR_BG)
-        self._draw_background()
-        self._draw_barra()
-        self._draw_puntos()
-        self._draw_labels()
-        self._draw_home_areas()
+        if (self._static_surface is None or
+                self._static_surface.get_size() != self.surface.get_size()):
+            self._static_surface = self._build_static_surface()
+        self.surface.blit(self._static_surface, (0, 0))
     
-    def _draw_background(self):
+    def _build_static_surface(self):
+        """
+        Dibuja la capa fija del tablero en una superficie fuera de pantalla.
+        
+        Returns:
+            pygame.Surface: Fondo, barra, puntos, etiquetas y áreas HOME
+        """
+        static = pygame.Surface(self.surface.get_size())
+        if pygame.display.get_surface() is not None:
+            # Mismo formato de píxel que la pantalla: el blit no convierte nada
+            static = static.convert()
+        static.fill(COLOR_BG)
+        self._draw_background(static)
+        self._draw_barra(static)
+        self._draw_puntos(static)
+        self._draw_labels(static)
+        self._draw_home_areas(static)
+        return static
+    
+    def _draw_background(self, surface):
         """Dibuja el fondo del tablero."""
         # Tablero principal
         board_width = 12 * PUNTO_WIDTH + BARRA_WIDTH
         board_height = 2 * PUNTO_HEIGHT
         
         pygame.draw.rect(
-            self.surface,
+            surface,
             (101, 67, 33),
             (BOARD_MARGIN, BOARD_MARGIN, board_width, board_height),
             border_radius=10
@@ -44,19 +83,19 @@ class BoardRenderer:
         
         # Borde decorativo
         pygame.draw.rect(
-            self.surface,
+            surface,
             (139, 69, 19),
             (BOARD_MARGIN - 5, BOARD_MARGIN - 5, board_width + 10, board_height + 10),
             5,
             border_radius=10
         )
     
-    def _draw_puntos(self):
+    def _draw_puntos(self, surface):
         """Dibuja los 24 puntos triangulares del tablero."""
         for i in range(24):
-            self._draw_punto(i)
+            self._draw_punto(surface, i)
     
-    def _draw_punto(self, punto_num):
+    def _draw_punto(self, surface, punto_num):
         """
         Dibuja un punto triangular.
         
@@ -65,6 +104,7 @@ class BoardRenderer:
         Abajo:  12 11 10  9  8  7 | BAR |  6  5  4  3  2  1
         
         Args:
+            surface: Superficie donde dibujar
             punto_num: Número del punto (0-23, correspondiente a puntos 1-24)
         """
         punto_real = punto_num + 1  # punto_num es 0-23, punto_real es 1-24
@@ -112,25 +152,30 @@ class BoardRenderer:
                 (x + PUNTO_WIDTH // 2, y_base - PUNTO_HEIGHT)
             ]
         
-        pygame.draw.polygon(self.surface, color, points)
-        pygame.draw.polygon(self.surface, (80, 50, 20), points, 2)
+        pygame.draw.polygon(surface, color, points)
+        pygame.draw.polygon(surface, (80, 50, 20), points, 2)
     
-    def _draw_barra(self):
+    def _draw_barra(self, surface):
         """Dibuja la barra central."""
         x = BOARD_MARGIN + 6 * PUNTO_WIDTH
         pygame.draw.rect(
-            self.surface,
+            surface,
             COLOR_BARRA,
             (x, BOARD_MARGIN, BARRA_WIDTH, 2 * PUNTO_HEIGHT)
         )
         
         # Texto "BAR"
-        text = self.font_large.render("BAR", True, COLOR_TEXTO)
+        text = render_text(self.font_large, "BAR", COLOR_TEXTO)
         text_rect = text.get_rect(center=(x + BARRA_WIDTH // 2, BOARD_MARGIN + PUNTO_HEIGHT))
-        self.surface.blit(text, text_rect)
+        surface.blit(text, text_rect)
     
-    def _draw_labels(self):
+    def _draw_labels(self, surface):
         """Dibuja las etiquetas de los puntos."""
+        # Fondo semi-transparente, el mismo para todas las etiquetas
+        bg_surface = pygame.Surface((30, 25))
+        bg_surface.set_alpha(150)
+        bg_surface.fill((50, 50, 50))
+        
         for i in range(24):
             punto_num = i + 1
             pos = self.get_punto_position(i)
@@ -141,19 +186,15 @@ class BoardRenderer:
             else:
                 y_offset = 35
             
-            label = self.font.render(str(punto_num), True, (255, 255, 200))
+            label = render_text(self.font, str(punto_num), (255, 255, 200))
             label_rect = label.get_rect(center=(pos[0], pos[1] + y_offset))
             
-            # Fondo semi-transparente
-            bg_surface = pygame.Surface((30, 25))
-            bg_surface.set_alpha(150)
-            bg_surface.fill((50, 50, 50))
             bg_rect = bg_surface.get_rect(center=label_rect.center)
-            self.surface.blit(bg_surface, bg_rect)
+            surface.blit(bg_surface, bg_rect)
             
-            self.surface.blit(label, label_rect)
+            surface.blit(label, label_rect)
     
-    def _draw_home_areas(self):
+    def _draw_home_areas(self, surface):
         """Dibuja las áreas HOME para fichas sacadas."""
         board_width = 12 * PUNTO_WIDTH + BARRA_WIDTH
         
@@ -163,24 +204,22 @@ class BoardRenderer:
         home_y_bottom = BOARD_MARGIN + 2 * PUNTO_HEIGHT - HOME_HEIGHT - 20
         
         # HOME superior (blancas) - CORREGIDO
-        pygame.draw.rect(self.surface, (255, 255, 255), 
+        pygame.draw.rect(surface, (255, 255, 255), 
                         (home_x, home_y_top, HOME_WIDTH, HOME_HEIGHT))
-        pygame.draw.rect(self.surface, COLOR_PUNTO_CLARO, 
+        pygame.draw.rect(surface, COLOR_PUNTO_CLARO, 
                         (home_x, home_y_top, HOME_WIDTH, HOME_HEIGHT), 3)
         
         # HOME inferior (negras) - CORREGIDO
-        pygame.draw.rect(self.surface, (255, 255, 255), 
+        pygame.draw.rect(surface, (255, 255, 255), 
                         (home_x, home_y_bottom, HOME_WIDTH, HOME_HEIGHT))
-        pygame.draw.rect(self.surface, COLOR_PUNTO_OSCURO, 
+        pygame.draw.rect(surface, COLOR_PUNTO_OSCURO, 
                         (home_x, home_y_bottom, HOME_WIDTH, HOME_HEIGHT), 3)
         
         # Etiquetas
-        font = pygame.font.Font(None, 24)
-        label_top = font.render("HOME", True, (50, 50, 50))
-        label_bottom = font.render("HOME", True, (50, 50, 50))
+        label = render_text(self.font_home, "HOME", (50, 50, 50))
         
-        self.surface.blit(label_top, (home_x + 25, home_y_top - 25))
-        self.surface.blit(label_bottom, (home_x + 25, home_y_bottom + HOME_HEIGHT + 5))
+        surface.blit(label, (home_x + 25, home_y_top - 25))
+        surface.blit(label, (home_x + 25, home_y_bottom + HOME_HEIGHT + 5))
     
     def get_punto_position(self, punto_num):
         """
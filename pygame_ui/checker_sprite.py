@@ -4,9 +4,10 @@ Sprite para las fichas de Backgammon.
 
 import pygame
 from .constants import *
+from .dirty_rect import DirtyMixin
 
 
-class CheckerSprite:
+class CheckerSprite(DirtyMixin):
     """Sprite para una ficha de backgammon."""
     
     def __init__(self, color, position, punto_num=None):
@@ -25,18 +26,32 @@ class CheckerSprite:
         self.offset_x = 0
         self.offset_y = 0
         self.original_position = list(position)
+        self.highlight = False
+        self.mark_dirty()
     
-    def draw(self, surface, highlight=False):
+    def get_rect(self):
+        """Retorna el rectángulo que ocupa la ficha, incluido el halo."""
+        size = 2 * (FICHA_RADIUS + 4) + 2
+        rect = pygame.Rect(0, 0, size, size)
+        rect.center = (int(self.position[0]), int(self.position[1]))
+        return rect
+    
+    def set_highlight(self, highlight):
+        """Indica si la ficha debe resaltarse; la marca para redibujar si cambia."""
+        if highlight != self.highlight:
+            self.highlight = highlight
+            self.mark_dirty()
+    
+    def draw(self, surface):
         """
         Dibuja la ficha.
         
         Args:
             surface: Superficie donde dibujar
-            highlight: Si debe resaltarse la ficha
         """
         color = COLOR_FICHA_WHITE if self.color == 'white' else COLOR_FICHA_BLACK
         
-        if highlight:
+        if self.highlight:
             # Dibujar halo dorado
             pygame.draw.circle(surface, COLOR_HIGHLIGHT, 
                              (int(self.position[0]), int(self.position[1])), 
@@ -74,8 +89,10 @@ class CheckerSprite:
     def update_drag(self, mouse_pos):
         """Actualiza la posición durante el arrastre."""
         if self.dragging:
+            self.mark_dirty()
             self.position[0] = mouse_pos[0] + self.offset_x
             self.position[1] = mouse_pos[1] + self.offset_y
+            self.mark_dirty()
     
     def end_drag(self):
         """Finaliza el arrastre."""
@@ -83,7 +100,9 @@ class CheckerSprite:
     
     def return_to_original(self):
         """Devuelve la ficha a su posición original."""
+        self.mark_dirty()
         self.position = list(self.original_position)
+        self.mark_dirty()
         self.dragging = False
     
     def move_to(self, position, punto_num=None):
@@ -94,7 +113,9 @@ class CheckerSprite:
             position: tupla (x, y)
             punto_num: nuevo número de punto
         """
+        self.mark_dirty()
         self.position = list(position)
         self.original_position = list(position)
+        self.mark_dirty()
         if punto_num is not None:
             self.punto_num = punto_num
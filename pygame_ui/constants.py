@@ -6,6 +6,7 @@ Constantes para la interfaz gráfica de Pygame.
 WINDOW_WIDTH = 1400
 WINDOW_HEIGHT = 900
 FPS = 60
+CURSOR_BLINK_MS = 500  # Parpadeo del cursor de los campos de texto
 
 # Colores
 COLOR_BG = (255, 255, 255)  # Fondo blanco en lugar de verde
@@ -0,0 +1,34 @@
+"""
+Seguimiento de las regiones de pantalla que cambiaron entre frames.
+"""
+
+
+class DirtyMixin:
+    """
+    Base para elementos que avisan cuándo hay que volver a dibujarlos.
+
+    Cada elemento acumula en 'dirty_rect' la región que ocupaba y la que ocupa
+    después de cambiar; el loop principal la retira con pop_dirty_rect() y solo
+    vuelve a dibujar y actualizar esas regiones de la pantalla.
+    """
+
+    dirty_rect = None
+
+    def get_rect(self):
+        """Retorna el rectángulo que ocupa el elemento en pantalla."""
+        raise NotImplementedError
+
+    def mark_dirty(self):
+        """Agrega la región actual del elemento a la región a redibujar."""
+        rect = self.get_rect()
+        self.dirty_rect = rect if self.dirty_rect is None else self.dirty_rect.union(rect)
+
+    def pop_dirty_rect(self):
+        """
+        Retorna la región a redibujar y la limpia.
+
+        Returns:
+            pygame.Rect or None: Región cambiada, o None si no cambió nada
+        """
+        rect, self.dirty_rect = self.dirty_rect, None
+        return rect
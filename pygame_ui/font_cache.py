@@ -0,0 +1,70 @@
+"""
+Registro compartido de fuentes y caché de textos renderizados.
+
+Crear un pygame.font.Font lee y prepara el archivo de la fuente, y render()
+rasteriza los glifos en cada llamada: hacerlo en cada frame es lo más caro de
+dibujar la interfaz. Las fuentes se crean una sola vez por (nombre, tamaño) y
+los textos renderizados se guardan por (fuente, texto, color), descartando los
+menos usados cuando la caché se llena.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+TEXT_CACHE_SIZE = 512  # Textos renderizados que se guardan como máximo
+
+_fonts = {}
+_texts = OrderedDict()
+
+
+def get_font(size, name=None):
+    """
+    Retorna la fuente compartida de un tamaño.
+
+    Args:
+        size: Tamaño en puntos
+        name: Archivo de la fuente; None para la fuente por defecto de pygame
+
+    Returns:
+        pygame.font.Font: La misma instancia en cada llamada con iguales argumentos
+    """
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.Font(name, size)
+    return font
+
+
+def render_text(font, text, color, antialias=True):
+    """
+    Renderiza un texto o lo retorna de la caché.
+
+    La superficie retornada es compartida: se puede copiar con blit pero no
+    modificar.
+
+    Args:
+        font: Fuente, preferentemente obtenida con get_font
+        text: Texto a renderizar
+        color: Color del texto
+        antialias: Si se suavizan los bordes
+
+    Returns:
+        pygame.Surface: El texto renderizado
+    """
+    key = (font, text, tuple(color), antialias)
+    surface = _texts.get(key)
+    if surface is not None:
+        _texts.move_to_end(key)
+        return surface
+
+    surface = _texts[key] = font.render(text, antialias, color)
+    if len(_texts) > TEXT_CACHE_SIZE:
+        _texts.popitem(last=False)
+    return surface
+
+
+def clear_cache():
+    """Descarta las fuentes y los textos guardados (por ejemplo, al cerrar pygame)."""
+    _fonts.clear()
+    _texts.clear()
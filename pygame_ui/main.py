@@ -7,6 +7,7 @@ import sys
 from core.game import Game
 from .constants import *
 from .board_renderer import BoardRenderer
+from .font_cache import clear_cache, get_font, render_text
 from .checker_sprite import CheckerSprite
 from .ui_elements import Button, DiceDisplay, InfoPanel, TextInput
 
@@ -39,6 +40,10 @@ class BackgammonPygame:
         self._create_buttons()
         self._create_start_screen_elements()
         
+        # Regiones a redibujar que no pertenecen a ningún elemento vivo
+        self.dirty_rects = []
+        self.needs_full_redraw = True
+        
         self.running = True
     
     def _create_start_screen_elements(self):
@@ -98,6 +103,7 @@ class BackgammonPygame:
         self.show_start_screen = False
         self._create_checker_sprites()
         self.dice_display.set_valores(None)
+        self.needs_full_redraw = True
     
     def _on_roll_dice(self):
         """Callback para tirar dados."""
@@ -118,9 +124,12 @@ class BackgammonPygame:
         self.input_player1.reset()
         self.input_player2.reset()
         self.dice_display.set_valores(None)
+        self.needs_full_redraw = True
     
     def _create_checker_sprites(self):
         """Crea los sprites de las fichas según el estado del tablero."""
+        # Las fichas que desaparecen dejan su región para redibujar
+        self.dirty_rects.extend(sprite.get_rect() for sprite in self.checker_sprites)
         self.checker_sprites = []
         board = self.game.get_board()
         
@@ -181,7 +190,8 @@ class BackgammonPygame:
             'Dados': str(estado['ultimo_roll']) if estado['ultimo_roll'] else 'Sin tirar',
             'Movimientos': str(estado['movimientos_disponibles']),
             'Barra B/N': f"{estado['bar_white']} / {estado['bar_black']}",
-            'Casa B/N': f"{estado['home_white']} / {estado['home_black']}"
+            'Casa B/N': f"{estado['home_white']} / {estado['home_black']}",
+            'Pips B/N': f"{estado['pips_white']} / {estado['pips_black']}"
         }
         
         if estado['terminado']:
@@ -189,19 +199,26 @@ class BackgammonPygame:
         
         self.info_panel.update_info(info)
     
-    def handle_events(self):
-        """Maneja los eventos de Pygame."""
-        for event in pygame.event.get():
+    def handle_events(self, events=None):
+        """
+        Maneja los eventos de Pygame.
+        
+        Args:
+            events: Eventos a procesar; por defecto los pendientes en la cola
+        """
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.needs_full_redraw = True
             
             # Eventos de pantalla de inicio
             if self.show_start_screen:
                 # Procesar inputs de texto
                 if self.input_player1.handle_event(event):
                     # Enter presionado en player1, pasar al siguiente
-                    self.input_player1.active = False
-                    self.input_player2.active = True
+                    self.input_player1.set_active(False)
+                    self.input_player2.set_active(True)
                 elif self.input_player2.handle_event(event):
                     # Enter presionado en player2, iniciar juego
                     self._on_start_game()
@@ -306,39 +323,96 @@ class BackgammonPygame:
             self.input_player2.update()
         else:
             self._update_info_panel()
+            self._update_highlights()
+    
+    def _update_highlights(self):
+        """Resalta las fichas del jugador actual que no se están arrastrando."""
+        color = self.game.get_jugador_actual().get_color() if self.game_started else None
+        for sprite in self.checker_sprites:
+            sprite.set_highlight(sprite.color == color and not sprite.dragging)
+    
+    def _dirty_elements(self):
+        """Retorna los elementos que pueden marcarse para redibujar."""
+        return ([self.input_player1, self.input_player2, self.btn_start,
+                 self.dice_display, self.info_panel] +
+                self.buttons + self.checker_sprites)
+    
+    def _collect_dirty_rects(self):
+        """
+        Retira las regiones que cambiaron desde el último frame.
+        
+        Returns:
+            list: Rectángulos a redibujar
+        """
+        rects = self.dirty_rects
+        self.dirty_rects = []
+        for element in self._dirty_elements():
+            rect = element.pop_dirty_rect()
+            if rect is not None:
+                rects.append(rect)
+        return rects
+    
+    def is_idle(self):
+        """Indica si no hay nada pendiente de dibujar."""
+        return (not self.needs_full_redraw and not self.dirty_rects and
+                all(element.dirty_rect is None for element in self._dirty_elements()))
+    
+    def _idle_timeout(self):
+        """
+        Retorna cuánto esperar eventos sin dibujar.
+        
+        Returns:
+            int: Milisegundos hasta el próximo parpadeo del cursor, o 0 para
+                 esperar indefinidamente
+        """
+        if not self.show_start_screen:
+            return 0
+        times = [t for t in (self.input_player1.time_to_blink(),
+                             self.input_player2.time_to_blink()) if t is not None]
+        return min(times) if times else 0
     
     def draw(self):
-        """Dibuja todo en la pantalla."""
-        if self.show_start_screen:
-            self._draw_start_screen()
-        else:
-            self._draw_game_screen()
+        """Dibuja solo las regiones de la pantalla que cambiaron."""
+        scene = self._draw_start_screen if self.show_start_screen else self._draw_game_screen
+        rects = self._collect_dirty_rects()
+        
+        if self.needs_full_redraw:
+            self.needs_full_redraw = False
+            scene()
+            pygame.display.flip()
+            return
+        
+        if not rects:
+            return
         
-        pygame.display.flip()
+        # Se redibuja la escena recortada a cada región: el orden de las capas se mantiene
+        for rect in rects:
+            self.screen.set_clip(rect)
+            scene()
+        self.screen.set_clip(None)
+        pygame.display.update(rects)
     
     def _draw_start_screen(self):
         """Dibuja la pantalla de inicio."""
         self.screen.fill(COLOR_BG)
         
         # Título
-        font_title = pygame.font.Font(None, 80)
-        title = font_title.render("BACKGAMMON", True, (255, 215, 0))
+        title = render_text(get_font(80), "BACKGAMMON", (255, 215, 0))
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 150))
         self.screen.blit(title, title_rect)
         
         # Subtítulo
-        font_subtitle = pygame.font.Font(None, 40)
-        subtitle = font_subtitle.render("Ingresa los nombres de los jugadores", True, COLOR_TEXTO)
+        subtitle = render_text(get_font(40), "Ingresa los nombres de los jugadores", COLOR_TEXTO)
         subtitle_rect = subtitle.get_rect(center=(WINDOW_WIDTH // 2, 250))
         self.screen.blit(subtitle, subtitle_rect)
         
         # Etiquetas
-        font_label = pygame.font.Font(None, 30)
-        label1 = font_label.render("Jugador 1 (Fichas Blancas ⚪):", True, COLOR_TEXTO)
+        font_label = get_font(30)
+        label1 = render_text(font_label, "Jugador 1 (Fichas Blancas ⚪):", COLOR_TEXTO)
         label1_rect = label1.get_rect(midleft=(WINDOW_WIDTH // 2 - 200, 350))
         self.screen.blit(label1, label1_rect)
         
-        label2 = font_label.render("Jugador 2 (Fichas Negras ⚫):", True, COLOR_TEXTO)
+        label2 = render_text(font_label, "Jugador 2 (Fichas Negras ⚫):", COLOR_TEXTO)
         label2_rect = label2.get_rect(midleft=(WINDOW_WIDTH // 2 - 200, 450))
         self.screen.blit(label2, label2_rect)
         
@@ -350,8 +424,7 @@ class BackgammonPygame:
         self.btn_start.draw(self.screen)
         
         # Instrucciones
-        font_hint = pygame.font.Font(None, 24)
-        hint = font_hint.render("Presiona ENTER o click en COMENZAR para iniciar", True, (200, 200, 200))
+        hint = render_text(get_font(24), "Presiona ENTER o click en COMENZAR para iniciar", (200, 200, 200))
         hint_rect = hint.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 100))
         self.screen.blit(hint, hint_rect)
     
@@ -361,11 +434,8 @@ class BackgammonPygame:
         self.board_renderer.draw_board()
         
         # Fichas
-        jugador_actual_color = self.game.get_jugador_actual().get_color() if self.game_started else None
         for sprite in self.checker_sprites:
-            highlight = (sprite == self.selected_checker or 
-                        (sprite.color == jugador_actual_color and sprite != self.selected_checker))
-            sprite.draw(self.screen, highlight and not sprite.dragging)
+            sprite.draw(self.screen)
         
         # UI Elements
         self.dice_display.draw(self.screen)
@@ -377,11 +447,17 @@ class BackgammonPygame:
     def run(self):
         """Loop principal del juego."""
         while self.running:
-            self.handle_events()
+            events = pygame.event.get()
+            if not events and self.is_idle():
+                # Sin cambios pendientes: dormir hasta el próximo evento o parpadeo
+                events = [pygame.event.wait(self._idle_timeout())]
+                events.extend(pygame.event.get())
+            self.handle_events(events)
             self.update()
             self.draw()
             self.clock.tick(FPS)
         
+        clear_cache()
         pygame.quit()
         sys.exit()
 
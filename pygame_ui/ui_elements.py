@@ -4,9 +4,11 @@ Elementos de UI para el juego.
 
 import pygame
 from .constants import *
+from .dirty_rect import DirtyMixin
+from .font_cache import get_font, render_text
 
 
-class Button:
+class Button(DirtyMixin):
     """Botón clickeable."""
     
     def __init__(self, x, y, width, height, text, callback):
@@ -23,7 +25,12 @@ class Button:
         self.text = text
         self.callback = callback
         self.hovered = False
-        self.font = pygame.font.Font(None, 28)
+        self.font = get_font(28)
+        self.mark_dirty()
+    
+    def get_rect(self):
+        """Retorna el rectángulo del botón."""
+        return self.rect.copy()
     
     def draw(self, surface):
         """Dibuja el botón."""
@@ -31,14 +38,17 @@ class Button:
         pygame.draw.rect(surface, color, self.rect, border_radius=5)
         pygame.draw.rect(surface, COLOR_TEXTO, self.rect, 2, border_radius=5)
         
-        text_surface = self.font.render(self.text, True, COLOR_TEXTO)
+        text_surface = render_text(self.font, self.text, COLOR_TEXTO)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
     
     def handle_event(self, event):
         """Maneja eventos del botón."""
         if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
+            hovered = self.rect.collidepoint(event.pos)
+            if hovered != self.hovered:
+                self.hovered = hovered
+                self.mark_dirty()
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 self.callback()
@@ -46,7 +56,7 @@ class Button:
         return False
 
 
-class DiceDisplay:
+class DiceDisplay(DirtyMixin):
     """Display para los dados."""
     
     def __init__(self, x, y):
@@ -59,11 +69,19 @@ class DiceDisplay:
         self.x = x
         self.y = y
         self.valores = None
-        self.font = pygame.font.Font(None, 48)
+        self.font = get_font(48)
+        self.mark_dirty()
+    
+    def get_rect(self):
+        """Retorna el rectángulo de los dos dados y el indicador de dobles."""
+        width = 2 * (DADO_SIZE + DADO_MARGIN) + self.font.size("x4")[0]
+        return pygame.Rect(self.x, self.y, width, DADO_SIZE)
     
     def set_valores(self, valores):
         """Establece los valores de los dados."""
-        self.valores = valores
+        if valores != self.valores:
+            self.valores = valores
+            self.mark_dirty()
     
     def draw(self, surface):
         """Dibuja los dados."""
@@ -76,7 +94,7 @@ class DiceDisplay:
         
         # Si hay dobles, mostrar indicador
         if len(self.valores) == 4:
-            text = self.font.render("x4", True, COLOR_TEXTO)
+            text = render_text(self.font, "x4", COLOR_TEXTO)
             surface.blit(text, (self.x + 2 * (DADO_SIZE + DADO_MARGIN), self.y + DADO_SIZE // 4))
     
     def _draw_dado(self, surface, x, y, valor):
@@ -115,27 +133,36 @@ class DiceDisplay:
             pygame.draw.circle(surface, COLOR_DADO_PUNTO, (x + px, y + py), radius)
 
 
-class InfoPanel:
+class InfoPanel(DirtyMixin):
     """Panel de información del juego."""
     
     def __init__(self, x, y, width, height):
         """Inicializa el panel de información."""
         self.rect = pygame.Rect(x, y, width, height)
-        self.font_title = pygame.font.Font(None, 36)
-        self.font_text = pygame.font.Font(None, 24)
+        self.font_title = get_font(36)
+        self.font_text = get_font(24)
         self.info = {}
+        
+        # Fondo semi-transparente, creado una sola vez
+        self.background = pygame.Surface((width, height))
+        self.background.set_alpha(200)
+        self.background.fill((50, 50, 50))
+        self.mark_dirty()
+    
+    def get_rect(self):
+        """Retorna el rectángulo del panel."""
+        return self.rect.copy()
     
     def update_info(self, info_dict):
         """Actualiza la información a mostrar."""
-        self.info = info_dict
+        if info_dict != self.info:
+            self.info = info_dict
+            self.mark_dirty()
     
     def draw(self, surface):
         """Dibuja el panel."""
         # Fondo semi-transparente
-        s = pygame.Surface((self.rect.width, self.rect.height))
-        s.set_alpha(200)
-        s.fill((50, 50, 50))
-        surface.blit(s, (self.rect.x, self.rect.y))
+        surface.blit(self.background, (self.rect.x, self.rect.y))
         
         # Borde
         pygame.draw.rect(surface, COLOR_TEXTO, self.rect, 2)
@@ -144,19 +171,19 @@ class InfoPanel:
         
         # Título
         if 'jugador' in self.info:
-            title = self.font_title.render(f"Turno: {self.info['jugador']}", True, COLOR_TEXTO)
+            title = render_text(self.font_title, f"Turno: {self.info['jugador']}", COLOR_TEXTO)
             surface.blit(title, (self.rect.x + 20, y_offset))
             y_offset += 50
         
         # Información adicional
         for key, value in self.info.items():
             if key != 'jugador':
-                text = self.font_text.render(f"{key}: {value}", True, COLOR_TEXTO)
+                text = render_text(self.font_text, f"{key}: {value}", COLOR_TEXTO)
                 surface.blit(text, (self.rect.x + 20, y_offset))
                 y_offset += 30
 
 
-class TextInput:
+class TextInput(DirtyMixin):
     """Campo de texto para entrada de usuario."""
     
     def __init__(self, x, y, width, height, placeholder=""):
@@ -172,9 +199,14 @@ class TextInput:
         self.placeholder = placeholder
         self.text = ""
         self.active = False
-        self.font = pygame.font.Font(None, 32)
+        self.font = get_font(32)
         self.cursor_visible = True
-        self.cursor_timer = 0
+        self.cursor_toggled_at = pygame.time.get_ticks()
+        self.mark_dirty()
+    
+    def get_rect(self):
+        """Retorna el rectángulo del campo."""
+        return self.rect.copy()
     
     def draw(self, surface):
         """Dibuja el campo de texto."""
@@ -186,7 +218,7 @@ class TextInput:
         # Texto
         display_text = self.text if self.text else self.placeholder
         text_color = COLOR_TEXTO if self.text else (150, 150, 150)
-        text_surface = self.font.render(display_text, True, text_color)
+        text_surface = render_text(self.font, display_text, text_color)
         
         # Centrar texto verticalmente
         text_rect = text_surface.get_rect(midleft=(self.rect.x + 10, self.rect.centery))
@@ -203,25 +235,49 @@ class TextInput:
     def handle_event(self, event):
         """Maneja eventos del campo de texto."""
         if event.type == pygame.MOUSEBUTTONDOWN:
-            self.active = self.rect.collidepoint(event.pos)
+            self.set_active(self.rect.collidepoint(event.pos))
         
         if self.active and event.type == pygame.KEYDOWN:
             if event.key == pygame.K_BACKSPACE:
                 self.text = self.text[:-1]
+                self.mark_dirty()
             elif event.key == pygame.K_RETURN:
                 return True  # Enter presionado
             elif len(self.text) < 15:  # Límite de caracteres
                 if event.unicode.isprintable():
                     self.text += event.unicode
+                    self.mark_dirty()
         
         return False
     
+    def set_active(self, active):
+        """Activa o desactiva el campo; el cursor arranca visible."""
+        if active != self.active:
+            self.active = active
+            self.cursor_visible = True
+            self.cursor_toggled_at = pygame.time.get_ticks()
+            self.mark_dirty()
+    
     def update(self):
         """Actualiza el cursor parpadeante."""
-        self.cursor_timer += 1
-        if self.cursor_timer >= 30:  # Parpadea cada 30 frames
+        now = pygame.time.get_ticks()
+        if now - self.cursor_toggled_at >= CURSOR_BLINK_MS:
             self.cursor_visible = not self.cursor_visible
-            self.cursor_timer = 0
+            self.cursor_toggled_at = now
+            if self.active:
+                self.mark_dirty()
+    
+    def time_to_blink(self):
+        """
+        Retorna cuánto falta para el próximo parpadeo del cursor.
+        
+        Returns:
+            int or None: Milisegundos, o None si el campo no está activo
+        """
+        if not self.active:
+            return None
+        elapsed = pygame.time.get_ticks() - self.cursor_toggled_at
+        return max(CURSOR_BLINK_MS - elapsed, 1)
     
     def get_text(self):
         """Retorna el texto ingresado."""
@@ -230,4 +286,5 @@ class TextInput:
     def reset(self):
         """Limpia el campo de texto."""
         self.text = ""
-        self.active = False
+        self.set_active(False)
+        self.mark_dirty()
@@ -0,0 +1,8 @@
+"""
+Servidor de partidas de Backgammon con asyncio.
+"""
+
+from .main import GameServer
+from .session_store import SessionStore
+
+__all__ = ['GameServer', 'SessionStore']
@@ -0,0 +1,323 @@
+"""
+Servidor de partidas de Backgammon sobre TCP con asyncio.
+
+Habla un protocolo de JSON por líneas: cada pedido es un objeto JSON en una
+línea y cada respuesta también. Un solo proceso y un solo hilo atienden todas
+las conexiones; las sesiones (un Game cada una) no dependen de la conexión, así
+que una misma conexión puede manejar muchas partidas y una partida puede
+retomarse desde otra conexión. Las partidas inactivas se estacionan en un
+SessionStore y se rehidratan en el próximo pedido.
+
+Pedidos (el campo "id", si viene, se devuelve igual en la respuesta):
+
+    {"comando": "nueva", "jugadores": ["Ana", "Carlos"], "semilla": 1}
+    {"comando": "tirar", "sesion": "..."}
+    {"comando": "jugadas", "sesion": "..."}
+    {"comando": "mover", "sesion": "...", "movimientos": [[1, 4], [4, 5]]}
+    {"comando": "estado", "sesion": "..."}
+    {"comando": "cerrar", "sesion": "..."}
+
+"mover" recibe una jugada completa, como las de "jugadas" (el orden de los
+movimientos puede cambiar). Respuestas: {"ok": true, ...} o
+{"ok": false, "error": "mensaje"}, también para campos con un tipo inesperado.
+"""
+import argparse
+import asyncio
+import json
+import uuid
+
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+
+from .session_store import SessionStore
+
+# Largo máximo de una línea de pedido
+LIMITE_LINEA = 64 * 1024
+
+
+def _leer_movimientos(movimientos):
+    """Valida y convierte la lista de movimientos [[desde, hasta], ...] de un pedido."""
+    if not isinstance(movimientos, list) or not movimientos:
+        raise ValueError("'movimientos' debe ser una lista de pares [desde, hasta]")
+    jugada = []
+    for movimiento in movimientos:
+        if (not isinstance(movimiento, list) or len(movimiento) != 2 or
+                not all(type(valor) is int for valor in movimiento)):
+            raise ValueError("Cada movimiento debe ser un par [desde, hasta] de enteros")
+        jugada.append(tuple(movimiento))
+    return tuple(jugada)
+
+
+class GameServer:
+    """
+    Servidor asyncio que aloja muchas partidas independientes.
+
+    Cada comando se resuelve de forma sincrónica dentro del loop de eventos: las
+    operaciones de Game tardan microsegundos, así que no hacen falta hilos ni
+    locks, y las conexiones inactivas solo ocupan su buffer.
+    """
+
+    def __init__(self, host='127.0.0.1', puerto=0, clase_tablero=CompactBoard,
+                 almacen=None, segundos_revision=30):
+        """
+        Configura el servidor sin empezar a escuchar.
+
+        Args:
+            host (str): Dirección donde escuchar
+            puerto (int): Puerto TCP; 0 elige uno libre
+            clase_tablero (type): Tablero de las partidas; CompactBoard ocupa menos memoria
+            almacen (SessionStore, optional): Dónde guardar las sesiones; por
+                defecto uno propio con un directorio temporal
+            segundos_revision (float): Cada cuánto se estacionan las partidas inactivas
+        """
+        self.__host__ = host
+        self.__puerto__ = puerto
+        self.__clase_tablero__ = clase_tablero
+        self.__servidor__ = None
+        self.__conexiones__ = set()  # Tareas de las conexiones abiertas
+        self.__almacen_propio__ = almacen is None
+        self.__sesiones__ = almacen if almacen is not None else SessionStore(
+            clase_tablero=clase_tablero)
+        self.__segundos_revision__ = segundos_revision
+        self.__revision__ = None
+        self.__comandos__ = {
+            'nueva': self.__nueva__,
+            'tirar': self.__tirar__,
+            'jugadas': self.__jugadas__,
+            'mover': self.__mover__,
+            'estado': self.__estado__,
+            'cerrar': self.__cerrar__,
+        }
+
+    async def iniciar(self):
+        """Empieza a escuchar conexiones y retorna el puerto usado."""
+        self.__servidor__ = await asyncio.start_server(
+            self.__atender__, self.__host__, self.__puerto__, limit=LIMITE_LINEA)
+        self.__puerto__ = self.__servidor__.sockets[0].getsockname()[1]
+        self.__revision__ = asyncio.create_task(self.__estacionar_periodicamente__())
+        return self.__puerto__
+
+    async def servir(self):
+        """Inicia el servidor (si hace falta) y atiende hasta que se cancele."""
+        if self.__servidor__ is None:
+            await self.iniciar()
+        await self.__servidor__.serve_forever()
+
+    async def detener(self):
+        """
+        Deja de aceptar conexiones, corta las abiertas y cierra el socket.
+
+        Si el almacén de sesiones lo creó el servidor, también se cierra.
+        """
+        if self.__servidor__ is not None:
+            self.__servidor__.close()
+            self.__revision__.cancel()
+            for tarea in list(self.__conexiones__):
+                tarea.cancel()
+            await asyncio.gather(*self.__conexiones__, return_exceptions=True)
+            await self.__servidor__.wait_closed()
+            self.__servidor__ = None
+            if self.__almacen_propio__:
+                self.__sesiones__.cerrar()
+
+    async def __estacionar_periodicamente__(self):
+        """Estaciona las partidas inactivas cada segundos_revision."""
+        while True:
+            await asyncio.sleep(self.__segundos_revision__)
+            self.__sesiones__.estacionar_inactivas()
+
+    def get_puerto(self):
+        """Retorna el puerto en el que escucha el servidor."""
+        return self.__puerto__
+
+    def get_cantidad_sesiones(self):
+        """Retorna cuántas partidas hay abiertas (activas o estacionadas)."""
+        return len(self.__sesiones__)
+
+    def get_almacen(self):
+        """Retorna el SessionStore con las partidas."""
+        return self.__sesiones__
+
+    async def __atender__(self, lector, escritor):
+        """Atiende una conexión: lee pedidos línea por línea y responde en orden."""
+        tarea = asyncio.current_task()
+        self.__conexiones__.add(tarea)
+        try:
+            while True:
+                try:
+                    linea = await lector.readline()
+                except ValueError:
+                    # La línea superó LIMITE_LINEA: no se puede seguir leyendo en orden
+                    escritor.write(self.__codificar__(
+                        {'ok': False, 'error': "Línea demasiado larga"}))
+                    break
+                if not linea:
+                    break
+                escritor.write(self.__codificar__(self.procesar_linea(linea)))
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            # La cancelación (al detener el servidor) sigue propagándose después de cerrar
+            self.__conexiones__.discard(tarea)
+            escritor.close()
+
+    @staticmethod
+    def __codificar__(respuesta):
+        """Convierte una respuesta en una línea JSON."""
+        return json.dumps(respuesta, ensure_ascii=False).encode('utf-8') + b'\n'
+
+    def procesar_linea(self, linea):
+        """
+        Procesa un pedido en JSON y retorna la respuesta.
+
+        Args:
+            linea (bytes or str): Objeto JSON con al menos el campo "comando"
+
+        Returns:
+            dict: Respuesta con "ok" y los datos del comando o el mensaje de error
+        """
+        identificador = None
+        try:
+            pedido = json.loads(linea)
+            if not isinstance(pedido, dict):
+                raise ValueError("El pedido debe ser un objeto JSON")
+            identificador = pedido.get('id')
+            comando = self.__comandos__.get(pedido.get('comando'))
+            if comando is None:
+                raise ValueError(f"Comando desconocido: {pedido.get('comando')!r}")
+            respuesta = {'ok': True}
+            respuesta.update(comando(pedido))
+        except ValueError as error:
+            respuesta = {'ok': False, 'error': str(error)}
+        except (TypeError, KeyError) as error:
+            # Campos con un tipo inesperado que no llegó a validar el comando
+            respuesta = {'ok': False, 'error': f"Pedido mal formado: {error}"}
+        if identificador is not None:
+            respuesta['id'] = identificador
+        return respuesta
+
+    def __sesion__(self, pedido):
+        """Retorna el Game de la sesión indicada en el pedido."""
+        sesion = pedido.get('sesion')
+        game = self.__sesiones__.obtener(sesion) if isinstance(sesion, str) else None
+        if game is None:
+            raise ValueError("Sesión inexistente")
+        return game
+
+    @staticmethod
+    def __estado_game__(game):
+        """Arma el estado de una partida para enviar al cliente."""
+        estado = game.get_estado_juego()
+        estado['color_actual'] = game.get_jugador_actual().get_color()
+        estado['tablero'] = game.get_board().get_conteos()
+        estado['posicion_id'] = game.get_posicion_id()
+        return estado
+
+    def __terminar_turno_si_corresponde__(self, game):
+        """Pasa el turno si la partida sigue y el jugador ya no puede mover."""
+        if game.esta_terminado() or game.tiene_movimientos_disponibles():
+            return False
+        game.cambiar_turno()
+        return True
+
+    def __nueva__(self, pedido):
+        """Crea una partida; la semilla opcional hace reproducibles los dados."""
+        jugadores = pedido.get('jugadores', ["Jugador 1", "Jugador 2"])
+        if (not isinstance(jugadores, list) or len(jugadores) != 2 or
+                not all(isinstance(nombre, str) for nombre in jugadores)):
+            raise ValueError("'jugadores' debe ser una lista con dos nombres")
+        semilla = pedido.get('semilla')
+        if semilla is not None and type(semilla) is not int:
+            raise ValueError("'semilla' debe ser un entero")
+
+        game = Game(self.__clase_tablero__)
+        game.iniciar_juego(jugadores[0], jugadores[1],
+                           Dice(semilla=semilla) if semilla is not None else None)
+        sesion = uuid.uuid4().hex
+        self.__sesiones__.agregar(sesion, game)
+        return {'sesion': sesion, 'estado': self.__estado_game__(game)}
+
+    def __tirar__(self, pedido):
+        """Tira los dados; si no hay jugadas posibles el turno pasa solo."""
+        game = self.__sesion__(pedido)
+        if game.esta_terminado():
+            raise ValueError("La partida ya terminó")
+        if game.get_movimientos_disponibles():
+            raise ValueError("Todavía quedan movimientos por jugar")
+        dados = game.tirar_dados()
+        turno_terminado = self.__terminar_turno_si_corresponde__(game)
+        return {'dados': dados, 'turno_terminado': turno_terminado,
+                'estado': self.__estado_game__(game)}
+
+    def __jugadas__(self, pedido):
+        """Retorna las jugadas completas legales con los dados disponibles."""
+        game = self.__sesion__(pedido)
+        return {'jugadas': [[list(movimiento) for movimiento in jugada]
+                            for jugada in game.generar_jugadas()]}
+
+    def __mover__(self, pedido):
+        """
+        Aplica una jugada completa; el turno pasa cuando no quedan jugadas.
+
+        La jugada tiene que ser una de generar_jugadas(), o llegar a la misma
+        posición con la misma cantidad de movimientos: hay que usar ambos dados
+        (o el mayor si solo entra uno), así que no se aceptan jugadas parciales.
+        """
+        game = self.__sesion__(pedido)
+        jugada = _leer_movimientos(pedido.get('movimientos'))
+        if not game.get_movimientos_disponibles():
+            raise ValueError("Primero hay que tirar los dados")
+        jugadas = game.generar_jugadas()
+        if jugada in jugadas:
+            game.aplicar(jugada)
+        else:
+            finales = {}
+            for legal in jugadas:
+                game.aplicar(legal)
+                finales[game.get_hash()] = len(legal)
+                game.deshacer()
+            if not game.aplicar(jugada):
+                raise ValueError("Movimiento inválido")
+            if finales.get(game.get_hash()) != len(jugada):
+                game.deshacer()
+                raise ValueError("Jugada incompleta: hay que usar ambos dados, "
+                                 "o el mayor si solo se puede usar uno")
+        turno_terminado = self.__terminar_turno_si_corresponde__(game)
+        return {'turno_terminado': turno_terminado, 'estado': self.__estado_game__(game)}
+
+    def __estado__(self, pedido):
+        """Retorna el estado de la partida."""
+        return {'estado': self.__estado_game__(self.__sesion__(pedido))}
+
+    def __cerrar__(self, pedido):
+        """Elimina una partida."""
+        sesion = pedido.get('sesion')
+        if not isinstance(sesion, str) or not self.__sesiones__.eliminar(sesion):
+            raise ValueError("Sesión inexistente")
+        return {}
+
+
+def main(argumentos=None):
+    """Ejecuta el servidor desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Servidor de partidas de Backgammon")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8765)
+    opciones = parser.parse_args(argumentos)
+
+    servidor = GameServer(opciones.host, opciones.puerto)
+
+    async def ejecutar():
+        puerto = await servidor.iniciar()
+        print(f"Servidor de Backgammon escuchando en {opciones.host}:{puerto}")
+        await servidor.servir()
+
+    try:
+        asyncio.run(ejecutar())
+    except KeyboardInterrupt:
+        print("\nServidor detenido.")
+
+
+if __name__ == "__main__":
+    main()
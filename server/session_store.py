@@ -0,0 +1,292 @@
+"""
+Almacén de sesiones con estacionamiento de partidas inactivas.
+
+Las partidas en uso se guardan como objetos Game. Cuando una pasa un tiempo sin
+pedidos (o hay demasiadas activas) se "estaciona": se codifica en unas pocas
+decenas de bytes (identificador de posición, dados, estado de los dados y
+nombres) y el Game se libera. El próximo pedido la rehidrata. Si hay demasiadas estacionadas,
+las menos usadas pasan a un archivo dbm en disco.
+
+Formato de una partida estacionada:
+
+    11 bytes    identificador de posición (core.position_id, incluye el turno)
+    1 byte      tirada: 0 sin tirar, o (dado1 - 1) * 6 + dado2
+    1 byte      cantidad de dados disponibles, seguida de un byte por dado
+    varint      semilla de los dados (en zigzag, para admitir negativas)
+    varint      tamaño de bloque de los dados
+    varint      tiradas hechas desde la semilla
+    1 byte      valores actuales de los dados: 0 sin tirar, o (dado1 - 1) * 6 + dado2
+    varint+utf8 nombre de cada jugador
+
+Los dados se reconstruyen con Dice.desde_estado: estacionar una partida no
+cambia su secuencia de tiradas, sin importar cuántas veces se estacione.
+"""
+import dbm
+import os
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+
+from core import position_id
+from core.compact_board import CompactBoard
+from core.dice import Dice, expandir_tirada
+from core.game import Game
+from core.game_record import escribir_varint, leer_varint
+
+
+def _codificar_tirada(dado1, dado2):
+    """Convierte una tirada en un byte: 0 sin tirar, o (dado1 - 1) * 6 + dado2."""
+    return 0 if dado1 is None else (dado1 - 1) * 6 + dado2
+
+
+def _decodificar_tirada(byte):
+    """Inversa de _codificar_tirada."""
+    return (None, None) if byte == 0 else ((byte - 1) // 6 + 1, (byte - 1) % 6 + 1)
+
+
+def empaquetar(game):
+    """
+    Codifica una partida en bytes para estacionarla.
+
+    Los dados se guardan con su semilla y las tiradas ya hechas. Si no se
+    crearon con una semilla, se saca una de ellos y la partida rehidratada
+    sigue con dados nuevos sembrados con ella.
+
+    Args:
+        game (Game): Partida iniciada
+
+    Returns:
+        bytes: Partida codificada (unas 30 bytes con nombres cortos)
+    """
+    datos = bytearray(game.get_posicion_id(como_texto=False))
+    ultimo_roll = game.get_ultimo_roll()
+    datos.append(0 if ultimo_roll is None else _codificar_tirada(*ultimo_roll[:2]))
+    movimientos = game.get_movimientos_disponibles()
+    datos.append(len(movimientos))
+    datos.extend(movimientos)
+
+    dados = game.get_dice()
+    estado = dados.get_estado()
+    if estado is None:
+        estado = (dados.derivar_semilla(), 0, 0) + dados.get_valores()
+    semilla, bloque, tiradas, dado1, dado2 = estado
+    escribir_varint(2 * semilla if semilla >= 0 else -2 * semilla - 1, datos)
+    escribir_varint(bloque, datos)
+    escribir_varint(tiradas, datos)
+    datos.append(_codificar_tirada(dado1, dado2))
+
+    for jugador in game.get_players():
+        nombre = jugador.get_nombre().encode('utf-8')
+        escribir_varint(len(nombre), datos)
+        datos.extend(nombre)
+    return bytes(datos)
+
+
+def desempaquetar(datos, clase_tablero=CompactBoard):
+    """
+    Reconstruye una partida codificada con empaquetar.
+
+    Args:
+        datos (bytes): Partida estacionada
+        clase_tablero (type): Implementación del tablero del Game
+
+    Returns:
+        Game: Partida en la misma posición, turno y dados disponibles, con los
+              dados en el mismo punto de su secuencia
+    """
+    posicion = position_id.BYTES_ID
+    identificador = datos[:posicion]
+    tirada = datos[posicion]
+    cantidad = datos[posicion + 1]
+    posicion += 2
+    movimientos = tuple(datos[posicion:posicion + cantidad])
+    posicion += cantidad
+    zigzag, posicion = leer_varint(datos, posicion)
+    bloque, posicion = leer_varint(datos, posicion)
+    tiradas, posicion = leer_varint(datos, posicion)
+    valores = _decodificar_tirada(datos[posicion])
+    posicion += 1
+    nombres = []
+    for _ in range(2):
+        largo, posicion = leer_varint(datos, posicion)
+        nombres.append(bytes(datos[posicion:posicion + largo]).decode('utf-8'))
+        posicion += largo
+
+    semilla = zigzag // 2 if zigzag % 2 == 0 else -(zigzag + 1) // 2
+    dados = Dice.desde_estado((semilla, bloque, tiradas) + valores)
+    game = Game.desde_posicion_id(identificador, nombres[0], nombres[1], dados, clase_tablero)
+    if tirada:
+        ultimo_roll = tuple(expandir_tirada(*_decodificar_tirada(tirada)))
+        # La instantánea termina con la última tirada y los dados disponibles
+        game.restaurar(game.snapshot()[:-2] + (ultimo_roll, movimientos))
+    return game
+
+
+class SessionStore:
+    """
+    Sesiones de partidas en tres niveles: activas, estacionadas en memoria y en disco.
+
+    Se usa como un diccionario de id de sesión a Game: obtener() siempre
+    devuelve un Game vivo, rehidratándolo si estaba estacionado.
+    """
+
+    def __init__(self, ruta=None, max_activas=1000, max_estacionadas=100_000,
+                 segundos_inactividad=300, clase_tablero=CompactBoard, reloj=time.monotonic):
+        """
+        Args:
+            ruta (str or None): Directorio del almacén en disco; por defecto uno
+                temporal que se borra al cerrar
+            max_activas (int): Partidas vivas como máximo; las menos usadas se estacionan
+            max_estacionadas (int): Partidas estacionadas en memoria; las menos
+                usadas pasan a disco
+            segundos_inactividad (float): Tiempo sin pedidos para estacionar una partida
+            clase_tablero (type): Tablero de las partidas rehidratadas
+            reloj (callable): Fuente de tiempo en segundos (reemplazable en tests)
+        """
+        if max_activas < 1 or max_estacionadas < 0:
+            raise ValueError("Los límites del almacén deben ser positivos")
+        self.__max_activas__ = max_activas
+        self.__max_estacionadas__ = max_estacionadas
+        self.__segundos_inactividad__ = segundos_inactividad
+        self.__clase_tablero__ = clase_tablero
+        self.__reloj__ = reloj
+        self.__activas__ = OrderedDict()      # sesión -> (Game, último uso), en orden de uso
+        self.__estacionadas__ = OrderedDict()  # sesión -> bytes, en orden de uso
+        self.__directorio_temporal__ = ruta is None
+        self.__ruta__ = tempfile.mkdtemp(prefix='sesiones_') if ruta is None else ruta
+        os.makedirs(self.__ruta__, exist_ok=True)
+        self.__disco__ = dbm.open(os.path.join(self.__ruta__, 'sesiones'), 'c')
+        self.__en_disco__ = len(self.__disco__)
+        self.__estadisticas__ = {'estacionamientos': 0, 'rehidrataciones': 0,
+                                 'a_disco': 0, 'desde_disco': 0}
+
+    def __len__(self):
+        return len(self.__activas__) + len(self.__estacionadas__) + self.__en_disco__
+
+    def __contains__(self, sesion):
+        return (sesion in self.__activas__ or sesion in self.__estacionadas__ or
+                sesion.encode('utf-8') in self.__disco__)
+
+    def agregar(self, sesion, game):
+        """Guarda una partida nueva como activa."""
+        self.eliminar(sesion)
+        self.__activas__[sesion] = (game, self.__reloj__())
+        self.__limitar_activas__()
+
+    def obtener(self, sesion):
+        """
+        Retorna la partida de una sesión, rehidratándola si estaba estacionada.
+
+        Returns:
+            Game or None: La partida, o None si la sesión no existe
+        """
+        ahora = self.__reloj__()
+        entrada = self.__activas__.get(sesion)
+        if entrada is not None:
+            self.__activas__[sesion] = (entrada[0], ahora)
+            self.__activas__.move_to_end(sesion)
+            return entrada[0]
+
+        datos = self.__estacionadas__.pop(sesion, None)
+        if datos is None:
+            clave = sesion.encode('utf-8')
+            if clave not in self.__disco__:
+                return None
+            datos = self.__disco__[clave]
+            del self.__disco__[clave]
+            self.__en_disco__ -= 1
+            self.__estadisticas__['desde_disco'] += 1
+        game = desempaquetar(datos, self.__clase_tablero__)
+        self.__estadisticas__['rehidrataciones'] += 1
+        self.__activas__[sesion] = (game, ahora)
+        self.__limitar_activas__()
+        return game
+
+    def eliminar(self, sesion):
+        """Borra una sesión de cualquier nivel; retorna True si existía."""
+        if self.__activas__.pop(sesion, None) is not None:
+            return True
+        if self.__estacionadas__.pop(sesion, None) is not None:
+            return True
+        clave = sesion.encode('utf-8')
+        if clave in self.__disco__:
+            del self.__disco__[clave]
+            self.__en_disco__ -= 1
+            return True
+        return False
+
+    def estacionar_inactivas(self):
+        """
+        Estaciona las partidas que superaron el tiempo de inactividad.
+
+        Returns:
+            int: Cantidad de partidas estacionadas
+        """
+        limite = self.__reloj__() - self.__segundos_inactividad__
+        cantidad = 0
+        # Las activas están ordenadas por uso: basta con mirar las primeras
+        while self.__activas__:
+            sesion, (_, ultimo_uso) = next(iter(self.__activas__.items()))
+            if ultimo_uso > limite:
+                break
+            self.__estacionar__(sesion)
+            cantidad += 1
+        return cantidad
+
+    def __limitar_activas__(self):
+        """Estaciona las partidas menos usadas si hay más activas que el máximo."""
+        while len(self.__activas__) > self.__max_activas__:
+            self.__estacionar__(next(iter(self.__activas__)))
+
+    def __estacionar__(self, sesion):
+        """Codifica una partida activa y la pasa a memoria compacta (o a disco)."""
+        game, _ = self.__activas__.pop(sesion)
+        self.__estacionadas__[sesion] = empaquetar(game)
+        self.__estadisticas__['estacionamientos'] += 1
+        while len(self.__estacionadas__) > self.__max_estacionadas__:
+            antigua, datos = self.__estacionadas__.popitem(last=False)
+            self.__disco__[antigua.encode('utf-8')] = datos
+            self.__en_disco__ += 1
+            self.__estadisticas__['a_disco'] += 1
+
+    def get_estadisticas(self):
+        """
+        Retorna cuántas sesiones hay en cada nivel y los movimientos entre niveles.
+
+        Returns:
+            dict: activas, estacionadas, en_disco, bytes_estacionadas,
+                  estacionamientos, rehidrataciones, a_disco y desde_disco
+        """
+        estadisticas = {
+            'activas': len(self.__activas__),
+            'estacionadas': len(self.__estacionadas__),
+            'en_disco': self.__en_disco__,
+            'bytes_estacionadas': sum(len(datos) for datos in self.__estacionadas__.values()),
+        }
+        estadisticas.update(self.__estadisticas__)
+        return estadisticas
+
+    def cerrar(self):
+        """
+        Cierra el almacén en disco.
+
+        Si el directorio era temporal se borra; si no, antes se guardan en disco
+        todas las sesiones para poder retomarlas al reabrir el almacén.
+        """
+        if not self.__directorio_temporal__:
+            for sesion in list(self.__activas__):
+                game, _ = self.__activas__.pop(sesion)
+                self.__estacionadas__[sesion] = empaquetar(game)
+            for sesion, datos in self.__estacionadas__.items():
+                self.__disco__[sesion.encode('utf-8')] = datos
+            self.__estacionadas__.clear()
+        self.__disco__.close()
+        if self.__directorio_temporal__:
+            shutil.rmtree(self.__ruta__, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
@@ -0,0 +1,158 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from core.bearoff import (
+    BearoffDatabase, CANTIDAD_POSICIONES, _posiciones, calcular_tiradas_esperadas,
+    cantidad_posiciones, generar_base, indice_posicion, main
+)
+from core.checker import Checker
+from core.game import Game
+
+
+class TestBearoff(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Base reducida (hasta 4 fichas) para que los tests sean rápidos
+        cls.directorio = tempfile.mkdtemp()
+        cls.ruta = generar_base(os.path.join(cls.directorio, 'bearoff.bin'), 4)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directorio)
+
+    def setUp(self):
+        self.db = BearoffDatabase(self.ruta)
+
+    def tearDown(self):
+        self.db.cerrar()
+
+    def test_cantidad_posiciones(self):
+        """Test que verifica la cantidad de repartos de la base completa."""
+        self.assertEqual(CANTIDAD_POSICIONES, 54264)
+        self.assertEqual(cantidad_posiciones(4), 210)
+
+    def test_indices_unicos_y_consecutivos(self):
+        """Test que verifica que cada reparto tiene un índice distinto y sin huecos."""
+        indices = sorted(indice_posicion(conteos) for conteos in _posiciones())
+        self.assertEqual(indices, list(range(CANTIDAD_POSICIONES)))
+
+    def test_menos_fichas_es_prefijo(self):
+        """Test que verifica que los repartos con menos fichas tienen índices más bajos."""
+        for conteos in _posiciones(4):
+            self.assertLess(indice_posicion(conteos), cantidad_posiciones(4))
+
+    def test_valores_conocidos(self):
+        """Test que verifica tiradas esperadas calculables a mano."""
+        self.assertEqual(self.db.get_tiradas_esperadas((0, 0, 0, 0, 0, 0)), 0.0)
+        self.assertEqual(self.db.get_tiradas_esperadas((1, 0, 0, 0, 0, 0)), 1.0)
+        self.assertEqual(self.db.get_tiradas_esperadas((2, 0, 0, 0, 0, 0)), 1.0)
+        # Desde el punto 6 solo fallan 1-2, 1-3, 1-4, 2-3 y 1-1: 9 de 36
+        self.assertAlmostEqual(self.db.get_tiradas_esperadas((0, 0, 0, 0, 0, 1)), 1.25)
+
+    def test_archivo_coincide_con_calculo(self):
+        """Test que verifica que el archivo guarda los valores calculados."""
+        esperadas = calcular_tiradas_esperadas(4)
+        for conteos in _posiciones(4):
+            indice = indice_posicion(conteos)
+            self.assertEqual(self.db.get_tiradas_esperadas(conteos), esperadas[indice])
+
+    def test_mas_fichas_no_mejora(self):
+        """Test que verifica que agregar una ficha nunca reduce las tiradas esperadas."""
+        for conteos in _posiciones(3):
+            base = self.db.get_tiradas_esperadas(conteos)
+            for punto in range(6):
+                mas = list(conteos)
+                mas[punto] += 1
+                self.assertGreaterEqual(self.db.get_tiradas_esperadas(mas), base)
+
+    def test_posicion_fuera_de_la_base(self):
+        """Test que verifica que se rechazan posiciones con más fichas que la base."""
+        with self.assertRaises(ValueError):
+            self.db.get_tiradas_esperadas((5, 0, 0, 0, 0, 0))
+        self.assertEqual(self.db.get_max_fichas(), 4)
+
+    def test_archivo_invalido(self):
+        """Test que verifica que se rechaza un archivo que no es una base."""
+        ruta = os.path.join(self.directorio, 'invalido.bin')
+        with open(ruta, 'wb') as archivo:
+            archivo.write(b'no es una base de datos')
+        with self.assertRaises(ValueError):
+            BearoffDatabase(ruta)
+
+    def test_generar_base_fichas_invalidas(self):
+        """Test que verifica que se rechaza un máximo de fichas fuera de rango."""
+        with self.assertRaises(ValueError):
+            generar_base(os.path.join(self.directorio, 'x.bin'), 16)
+
+    def test_mejor_jugada(self):
+        """Test que verifica que se elige la jugada con menos tiradas esperadas."""
+        game = Game()
+        game.iniciar_juego("Ana", "Carlos")
+        while game.get_jugador_actual().get_color() != 'white':
+            game.cambiar_turno()
+        board = game.get_board()
+        for i in range(1, 25):
+            while board.tiene_fichas(i):
+                board.quitar_ficha(i)
+        # Fichas blancas a 6 y 5 pips de salir; el resto ya salió
+        board.agregar_ficha(19, Checker('white'))
+        board.agregar_ficha(20, Checker('white'))
+        game.__dict__['__home__']['white'] = [Checker('white')] * 13
+        board.set_fuera('white', 13)
+        game.__dict__['__movimientos_disponibles__'] = [6, 5]
+
+        jugada = self.db.mejor_jugada(game)
+        self.assertEqual(sorted(jugada), [(19, 25), (20, 25)])
+        self.assertTrue(game.aplicar(jugada))
+        self.assertTrue(game.esta_terminado())
+
+    def test_mejor_jugada_con_rival_en_la_casa(self):
+        """Test que verifica que las fichas del rival en la casa no entran en la consulta."""
+        game = Game()
+        game.iniciar_juego("Ana", "Carlos")
+        while game.get_jugador_actual().get_color() != 'white':
+            game.cambiar_turno()
+        board = game.get_board()
+        for i in range(1, 25):
+            while board.tiene_fichas(i):
+                board.quitar_ficha(i)
+        # Blancas sacando fichas con las dos fichas de atrás de las negras en el punto 24
+        board.agregar_ficha(19, Checker('white'))
+        board.agregar_ficha(21, Checker('white'))
+        board.agregar_ficha(24, Checker('black'))
+        board.agregar_ficha(24, Checker('black'))
+        board.agregar_ficha(6, Checker('black'))
+        game.__dict__['__home__']['white'] = [Checker('white')] * 13
+        board.set_fuera('white', 13)
+        game.__dict__['__home__']['black'] = [Checker('black')] * 12
+        board.set_fuera('black', 12)
+        game.__dict__['__movimientos_disponibles__'] = [6, 4]
+
+        jugada = self.db.mejor_jugada(game)
+        self.assertEqual(sorted(jugada), [(19, 25), (21, 25)])
+        self.assertTrue(game.aplicar(jugada))
+        self.assertTrue(game.esta_terminado())
+
+    def test_mejor_jugada_fuera_de_bear_off(self):
+        """Test que verifica que no hay jugada de base fuera del bear off."""
+        game = Game()
+        game.iniciar_juego("Ana", "Carlos")
+        game.tirar_dados()
+        self.assertIsNone(self.db.mejor_jugada(game))
+
+    def test_main(self):
+        """Test que verifica la generación desde la línea de comandos."""
+        ruta = os.path.join(self.directorio, 'cli.bin')
+        with redirect_stdout(io.StringIO()):
+            main(['--salida', ruta, '--fichas', '2'])
+        with BearoffDatabase(ruta) as db:
+            self.assertEqual(db.get_max_fichas(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from benchmarks.main import (
+    POSICIONES, _casos_copia, _casos_posicion, comparar, copias_lentas, ejecutar, main,
+    preparar_posicion
+)
+from core.board import Board
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def test_posiciones_fijas(self):
+        """Test que verifica que las posiciones fijas son lo que dicen ser."""
+        for nombre in POSICIONES:
+            game = preparar_posicion(nombre)
+            self.assertEqual(game.get_jugador_actual().get_color(), 'white')
+            self.assertTrue(game.generar_jugadas(), nombre)
+        self.assertEqual(preparar_posicion('apertura').get_pip_count('white'), 167)
+        self.assertEqual(len(preparar_posicion('barra').get_bar('white')), 2)
+        self.assertEqual(preparar_posicion('bear_off').get_board().get_fuera_de_casa('white'), 0)
+        self.assertEqual(preparar_posicion('apertura', Board).get_dice().get_valores(), (3, 1))
+
+    def test_ejecutar(self):
+        """Test que verifica el formato de los resultados."""
+        resultado = ejecutar(numero=2, repeticiones=1, partidas=1, profundidad=0)
+        self.assertEqual(resultado['tablero'], 'CompactBoard')
+        resultados = resultado['resultados']
+        self.assertIn('partida_completa', resultados)
+        for nombre in POSICIONES:
+            for caso in ('es_movimiento_valido', 'hacer_movimiento',
+                         'tiene_movimientos_disponibles', 'get_punto', 'expectiminimax_0',
+                         'clonar', 'snapshot_restaurar', 'deepcopy', 'jugada_interactiva'):
+                self.assertGreater(resultados[f'{nombre}.{caso}']['ns_por_op'], 0)
+        json.dumps(resultado)
+
+        sin_busqueda = ejecutar(numero=1, repeticiones=1, partidas=1, busquedas=0)
+        self.assertNotIn('apertura.expectiminimax_2', sin_busqueda['resultados'])
+
+    def test_mediciones_no_cambian_la_posicion(self):
+        """Test que verifica que medir varias veces no altera la posición."""
+        for nombre in POSICIONES:
+            game = preparar_posicion(nombre)
+            antes = game.snapshot()
+            casos = list(_casos_posicion(game).values()) + list(_casos_copia(game).values())
+            for funcion, _ in casos:
+                funcion()
+                funcion()
+            self.assertEqual(game.snapshot(), antes, nombre)
+
+    def test_limite_de_jugada_interactiva(self):
+        """Test que verifica que el proceso falla si una jugada del bot supera el límite."""
+        argumentos = ['--numero', '1', '--repeticiones', '1', '--partidas', '1',
+                      '--profundidad', '0', '--razon-copia', '0',
+                      '--salida', os.path.join(self.directorio, 'b.json')]
+        errores = io.StringIO()
+        with contextlib.redirect_stderr(errores):
+            self.assertEqual(main(argumentos), 0)
+            self.assertEqual(main(argumentos + ['--limite-jugada', '1e-12']), 1)
+        self.assertIn('apertura.jugada_interactiva', errores.getvalue())
+
+    def test_copias_lentas(self):
+        """Test que verifica que se marcan las posiciones donde clonar no alcanza la razón."""
+        actual = {'resultados': {'apertura.clonar': {'ns_por_op': 10.0},
+                                 'apertura.deepcopy': {'ns_por_op': 300.0},
+                                 'barra.clonar': {'ns_por_op': 10.0},
+                                 'barra.deepcopy': {'ns_por_op': 150.0}}}
+        self.assertEqual(copias_lentas(actual, 20), [('barra', 15.0)])
+        self.assertEqual(copias_lentas(actual, 10), [])
+
+    def test_comparar(self):
+        """Test que verifica que se marcan solo los empeoramientos mayores al umbral."""
+        base = {'version': 1, 'resultados': {'a': {'ns_por_op': 100.0},
+                                             'b': {'ns_por_op': 100.0},
+                                             'viejo': {'ns_por_op': 1.0}}}
+        actual = {'version': 1, 'resultados': {'a': {'ns_por_op': 125.0},
+                                               'b': {'ns_por_op': 105.0},
+                                               'nuevo': {'ns_por_op': 1.0}}}
+        filas = comparar(actual, base, umbral=0.10)
+        self.assertEqual([(f[0], f[4]) for f in filas], [('a', True), ('b', False)])
+        self.assertAlmostEqual(filas[0][3], 0.25)
+        with self.assertRaises(ValueError):
+            comparar(actual, {'version': 99, 'resultados': {}})
+
+    def test_main_guarda_y_compara(self):
+        """Test que verifica la salida JSON y el código de salida con regresiones."""
+        salida = os.path.join(self.directorio, 'base.json')
+        argumentos = ['--numero', '2', '--repeticiones', '1', '--partidas', '1',
+                      '--profundidad', '0', '--razon-copia', '0']
+        self.assertEqual(main(argumentos + ['--salida', salida]), 0)
+        with open(salida, encoding='utf-8') as archivo:
+            base = json.load(archivo)
+
+        # Una línea base imposible de igualar obliga a marcar regresiones
+        for medicion in base['resultados'].values():
+            medicion['ns_por_op'] /= 1000
+        with open(salida, 'w', encoding='utf-8') as archivo:
+            json.dump(base, archivo)
+        tabla = io.StringIO()
+        with contextlib.redirect_stdout(tabla):
+            self.assertEqual(main(argumentos + ['--comparar', salida]), 1)
+        lineas = tabla.getvalue().splitlines()
+        self.assertEqual(sum('REGRESIÓN' in linea for linea in lineas), len(base['resultados']))
+        self.assertTrue(any(linea.startswith('apertura.clonar') for linea in lineas))
+        self.assertEqual(lineas[-1], f"{len(base['resultados'])} regresiones con umbral 10%")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -116,6 +116,42 @@ class TestBoard(unittest.TestCase):
         self.assertIn("Tablero de Backgammon", resultado)
         self.assertIn("Punto", resultado)
 
+    def test_contadores_iniciales(self):
+        """Test que verifica pips, fichas fuera de casa y ficha más lejana al inicio."""
+        for color in ('white', 'black'):
+            self.assertEqual(self.board.get_pip_count(color), 167)
+            self.assertEqual(self.board.get_fuera_de_casa(color), 10)
+            self.assertEqual(self.board.get_mas_lejana(color), 24)
+    
+    def test_contadores_incrementales(self):
+        """Test que verifica que los contadores siguen a agregar y quitar fichas."""
+        self.board.quitar_ficha(1)
+        self.board.quitar_ficha(1)
+        self.assertEqual(self.board.get_pip_count('white'), 167 - 48)
+        self.assertEqual(self.board.get_fuera_de_casa('white'), 8)
+        self.assertEqual(self.board.get_mas_lejana('white'), 13)
+        
+        self.board.agregar_ficha(20, Checker('white'))
+        self.assertEqual(self.board.get_pip_count('white'), 167 - 48 + 5)
+        self.assertEqual(self.board.get_fuera_de_casa('white'), 8)
+        
+        self.board.set_barra('white', 1)
+        self.assertEqual(self.board.get_pip_count('white'), 167 - 48 + 5 + 25)
+        self.assertEqual(self.board.get_fuera_de_casa('white'), 9)
+        self.board.set_barra('white', 0)
+        self.assertEqual(self.board.get_fuera_de_casa('white'), 8)
+
+    def test_desde_conteos(self):
+        """Test que verifica armar un tablero desde conteos con signo."""
+        conteos = [0] * 24
+        conteos[0] = 2
+        conteos[23] = -3
+        tablero = Board.desde_conteos(conteos)
+        self.assertEqual(tablero.get_conteos(), conteos)
+        self.assertEqual(tablero.get_pip_count('white'), 48)
+        self.assertEqual(tablero.get_pip_count('black'), 72)
+        self.assertEqual(tablero.get_fuera_de_casa('white'), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
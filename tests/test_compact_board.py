@@ -0,0 +1,132 @@
+import unittest
+
+from core.board import Board
+from core.checker import Checker
+from core.compact_board import CompactBoard
+from core.game import Game
+
+
+class TestCompactBoard(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.board = CompactBoard()
+    
+    def test_posicion_inicial_igual_a_board(self):
+        """Test que verifica que la posición inicial coincide con Board."""
+        board = Board()
+        self.assertEqual(self.board.get_conteos(), board.get_conteos())
+        for i in range(1, 25):
+            self.assertEqual(self.board.get_color_punto(i), board.get_color_punto(i))
+            self.assertEqual(self.board.get_cantidad_fichas(i), board.get_cantidad_fichas(i))
+    
+    def test_get_punto_retorna_checkers(self):
+        """Test que verifica que get_punto devuelve fichas como Board."""
+        fichas = self.board.get_punto(12)
+        self.assertEqual(len(fichas), 5)
+        self.assertTrue(all(isinstance(f, Checker) and f.get_color() == 'white' for f in fichas))
+        self.assertEqual(self.board.get_punto(2), [])
+        self.assertEqual(len(self.board.get_puntos()), 24)
+    
+    def test_posicion_invalida(self):
+        """Test que verifica que las posiciones fuera de rango fallan."""
+        for metodo in (self.board.get_punto, self.board.tiene_fichas, self.board.quitar_ficha):
+            with self.assertRaises(ValueError):
+                metodo(0)
+            with self.assertRaises(ValueError):
+                metodo(25)
+    
+    def test_agregar_y_quitar_ficha(self):
+        """Test que verifica agregar y quitar fichas de ambos colores."""
+        self.board.agregar_ficha(2, Checker('black'))
+        self.assertEqual(self.board.get_color_punto(2), 'black')
+        self.assertEqual(self.board.get_cantidad_fichas(2), 1)
+        
+        ficha = self.board.quitar_ficha(2)
+        self.assertEqual(ficha.get_color(), 'black')
+        self.assertFalse(self.board.tiene_fichas(2))
+        self.assertIsNone(self.board.quitar_ficha(2))
+    
+    def test_no_mezcla_colores(self):
+        """Test que verifica que no se mezclan colores en un punto."""
+        with self.assertRaises(ValueError):
+            self.board.agregar_ficha(1, Checker('black'))
+        with self.assertRaises(ValueError):
+            self.board.agregar_ficha(6, Checker('white'))
+        with self.assertRaises(ValueError):
+            self.board.agregar_ficha(3, "ficha")
+    
+    def test_barra_y_fuera(self):
+        """Test que verifica los conteos de barra y fichas fuera."""
+        self.board.set_barra('white', 2)
+        self.board.set_fuera('black', 3)
+        self.assertEqual(self.board.get_barra('white'), 2)
+        self.assertEqual(self.board.get_barra('black'), 0)
+        self.assertEqual(self.board.get_fuera('black'), 3)
+        self.assertEqual(len(self.board.get_celdas()), 28)
+    
+    def test_cantidad_celdas_invalida(self):
+        """Test que verifica que se rechaza un buffer de tamaño incorrecto."""
+        with self.assertRaises(ValueError):
+            CompactBoard([0] * 24)
+    
+    def test_game_con_tablero_compacto(self):
+        """Test que verifica que Game funciona con el tablero compacto."""
+        game = Game(CompactBoard)
+        game.iniciar_juego("Ana", "Carlos")
+        self.assertIsInstance(game.get_board(), CompactBoard)
+        
+        while game.get_jugador_actual().get_color() != 'white':
+            game.cambiar_turno()
+        game.get_board().quitar_ficha(6)
+        game.get_board().quitar_ficha(6)
+        game.get_board().quitar_ficha(6)
+        game.get_board().quitar_ficha(6)
+        
+        game.tirar_dados()
+        game.__dict__['__movimientos_disponibles__'] = [5]
+        self.assertTrue(game.hacer_movimiento(1, 6))
+        self.assertEqual(len(game.get_bar('black')), 1)
+        self.assertEqual(game.get_board().get_barra('black'), 1)
+        self.assertEqual(game.get_board().get_color_punto(6), 'white')
+        
+        game.reiniciar_juego()
+        game.iniciar_juego()
+        self.assertIsInstance(game.get_board(), CompactBoard)
+
+    
+    def test_contadores_iguales_a_board(self):
+        """Test que verifica que los contadores coinciden con los de Board."""
+        board = Board()
+        for posicion in (1, 1, 24, 24, 6):
+            board.quitar_ficha(posicion)
+            self.board.quitar_ficha(posicion)
+        for color in ('white', 'black'):
+            self.assertEqual(self.board.get_pip_count(color), board.get_pip_count(color))
+            self.assertEqual(self.board.get_fuera_de_casa(color), board.get_fuera_de_casa(color))
+            self.assertEqual(self.board.get_mas_lejana(color), board.get_mas_lejana(color))
+    
+    def test_contadores_con_barra_inicial(self):
+        """Test que verifica los contadores al construir con fichas en la barra."""
+        celdas = [0] * 28
+        celdas[23] = 1
+        celdas[24] = 2
+        board = CompactBoard(celdas)
+        self.assertEqual(board.get_pip_count('white'), 1 + 50)
+        self.assertEqual(board.get_fuera_de_casa('white'), 2)
+        self.assertEqual(board.get_mas_lejana('white'), 1)
+
+    def test_desde_conteos(self):
+        """Test que verifica armar un tablero desde conteos con signo."""
+        conteos = [0] * 24
+        conteos[0] = 2
+        conteos[23] = -3
+        tablero = CompactBoard.desde_conteos(conteos)
+        self.assertEqual(tablero.get_conteos(), conteos)
+        self.assertEqual(tablero.get_pip_count('white'), 48)
+        self.assertEqual(tablero.get_pip_count('black'), 72)
+        self.assertEqual(tablero.get_fuera_de_casa('white'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+from core.checker import Checker
+from core.game import Game
+
+
+class TestAplicarDeshacer(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.game = Game(verificar_hash=True)
+        self.game.iniciar_juego("Ana", "Carlos")
+        while self.game.get_jugador_actual().get_color() != 'white':
+            self.game.cambiar_turno()
+    
+    def estado(self):
+        """Retorna una foto comparable del estado del juego."""
+        return (self.game.get_board().get_conteos(),
+                self.game.get_bar('white'), self.game.get_bar('black'),
+                len(self.game.get_home('white')), len(self.game.get_home('black')),
+                self.game.get_movimientos_disponibles(), self.game.get_hash())
+    
+    def test_deshacer_sin_jugadas(self):
+        """Test que verifica que no se puede deshacer sin jugadas aplicadas."""
+        self.assertFalse(self.game.deshacer())
+    
+    def test_aplicar_y_deshacer_jugada(self):
+        """Test que verifica que deshacer restaura el estado exacto."""
+        self.game.__dict__['__movimientos_disponibles__'] = [3, 1]
+        antes = self.estado()
+        self.assertTrue(self.game.aplicar(((17, 20), (19, 20))))
+        self.assertEqual(self.game.get_board().get_cantidad_fichas(20), 2)
+        self.assertEqual(self.game.get_movimientos_disponibles(), [])
+        
+        self.assertTrue(self.game.deshacer())
+        self.assertEqual(self.estado(), antes)
+    
+    def test_deshacer_restaura_orden_de_dados(self):
+        """Test que verifica que el dado vuelve a su lugar en la lista."""
+        self.game.__dict__['__movimientos_disponibles__'] = [5, 2]
+        self.assertTrue(self.game.aplicar(((1, 3),)))
+        self.assertEqual(self.game.get_movimientos_disponibles(), [5])
+        self.game.deshacer()
+        self.assertEqual(self.game.get_movimientos_disponibles(), [5, 2])
+    
+    def test_aplicar_invalida_no_modifica(self):
+        """Test que verifica que una jugada inválida deja el juego como estaba."""
+        self.game.__dict__['__movimientos_disponibles__'] = [3, 1]
+        antes = self.estado()
+        # El segundo movimiento va a un punto bloqueado (punto 6: 5 negras)
+        self.assertFalse(self.game.aplicar(((1, 4), (5, 6))))
+        self.assertEqual(self.estado(), antes)
+        self.assertFalse(self.game.deshacer())
+    
+    def test_deshacer_captura(self):
+        """Test que verifica que deshacer devuelve la ficha capturada."""
+        board = self.game.get_board()
+        board.quitar_ficha(8)
+        board.quitar_ficha(8)
+        self.game.__dict__['__clave_zobrist__'] = self.game.__calcular_hash__()
+        self.game.__dict__['__movimientos_disponibles__'] = [6, 1]
+        antes = self.estado()
+        
+        self.assertTrue(self.game.aplicar(((1, 7), (7, 8))))
+        self.assertEqual(len(self.game.get_bar('black')), 1)
+        self.assertTrue(self.game.deshacer())
+        self.assertEqual(self.estado(), antes)
+        self.assertEqual(board.get_color_punto(8), 'black')
+    
+    def test_deshacer_entrada_y_bear_off(self):
+        """Test que verifica deshacer la entrada desde la barra y el bear off."""
+        board = self.game.get_board()
+        for i in range(1, 25):
+            while board.tiene_fichas(i):
+                board.quitar_ficha(i)
+        board.agregar_ficha(22, Checker('white'))
+        self.game.__dict__['__clave_zobrist__'] = self.game.__calcular_hash__()
+        self.game.__dict__['__movimientos_disponibles__'] = [6, 3]
+        antes = self.estado()
+        
+        self.assertTrue(self.game.aplicar(((22, 25),)))
+        self.assertEqual(self.game.get_movimientos_disponibles(), [6])
+        self.assertTrue(self.game.deshacer())
+        self.assertEqual(self.estado(), antes)
+    
+    def test_deshacer_hacer_movimiento(self):
+        """Test que verifica que también se deshacen movimientos individuales."""
+        self.game.__dict__['__movimientos_disponibles__'] = [3, 1]
+        antes = self.estado()
+        self.assertTrue(self.game.hacer_movimiento(1, 4))
+        self.assertTrue(self.game.hacer_movimiento(4, 5))
+        self.assertTrue(self.game.deshacer())
+        self.assertEqual(self.game.get_board().get_cantidad_fichas(4), 1)
+        self.assertTrue(self.game.deshacer())
+        self.assertEqual(self.estado(), antes)
+    
+    def test_cambiar_turno_vacia_la_pila(self):
+        """Test que verifica que al cambiar de turno no se puede deshacer."""
+        self.game.__dict__['__movimientos_disponibles__'] = [3, 1]
+        self.game.aplicar(((1, 4),))
+        self.game.cambiar_turno()
+        self.assertFalse(self.game.deshacer())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
+import random
 import unittest
 
-from core.dice import Dice
+from core import dice as dice_module
+from core.dice import TIRADAS, Dice, expandir_tirada
+from core.game import Game
 
 
 class TestDice(unittest.TestCase):
@@ -116,5 +119,101 @@ class TestDice(unittest.TestCase):
                 break
 
 
+    def test_semilla_reproducible(self):
+        """Test que verifica que la misma semilla da la misma secuencia de tiradas."""
+        dados1 = Dice(semilla=42)
+        dados2 = Dice(semilla=42)
+        self.assertEqual([dados1.tirar() for _ in range(20)],
+                         [dados2.tirar() for _ in range(20)])
+
+    def test_rng_inyectado(self):
+        """Test que verifica que se usa el generador inyectado."""
+        dados = Dice(rng=random.Random(7))
+        esperado = random.Random(7)
+        dados.tirar()
+        self.assertEqual(dados.get_valores(), (esperado.randint(1, 6), esperado.randint(1, 6)))
+
+    def test_modo_bloque(self):
+        """Test que verifica el modo por bloques, incluido el rellenado del buffer."""
+        dados1 = Dice(semilla=3, bloque=4)
+        dados2 = Dice(semilla=3, bloque=4)
+        tiradas = [dados1.tirar() for _ in range(10)]
+        self.assertEqual(tiradas, [dados2.tirar() for _ in range(10)])
+        for tirada in tiradas:
+            self.assertIn(len(tirada), [2, 4])
+            for valor in tirada:
+                self.assertIn(valor, [1, 2, 3, 4, 5, 6])
+
+    @unittest.skipIf(dice_module.np is None, "NumPy no está instalado")
+    def test_modo_bloque_numpy(self):
+        """Test que verifica que con NumPy el bloque también es reproducible."""
+        dados1 = Dice(semilla=5, bloque=1000)
+        dados2 = Dice(semilla=5, bloque=1000)
+        valores = [tuple(dados1.tirar()) for _ in range(1500)]
+        self.assertEqual(valores, [tuple(dados2.tirar()) for _ in range(1500)])
+        self.assertTrue(all(isinstance(v, int) for tirada in valores for v in tirada))
+
+    def test_bloque_negativo(self):
+        """Test que verifica que no se acepta un bloque negativo."""
+        with self.assertRaises(ValueError):
+            Dice(bloque=-1)
+
+    def test_partida_reproducible_con_semilla(self):
+        """Test que verifica que una partida se repite desde una sola semilla."""
+        partidas = []
+        for _ in range(2):
+            game = Game()
+            game.iniciar_juego("Ana", "Carlos", Dice(semilla=99))
+            tiradas = [game.get_turno_actual()]
+            for _ in range(5):
+                tiradas.append(tuple(game.tirar_dados()))
+                game.cambiar_turno()
+            partidas.append(tiradas)
+        self.assertEqual(partidas[0], partidas[1])
+
+
+    def test_tabla_de_tiradas(self):
+        """Test que verifica la tabla de las 21 tiradas distintas."""
+        self.assertEqual(len(TIRADAS), 21)
+        self.assertAlmostEqual(sum(t.probabilidad for t in TIRADAS), 1.0)
+        self.assertEqual(sum(t.peso for t in TIRADAS), 36)
+        self.assertEqual(len({(t.dado1, t.dado2) for t in TIRADAS}), 21)
+        for tirada in TIRADAS:
+            self.assertGreaterEqual(tirada.dado1, tirada.dado2)
+            self.assertIsInstance(tirada.movimientos, tuple)
+            if tirada.dado1 == tirada.dado2:
+                self.assertEqual(tirada.movimientos, (tirada.dado1,) * 4)
+                self.assertEqual(tirada.peso, 1)
+            else:
+                self.assertEqual(tirada.movimientos, (tirada.dado1, tirada.dado2))
+                self.assertEqual(tirada.peso, 2)
+
+    def test_reconstruir_desde_estado(self):
+        """Test que verifica que los dados reconstruidos siguen la misma secuencia."""
+        for bloque in (0, 8):
+            dados = Dice(semilla=11, bloque=bloque)
+            testigo = Dice(semilla=11, bloque=bloque)
+            for _ in range(13):
+                dados.tirar()
+                testigo.tirar()
+            copia = Dice.desde_estado(dados.get_estado())
+            self.assertEqual(copia.get_valores(), testigo.get_valores())
+            self.assertEqual([copia.tirar() for _ in range(20)],
+                             [testigo.tirar() for _ in range(20)])
+
+    def test_estado_sin_semilla(self):
+        """Test que verifica que sin semilla propia los dados no se pueden reconstruir."""
+        self.assertIsNone(Dice().get_estado())
+        self.assertIsNone(Dice(rng=random.Random(1)).get_estado())
+        dados = Dice(semilla=3)
+        dados.derivar_semilla()
+        self.assertIsNone(dados.get_estado())
+
+    def test_expandir_tirada(self):
+        """Test que verifica la expansión de dobles."""
+        self.assertEqual(expandir_tirada(3, 3), [3, 3, 3, 3])
+        self.assertEqual(expandir_tirada(5, 2), [5, 2])
+
+
 if __name__ == '__main__':  
     unittest.main()
\ No newline at end of file
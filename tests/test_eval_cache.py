@@ -0,0 +1,146 @@
+import unittest
+
+from core import position_id
+from core.eval_cache import EvaluationCache, clave_canonica, clave_juego
+from core.expectiminimax import ExpectiminimaxBot, evaluar_heuristica
+from core.game import Game
+from core.game_record import DadosGrabados
+from core.move_generator import a_perspectiva
+
+
+class TestEvalCache(unittest.TestCase):
+
+    def setUp(self):
+        self.llamadas = []
+        self.cache = EvaluationCache(self.__evaluar__, max_entradas=3)
+        self.game = Game()
+        self.game.iniciar_juego("Ana", "Carlos")
+        self.pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, 'white')
+
+    def __evaluar__(self, pos, fuera_rival, color=None):
+        self.llamadas.append((tuple(pos), fuera_rival, color))
+        return sum(pos) + fuera_rival
+
+    def test_acierto_no_recalcula(self):
+        """Test que verifica que una posición repetida no se vuelve a evaluar."""
+        self.assertEqual(self.cache(self.pos, 0), self.cache(self.pos, 0))
+        self.assertEqual(len(self.llamadas), 1)
+        estadisticas = self.cache.get_estadisticas()
+        self.assertEqual(estadisticas['aciertos'], 1)
+        self.assertEqual(estadisticas['fallos'], 1)
+        self.assertEqual(estadisticas['tasa_aciertos'], 0.5)
+
+    def test_clave_canonica(self):
+        """Test que verifica que la clave no depende del color que mueve."""
+        conteos = self.game.get_board().get_conteos()
+        blancas = a_perspectiva(conteos, 0, 0, 'white')
+        negras = a_perspectiva(conteos, 0, 0, 'black')
+        self.assertEqual(clave_canonica(blancas, 0), clave_canonica(negras, 0))
+        self.assertNotEqual(clave_canonica(blancas, 0), clave_canonica(blancas, 1))
+        self.assertEqual(len(clave_canonica(blancas, 0)), 28)
+        self.assertNotEqual(clave_canonica(blancas, 0, 'white'),
+                            clave_canonica(blancas, 0, 'black'))
+
+    def test_clave_juego(self):
+        """Test que verifica la clave de la posición de un juego."""
+        color = self.game.get_jugador_actual().get_color()
+        pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, color)
+        self.assertEqual(clave_juego(self.game), clave_canonica(pos, 0, al_turno=True))
+        self.assertEqual(clave_juego(self.game, con_color=True),
+                         clave_canonica(pos, 0, color, al_turno=True))
+        self.assertNotEqual(clave_juego(self.game), clave_canonica(pos, 0))
+
+    def test_misma_posicion_por_ambas_entradas(self):
+        """Test que verifica que la posición de un juego no comparte valor con la del evaluador."""
+        color = self.game.get_jugador_actual().get_color()
+        pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, color)
+        # Con turno la equity es del que mueve; como posición ya jugada, del rival
+        self.assertEqual(self.cache.evaluar_juego(self.game, lambda game: 0.3), 0.3)
+        self.assertEqual(self.cache(pos, 0), sum(pos))
+        self.assertEqual(self.cache.evaluar_juego(self.game, lambda game: -1), 0.3)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_colores_comparten_sin_con_color(self):
+        """Test que verifica que sin con_color ambos colores usan la misma entrada."""
+        cache = EvaluationCache(self.__evaluar__, con_color=False)
+        self.assertEqual(cache(self.pos, 0, 'white'), cache(self.pos, 0, 'black'))
+        self.assertEqual(len(self.llamadas), 1)
+        self.assertEqual(self.llamadas[0][2], 'white')
+
+        self.cache(self.pos, 0, 'white')
+        self.cache(self.pos, 0, 'black')
+        self.assertEqual(len(self.cache), 2)
+
+    def test_bot_comparte_entradas_entre_colores(self):
+        """Test que verifica que la búsqueda de un color reutiliza las posiciones del otro."""
+        cache = EvaluationCache(evaluar_heuristica, con_color=False)
+        conteos = self.game.get_board().get_conteos()
+        for color in ('white', 'black'):
+            # La posición inicial es simétrica: en perspectiva es la misma para ambos
+            game = Game.desde_posicion_id(position_id.codificar(conteos, 0, 0, color),
+                                          dados=DadosGrabados([(3, 1)]))
+            game.tirar_dados()
+            ExpectiminimaxBot(0, evaluador=cache).elegir_jugada(game)
+            if color == 'white':
+                fallos = cache.get_estadisticas()['fallos']
+        self.assertEqual(cache.get_estadisticas()['fallos'], fallos)
+        self.assertGreater(cache.get_estadisticas()['aciertos'], 0)
+
+    def test_desalojo_lru(self):
+        """Test que verifica que se desaloja la posición usada hace más tiempo."""
+        for fuera in range(3):
+            self.cache(self.pos, fuera)
+        self.cache(self.pos, 0)          # La primera pasa a ser la más reciente
+        self.cache(self.pos, 3)          # Se desaloja la de fuera=1
+        self.assertEqual(len(self.cache), 3)
+        self.assertIn(clave_canonica(self.pos, 0), self.cache)
+        self.assertNotIn(clave_canonica(self.pos, 1), self.cache)
+        self.assertEqual(self.cache.get_estadisticas()['desalojos'], 1)
+
+    def test_limite_de_bytes(self):
+        """Test que verifica que la memoria aproximada no supera el límite."""
+        cache = EvaluationCache(self.__evaluar__, max_entradas=None, max_bytes=1000)
+        for fuera in range(15):
+            cache(self.pos, fuera)
+        estadisticas = cache.get_estadisticas()
+        self.assertLessEqual(estadisticas['bytes'], 1000)
+        self.assertGreater(estadisticas['desalojos'], 0)
+        self.assertEqual(estadisticas['entradas'] + estadisticas['desalojos'], 15)
+
+    def test_evaluar_juego(self):
+        """Test que verifica la evaluación de juegos con cache."""
+        llamadas = []
+        for _ in range(2):
+            valor = self.cache.evaluar_juego(self.game, lambda game: llamadas.append(1) or 7)
+        self.assertEqual(valor, 7)
+        self.assertEqual(len(llamadas), 1)
+
+    def test_limpiar(self):
+        """Test que verifica que limpiar vacía la cache y los contadores."""
+        self.cache(self.pos, 0)
+        self.cache.limpiar()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.get_estadisticas()['fallos'], 0)
+        self.assertEqual(self.cache.get_estadisticas()['bytes'], 0)
+
+    def test_como_evaluador_de_expectiminimax(self):
+        """Test que verifica que la búsqueda elige lo mismo con y sin cache."""
+        self.game.tirar_dados()
+        cache = EvaluationCache(evaluar_heuristica)
+        sin_cache = ExpectiminimaxBot(1).elegir_jugada(self.game)
+        con_cache = ExpectiminimaxBot(1, evaluador=cache).elegir_jugada(self.game)
+        self.assertEqual(sin_cache, con_cache)
+        self.assertGreater(cache.get_estadisticas()['fallos'], 0)
+
+    def test_limites_invalidos(self):
+        """Test que verifica que se rechazan límites ausentes o no positivos."""
+        with self.assertRaises(ValueError):
+            EvaluationCache(max_entradas=None)
+        with self.assertRaises(ValueError):
+            EvaluationCache(max_entradas=0)
+        with self.assertRaises(ValueError):
+            EvaluationCache(max_bytes=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+import time
+import unittest
+
+from core.checker import Checker
+from core.dice import Dice
+from core.expectiminimax import ExpectiminimaxBot, dar_vuelta, evaluar_heuristica
+from core.game import Game
+from core.move_generator import a_perspectiva, generar_jugadas_perspectiva
+
+
+class TestExpectiminimax(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.game.iniciar_juego("Ana", "Carlos", Dice(semilla=5))
+
+    def __preparar_bear_off__(self, dados):
+        """Deja a las blancas con dos fichas en casa y el resto sacadas."""
+        while self.game.get_jugador_actual().get_color() != 'white':
+            self.game.cambiar_turno()
+        board = self.game.get_board()
+        for i in range(1, 25):
+            while board.tiene_fichas(i):
+                board.quitar_ficha(i)
+        board.agregar_ficha(19, Checker('white'))
+        board.agregar_ficha(20, Checker('white'))
+        board.agregar_ficha(1, Checker('black'))
+        self.game.__dict__['__home__']['white'] = [Checker('white')] * 13
+        board.set_fuera('white', 13)
+        self.game.__dict__['__home__']['black'] = [Checker('black')] * 14
+        board.set_fuera('black', 14)
+        self.game.__dict__['__movimientos_disponibles__'] = dados
+        self.game.__dict__['__clave_zobrist__'] = self.game.__calcular_hash__()
+
+    def test_dar_vuelta_es_involucion(self):
+        """Test que verifica que dar vuelta dos veces devuelve la posición original."""
+        pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, 'white')
+        self.assertEqual(dar_vuelta(dar_vuelta(pos, 0), 0), pos)
+        self.assertEqual(dar_vuelta(pos, 0), a_perspectiva(
+            self.game.get_board().get_conteos(), 0, 0, 'black'))
+
+    def test_dar_vuelta_deduce_barra(self):
+        """Test que verifica que las fichas rivales faltantes quedan en su barra."""
+        pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, 'white')
+        # Se captura una de las dos fichas negras del punto 24 (a 1 pip de salir)
+        pos[1] = -1
+        self.assertEqual(dar_vuelta(pos, 0)[25], 1)
+        self.assertEqual(dar_vuelta(pos, 1)[25], 0)
+
+    def test_evaluacion_simetrica_en_inicio(self):
+        """Test que verifica que la posición inicial no favorece a nadie salvo por el turno."""
+        pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, 'white')
+        self.assertLessEqual(abs(evaluar_heuristica(pos, 0)), 1)
+        self.assertAlmostEqual(evaluar_heuristica(pos, 0),
+                               evaluar_heuristica(dar_vuelta(pos, 0), 0))
+
+    def test_profundidades_dan_jugadas_legales(self):
+        """Test que verifica que cada profundidad devuelve una jugada que se puede aplicar."""
+        for profundidad in (0, 1, 2):
+            bot = ExpectiminimaxBot(profundidad)
+            self.game.tirar_dados()
+            jugada, equity = bot.elegir_jugada(self.game)
+            self.assertIn(jugada, self.game.generar_jugadas())
+            self.assertTrue(-2 <= equity <= 2)
+            self.assertTrue(self.game.aplicar(jugada))
+            self.game.cambiar_turno()
+
+    def test_no_modifica_el_juego(self):
+        """Test que verifica que la búsqueda no cambia el estado del juego."""
+        self.game.tirar_dados()
+        estado = self.game.get_estado_juego()
+        clave = self.game.get_hash()
+        ExpectiminimaxBot(2, ancho_raiz=2).elegir_jugada(self.game)
+        self.assertEqual(self.game.get_estado_juego(), estado)
+        self.assertEqual(self.game.get_hash(), clave)
+
+    def test_sin_dados_no_hay_jugada(self):
+        """Test que verifica que sin dados no se elige jugada."""
+        self.assertEqual(ExpectiminimaxBot().elegir_jugada(self.game), (None, None))
+
+    def test_elige_jugada_ganadora(self):
+        """Test que verifica que se saca la última ficha cuando es posible."""
+        self.__preparar_bear_off__([6, 5])
+        jugada, equity = ExpectiminimaxBot(1).elegir_jugada(self.game)
+        self.assertEqual(sorted(jugada), [(19, 25), (20, 25)])
+        self.assertEqual(equity, 1.0)
+
+    def test_gana_con_gammon(self):
+        """Test que verifica que ganar sin que el rival saque fichas vale 2."""
+        self.__preparar_bear_off__([6, 5])
+        self.game.__dict__['__home__']['black'] = []
+        self.game.get_board().set_fuera('black', 0)
+        _, equity = ExpectiminimaxBot(0).elegir_jugada(self.game)
+        self.assertEqual(equity, 2.0)
+
+    def test_tabla_de_transposicion_acotada(self):
+        """Test que verifica que la tabla no supera su capacidad."""
+        bot = ExpectiminimaxBot(2, capacidad_tabla=50, ancho_raiz=2)
+        self.game.tirar_dados()
+        bot.elegir_jugada(self.game)
+        self.assertEqual(bot.get_tamano_tabla(), 50)
+        bot.limpiar_tabla()
+        self.assertEqual(bot.get_tamano_tabla(), 0)
+
+    def test_tabla_reutiliza_valores(self):
+        """Test que verifica que repetir la búsqueda da el mismo resultado desde la tabla."""
+        bot = ExpectiminimaxBot(1)
+        self.game.tirar_dados()
+        primera = bot.elegir_jugada(self.game)
+        tamano = bot.get_tamano_tabla()
+        self.assertEqual(bot.elegir_jugada(self.game), primera)
+        self.assertEqual(bot.get_tamano_tabla(), tamano)
+
+    def test_tabla_indexada_por_clave_zobrist(self):
+        """Test que verifica que la tabla usa la clave Zobrist del juego y la profundidad."""
+        self.game.tirar_dados()
+        bot = ExpectiminimaxBot(1)
+        jugada, equity = bot.elegir_jugada(self.game)
+        self.game.aplicar(jugada)
+        self.game.cambiar_turno()
+        self.assertEqual(bot.__tabla__[(self.game.get_hash(), 1)], equity)
+
+    def test_raiz_sin_poda(self):
+        """Test que verifica que por defecto se busca cada jugada de la raíz."""
+        self.game.tirar_dados()
+        color = self.game.get_jugador_actual().get_color()
+        pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, color)
+        finales = generar_jugadas_perspectiva(pos, self.game.get_movimientos_disponibles())
+        bot = ExpectiminimaxBot(1)
+        _, equity = bot.elegir_jugada(self.game)
+        self.assertEqual(equity, max(bot.__valor__(final, 0, 1, color) for final in finales))
+
+        _, equity_podada = ExpectiminimaxBot(1, ancho_raiz=1).elegir_jugada(self.game)
+        self.assertLessEqual(equity_podada, equity)
+
+    def test_limite_de_tiempo(self):
+        """Test que verifica que con límite de tiempo la búsqueda se corta y da una jugada legal."""
+        self.game.tirar_dados()
+        legales = self.game.generar_jugadas()
+        # Un límite mínimo solo deja completar la pasada estática
+        jugada, equity = ExpectiminimaxBot(2, limite_segundos=1e-9).elegir_jugada(self.game)
+        self.assertIn(jugada, legales)
+        self.assertEqual((jugada, equity), ExpectiminimaxBot(0).elegir_jugada(self.game))
+
+        # Con tiempo de sobra se llega al mismo resultado que sin límite
+        inicio = time.perf_counter()
+        resultado = ExpectiminimaxBot(1, limite_segundos=60).elegir_jugada(self.game)
+        self.assertLess(time.perf_counter() - inicio, 60)
+        self.assertEqual(resultado, ExpectiminimaxBot(1).elegir_jugada(self.game))
+
+    def test_parametros_invalidos(self):
+        """Test que verifica que se rechazan parámetros fuera de rango."""
+        with self.assertRaises(ValueError):
+            ExpectiminimaxBot(3)
+        with self.assertRaises(ValueError):
+            ExpectiminimaxBot(1, ancho=0)
+        with self.assertRaises(ValueError):
+            ExpectiminimaxBot(1, capacidad_tabla=0)
+        with self.assertRaises(ValueError):
+            ExpectiminimaxBot(1, ancho_raiz=0)
+        with self.assertRaises(ValueError):
+            ExpectiminimaxBot(1, limite_segundos=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
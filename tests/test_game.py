@@ -950,5 +950,35 @@ class TestBackgammonGame(unittest.TestCase):
             self.assertFalse(resultado)
 
 
+    def test_get_pip_count(self):
+        """Test que verifica el pip count inicial y tras un movimiento."""
+        self.game.iniciar_juego("Ana", "Carlos")
+        while self.game.get_jugador_actual().get_color() != 'white':
+            self.game.cambiar_turno()
+        self.assertEqual(self.game.get_pip_count('white'), 167)
+        self.assertEqual(self.game.get_pip_count('black'), 167)
+        
+        self.game.__dict__['__movimientos_disponibles__'] = [3, 1]
+        self.game.hacer_movimiento(1, 4)
+        self.assertEqual(self.game.get_pip_count('white'), 164)
+        self.assertEqual(self.game.get_estado_juego()['pips_white'], 164)
+
+    def test_bear_off_ficha_no_mas_lejana_con_dado_mayor(self):
+        """Test que verifica que con dado mayor solo sale la ficha más lejana."""
+        self.game.iniciar_juego("Ana", "Carlos")
+        board = self.game.get_board()
+        while self.game.get_jugador_actual().get_color() != 'white':
+            self.game.cambiar_turno()
+        for i in range(1, 25):
+            while board.tiene_fichas(i):
+                board.quitar_ficha(i)
+        board.agregar_ficha(20, Checker('white'))
+        board.agregar_ficha(23, Checker('white'))
+        self.game.__dict__['__movimientos_disponibles__'] = [6]
+        
+        self.assertFalse(self.game.es_movimiento_valido(23, 25))
+        self.assertTrue(self.game.es_movimiento_valido(20, 25))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
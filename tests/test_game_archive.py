@@ -0,0 +1,163 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.game_archive import VENTANA_CRC, GameArchive, MetadatosPartida, actualizar_indice
+from core.game_record import (
+    CABECERA, GameRecord, GameRecordWriter, Turno, escribir_varint, leer_partidas
+)
+from core.simulation import simular
+
+
+class TestGameArchive(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directorio = tempfile.mkdtemp()
+        cls.ruta = os.path.join(cls.directorio, 'partidas.bin')
+        simular(12, semilla=1, ruta_registro=cls.ruta)
+        cls.partidas = list(leer_partidas(cls.ruta))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directorio)
+
+    def setUp(self):
+        self.archivo = GameArchive(self.ruta)
+
+    def tearDown(self):
+        self.archivo.cerrar()
+
+    def test_acceso_aleatorio(self):
+        """Test que verifica que cada partida se lee igual que con el lector secuencial."""
+        self.assertEqual(len(self.archivo), 12)
+        for indice in (7, 0, 11, 3):
+            self.assertEqual(self.archivo[indice], self.partidas[indice])
+        self.assertEqual(self.archivo[-1], self.partidas[-1])
+        with self.assertRaises(IndexError):
+            self.archivo[12]
+
+    def test_rebanadas_e_iteracion(self):
+        """Test que verifica las rebanadas y la iteración completa."""
+        self.assertEqual(self.archivo[2:5], self.partidas[2:5])
+        self.assertEqual(self.archivo[::4], self.partidas[::4])
+        self.assertEqual(list(self.archivo), self.partidas)
+
+    def test_metadatos(self):
+        """Test que verifica que los metadatos del índice coinciden con las partidas."""
+        for indice, partida in enumerate(self.partidas):
+            self.assertEqual(self.archivo.get_metadatos(indice),
+                             MetadatosPartida(partida.ganador, len(partida.turnos),
+                                              partida.gammon))
+
+    def test_filtrar(self):
+        """Test que verifica el filtrado por ganador, gammon y largo."""
+        blancas = self.archivo.filtrar(ganador='white')
+        self.assertEqual(blancas, [i for i, p in enumerate(self.partidas)
+                                   if p.ganador == 'white'])
+        gammons = self.archivo.filtrar(gammon=True)
+        self.assertEqual(gammons, [i for i, p in enumerate(self.partidas) if p.gammon])
+        largas = self.archivo.filtrar(min_turnos=100, max_turnos=150)
+        self.assertEqual(largas, [i for i, p in enumerate(self.partidas)
+                                  if 100 <= len(p.turnos) <= 150])
+
+    def test_reproducir(self):
+        """Test que verifica que se reconstruye el Game de una partida."""
+        game = self.archivo.reproducir(5)
+        self.assertTrue(game.esta_terminado())
+        self.assertEqual(game.get_ganador().get_color(), self.partidas[5].ganador)
+
+    def test_indice_incremental(self):
+        """Test que verifica que el índice se completa cuando el registro crece."""
+        ruta = os.path.join(self.directorio, 'creciente.bin')
+        registro = GameRecord(None, ("A", "B"), 'white', [Turno(2, 1, ((1, 3), (3, 4)))],
+                              None, False)
+        with GameRecordWriter(ruta) as escritor:
+            escritor.escribir(registro)
+        with GameArchive(ruta) as archivo:
+            self.assertEqual(len(archivo), 1)
+            self.assertIsNone(archivo.get_metadatos(0).ganador)
+
+        tamano_indice = os.path.getsize(ruta + '.idx')
+        with GameRecordWriter(ruta) as escritor:
+            escritor.escribir(registro._replace(ganador='black', gammon=True))
+        actualizar_indice(ruta)
+        self.assertGreater(os.path.getsize(ruta + '.idx'), tamano_indice)
+        with GameArchive(ruta) as archivo:
+            self.assertEqual(len(archivo), 2)
+            self.assertEqual(archivo.get_metadatos(1), MetadatosPartida('black', 1, True))
+            self.assertEqual(archivo.filtrar(ganador='black'), [1])
+
+    def test_registro_vacio(self):
+        """Test que verifica un registro sin partidas."""
+        ruta = os.path.join(self.directorio, 'vacio.bin')
+        GameRecordWriter(ruta).cerrar()
+        with GameArchive(ruta) as archivo:
+            self.assertEqual(len(archivo), 0)
+            self.assertEqual(archivo.filtrar(), [])
+
+    def test_indice_de_otro_registro(self):
+        """Test que verifica que un índice que no corresponde al registro se rearma."""
+        ruta = os.path.join(self.directorio, 'reemplazado.bin')
+        shutil.copy(self.ruta, ruta)
+        actualizar_indice(ruta)
+        # Otro registro más grande en la misma ruta: el largo indexado sigue entrando
+        os.remove(ruta)
+        simular(20, semilla=2, ruta_registro=ruta)
+        self.assertGreater(os.path.getsize(ruta), os.path.getsize(self.ruta))
+        with GameArchive(ruta) as archivo:
+            self.assertEqual(list(archivo), list(leer_partidas(ruta)))
+
+    def test_registro_reescrito_fuera_de_la_ventana(self):
+        """Test que verifica que un cambio fuera de la ventana del CRC se detecta por el mtime."""
+        ruta = os.path.join(self.directorio, 'grande.bin')
+        registro = GameRecord(None, ("A", "B"), 'white', [Turno(2, 1, ((1, 3), (3, 4)))],
+                              'white', False)
+        with GameRecordWriter(ruta) as escritor:
+            for _ in range(VENTANA_CRC // 4):
+                escritor.escribir(registro)
+        self.assertGreater(os.path.getsize(ruta), 2 * VENTANA_CRC)
+        with GameArchive(ruta) as archivo:
+            self.assertEqual(archivo.get_metadatos(0).ganador, 'white')
+
+        # Se cambia el ganador de la primera partida sin cambiar el tamaño
+        with open(ruta, 'r+b') as archivo:
+            datos = bytearray(archivo.read())
+            datos[len(CABECERA) + 1] |= 8
+            archivo.seek(0)
+            archivo.write(datos)
+        estado = os.stat(ruta)
+        os.utime(ruta, ns=(estado.st_atime_ns, estado.st_mtime_ns + 10 ** 9))
+        with GameArchive(ruta) as archivo:
+            self.assertEqual(archivo.get_metadatos(0).ganador, 'black')
+            self.assertEqual(archivo.get_metadatos(1).ganador, 'white')
+
+    def test_partida_corrupta(self):
+        """Test que verifica que una partida dañada da ValueError al leerla."""
+        ruta = os.path.join(self.directorio, 'corrupto.bin')
+        # Banderas, dos turnos y el largo del primer nombre; falta el segundo nombre
+        cuerpo = bytearray([0, 2, 0])
+        partida = bytearray()
+        escribir_varint(len(cuerpo), partida)
+        with open(ruta, 'wb') as archivo:
+            archivo.write(CABECERA + partida + cuerpo + b'\x80')
+        with GameArchive(ruta) as archivo:
+            # El varint cortado al final es una partida que todavía se está escribiendo
+            self.assertEqual(len(archivo), 1)
+            self.assertEqual(archivo.get_metadatos(0).turnos, 2)
+            with self.assertRaises(ValueError):
+                archivo[0]
+
+    def test_registro_invalido(self):
+        """Test que verifica que se rechaza un archivo que no es un registro."""
+        ruta = os.path.join(self.directorio, 'invalido.bin')
+        with open(ruta, 'wb') as archivo:
+            archivo.write(b'esto no es un registro')
+        with self.assertRaises(ValueError):
+            GameArchive(ruta)
+        self.assertFalse(os.path.exists(ruta + '.idx'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.compact_board import CompactBoard
+from core.game_record import (
+    CABECERA, DadosGrabados, GameRecord, GameRecordWriter, Turno, codificar_movimiento,
+    codificar_partida, decodificar_cuerpo, decodificar_movimiento, escribir_varint,
+    leer_metadatos, leer_partidas, leer_varint, reproducir
+)
+from core.simulation import jugar_partida, politica_aleatoria, politica_pips, simular
+
+
+class TestGameRecord(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.ruta = os.path.join(self.directorio, 'partidas.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def test_varint(self):
+        """Test que verifica la ida y vuelta de varints de distintos tamaños."""
+        for valor in (0, 1, 127, 128, 300, 2 ** 63 - 1):
+            buffer = bytearray()
+            escribir_varint(valor, buffer)
+            self.assertEqual(leer_varint(buffer, 0), (valor, len(buffer)))
+        buffer = bytearray()
+        escribir_varint(127, buffer)
+        self.assertEqual(len(buffer), 1)
+        with self.assertRaises(ValueError):
+            escribir_varint(-1, bytearray())
+        with self.assertRaises(ValueError):
+            leer_varint(b'\x80\x80', 0)
+
+    def test_movimientos_en_un_byte(self):
+        """Test que verifica la codificación de movimientos de ambos colores."""
+        casos = [
+            ((1, 7), 'white'), ((0, 3), 'white'), ((20, 25), 'white'),
+            ((24, 18), 'black'), ((0, 22), 'black'), ((3, 25), 'black'),
+        ]
+        for movimiento, color in casos:
+            byte = codificar_movimiento(*movimiento, color)
+            self.assertLess(byte, 256)
+            self.assertEqual(decodificar_movimiento(byte, color), movimiento)
+        with self.assertRaises(ValueError):
+            codificar_movimiento(1, 9, 'white')
+        with self.assertRaises(ValueError):
+            decodificar_movimiento(25 * 6, 'white')
+
+    def test_ida_y_vuelta(self):
+        """Test que verifica que una partida se decodifica igual a como se codificó."""
+        registro = GameRecord(12345, ("Ana", "Carlos ñ"), 'black', [
+            Turno(6, 5, ((24, 18), (18, 13))),
+            Turno(3, 3, ((1, 4), (1, 4), (12, 15), (12, 15))),
+            Turno(2, 1, ()),
+        ], 'white', True)
+        codificada = codificar_partida(registro)
+        largo, inicio = leer_varint(codificada, 0)
+        self.assertEqual(largo, len(codificada) - inicio)
+        self.assertEqual(decodificar_cuerpo(codificada, inicio), registro)
+        self.assertEqual(leer_metadatos(codificada, inicio), ('white', True, 3))
+
+    def test_no_depende_de_la_semilla(self):
+        """Test que verifica que las tiradas y movimientos se guardan aunque haya semilla."""
+        registro = jugar_partida(politica_aleatoria, politica_aleatoria, 6, grabar=True)['registro']
+        # Otra semilla no cambia la partida decodificada: la semilla es solo un dato
+        otra = registro._replace(semilla=registro.semilla + 1)
+        codificada = codificar_partida(otra)
+        decodificada = decodificar_cuerpo(codificada, leer_varint(codificada, 0)[1])
+        self.assertEqual(decodificada.turnos, registro.turnos)
+
+    def test_partida_sin_terminar_ni_semilla(self):
+        """Test que verifica partidas sin semilla ni ganador."""
+        registro = GameRecord(None, ("A", "B"), 'white', [Turno(1, 2, ((1, 2), (2, 4)))],
+                              None, False)
+        codificada = codificar_partida(registro)
+        self.assertEqual(decodificar_cuerpo(codificada, 1), registro)
+
+    def test_escritor_y_lector(self):
+        """Test que verifica que se leen todas las partidas escritas en orden."""
+        resultados = [jugar_partida(politica_aleatoria, politica_aleatoria, i, grabar=True)
+                      for i in range(3)]
+        with GameRecordWriter(self.ruta) as escritor:
+            for resultado in resultados[:2]:
+                escritor.escribir(resultado['registro'])
+        # Un segundo escritor agrega al final sin repetir la cabecera
+        with GameRecordWriter(self.ruta) as escritor:
+            escritor.escribir(resultados[2]['registro'])
+            self.assertEqual(escritor.get_partidas_escritas(), 1)
+
+        with open(self.ruta, 'rb') as archivo:
+            self.assertEqual(archivo.read(len(CABECERA)), CABECERA)
+        leidas = list(leer_partidas(self.ruta))
+        self.assertEqual(leidas, [r['registro'] for r in resultados])
+
+    def test_lector_es_perezoso(self):
+        """Test que verifica que el lector entrega partidas de a una."""
+        simular(2, semilla=1, ruta_registro=self.ruta)
+        lector = leer_partidas(self.ruta)
+        self.assertIsInstance(next(lector), GameRecord)
+        self.assertIsInstance(next(lector), GameRecord)
+        with self.assertRaises(StopIteration):
+            next(lector)
+
+    def test_reproducir_partida(self):
+        """Test que verifica que reproducir una partida llega al mismo resultado."""
+        resultado = jugar_partida(politica_pips, politica_aleatoria, 4, grabar=True)
+        registro = resultado['registro']
+        game = reproducir(registro, CompactBoard)
+        self.assertTrue(game.esta_terminado())
+        self.assertEqual(game.get_ganador().get_color(), resultado['ganador'])
+        self.assertEqual(game.get_jugador_actual().get_color(), resultado['ganador'])
+
+        parcial = reproducir(registro, hasta_turno=1)
+        self.assertEqual(parcial.get_jugador_actual().get_color(),
+                         'black' if registro.primer_color == 'white' else 'white')
+
+    def test_tamano_compacto(self):
+        """Test que verifica que una partida ocupa un byte por turno y uno por movimiento."""
+        resultado = simular(5, semilla=2, ruta_registro=self.ruta)
+        bytes_partidas = (resultado['turnos_promedio'] + resultado['movimientos_promedio']) * 5
+        self.assertLess(os.path.getsize(self.ruta), bytes_partidas + 5 * 40)
+
+    def test_archivo_invalido(self):
+        """Test que verifica que se rechazan archivos que no son registros."""
+        with open(self.ruta, 'wb') as archivo:
+            archivo.write(b'JSON')
+        with self.assertRaises(ValueError):
+            list(leer_partidas(self.ruta))
+        with self.assertRaises(ValueError):
+            GameRecordWriter(self.ruta)
+
+    def test_archivo_truncado(self):
+        """Test que verifica que se detecta una partida cortada."""
+        simular(1, semilla=3, ruta_registro=self.ruta)
+        with open(self.ruta, 'rb') as archivo:
+            datos = archivo.read()
+        with open(self.ruta, 'wb') as archivo:
+            archivo.write(datos[:-5])
+        with self.assertRaises(ValueError):
+            list(leer_partidas(self.ruta))
+
+    def test_cuerpo_truncado_o_corrupto(self):
+        """Test que verifica que un cuerpo dañado da ValueError y no IndexError."""
+        registro = jugar_partida(politica_aleatoria, politica_aleatoria, 7, grabar=True)['registro']
+        codificada = codificar_partida(registro)
+        _, inicio = leer_varint(codificada, 0)
+        for corte in (inicio, inicio + 1, inicio + 5, len(codificada) - 1):
+            with self.assertRaises(ValueError):
+                decodificar_cuerpo(codificada[:corte], inicio)
+        with self.assertRaises(ValueError):
+            decodificar_cuerpo(codificada + b'\x00', inicio, len(codificada) + 1)
+        with self.assertRaises(ValueError):
+            leer_metadatos(b'', 0)
+
+    def test_dados_grabados(self):
+        """Test que verifica que los dados grabados repiten la secuencia."""
+        dados = DadosGrabados([(3, 3), (6, 1)])
+        self.assertEqual(dados.tirar(), [3, 3, 3, 3])
+        self.assertEqual(dados.tirar(), [6, 1])
+        self.assertEqual(dados.get_valores(), (6, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import copy
+import pickle
+import random
+import unittest
+
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import TIPOS_MOVIMIENTO, Game, GameInstrumentado
+from core.game_record import DadosGrabados
+
+
+class TestMetricas(unittest.TestCase):
+
+    def test_sin_instrumentar_no_hay_costo(self):
+        """Test que verifica que sin instrumentar se usan los métodos de la clase."""
+        game = Game()
+        game.iniciar_juego("Ana", "Carlos")
+        self.assertIsNone(game.get_metricas())
+        self.assertNotIn('tirar_dados', vars(game))
+        self.assertNotIn('__ejecutar_movimiento__', vars(game))
+        game.reiniciar_metricas()
+
+    def test_cuenta_llamadas_por_metodo(self):
+        """Test que verifica las llamadas contadas de los métodos públicos."""
+        game = Game(instrumentar=True)
+        game.iniciar_juego("Ana", "Carlos", Dice(semilla=1))
+        game.tirar_dados()
+        game.tiene_movimientos_disponibles()
+        jugada = game.generar_jugadas()[0]
+        game.aplicar(jugada)
+        game.deshacer()
+        game.cambiar_turno()
+
+        metodos = game.get_metricas()['metodos']
+        for nombre in ('tirar_dados', 'generar_jugadas', 'aplicar', 'deshacer', 'cambiar_turno',
+                       'tiene_movimientos_disponibles'):
+            self.assertEqual(metodos[nombre]['llamadas'], 1, nombre)
+            self.assertGreater(metodos[nombre]['segundos'], 0)
+        # aplicar valida cada movimiento con es_movimiento_valido
+        self.assertGreaterEqual(metodos['es_movimiento_valido']['llamadas'], len(jugada))
+
+    def test_tipos_de_movimiento(self):
+        """Test que verifica la clasificación de movimientos por tipo."""
+        game = Game(CompactBoard, instrumentar=True)
+        # La primera tirada decide que empiezan las blancas
+        game.iniciar_juego("Ana", "Carlos", DadosGrabados([(2, 1), (1, 2), (6, 5), (4, 1)]))
+        game.tirar_dados()
+        self.assertTrue(game.hacer_movimiento(1, 2))   # normal
+        game.cambiar_turno()
+        game.tirar_dados()
+        self.assertTrue(game.hacer_movimiento(8, 2))   # captura
+        game.cambiar_turno()
+        game.tirar_dados()
+        self.assertTrue(game.hacer_movimiento(0, 4))   # entrada desde la barra
+
+        movimientos = game.get_metricas()['movimientos']
+        self.assertEqual(set(movimientos), set(TIPOS_MOVIMIENTO))
+        self.assertEqual({tipo: valores['llamadas'] for tipo, valores in movimientos.items()},
+                         {'normal': 1, 'captura': 1, 'entrada_barra': 1, 'bear_off': 0})
+
+    def test_partida_completa_y_reinicio(self):
+        """Test que verifica una partida instrumentada y la puesta a cero."""
+        game = Game(CompactBoard, instrumentar=True)
+        game.iniciar_juego("Ana", "Carlos", Dice(semilla=3))
+        rng = random.Random(3)
+        while not game.esta_terminado():
+            game.tirar_dados()
+            jugadas = game.generar_jugadas()
+            if jugadas:
+                game.aplicar(jugadas[rng.randrange(len(jugadas))])
+            game.cambiar_turno()
+        metricas = game.get_metricas()
+        self.assertGreater(metricas['movimientos']['bear_off']['llamadas'], 0)
+        self.assertGreater(metricas['movimientos']['normal']['llamadas'], 0)
+
+        game.reiniciar_metricas()
+        metricas = game.get_metricas()
+        self.assertTrue(all(valores['llamadas'] == 0 for grupo in metricas.values()
+                            for valores in grupo.values()))
+
+        game.reiniciar_juego()
+        game.iniciar_juego("Ana", "Carlos")
+        self.assertIsNotNone(game.get_metricas())
+        self.assertIsNotNone(game.clonar().get_metricas())
+
+    def test_copias_miden_sobre_si_mismas(self):
+        """Test que verifica que deepcopy y pickle de un juego instrumentado son independientes."""
+        game = Game(CompactBoard, instrumentar=True)
+        game.iniciar_juego("Ana", "Carlos", Dice(semilla=2))
+        game.tirar_dados()
+        self.assertIsInstance(game, GameInstrumentado)
+        self.assertNotIn('tirar_dados', vars(game))
+
+        for copia in (copy.deepcopy(game), pickle.loads(pickle.dumps(game)), game.clonar()):
+            antes = game.snapshot()
+            copia.aplicar(copia.generar_jugadas()[0])
+            self.assertEqual(game.snapshot(), antes)
+            self.assertEqual(game.get_metricas()['metodos']['aplicar']['llamadas'], 0)
+            self.assertEqual(copia.get_metricas()['metodos']['aplicar']['llamadas'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import random
+import unittest
+
+from core.checker import Checker
+from core.game import Game
+from core.move_generator import (
+    a_perspectiva, generar_jugadas, generar_jugadas_perspectiva, jugada_aleatoria,
+    jugada_aleatoria_perspectiva, movimientos_simples, aplicar_movimiento
+)
+
+
+def conteos_vacios():
+    """Retorna un tablero vacío como conteos."""
+    return [0] * 24
+
+
+class TestMoveGenerator(unittest.TestCase):
+    
+    def test_a_perspectiva_blancas_y_negras(self):
+        """Test que verifica la conversión a posición en perspectiva."""
+        conteos = conteos_vacios()
+        conteos[0] = 2     # Punto 1: 2 blancas (24 pips)
+        conteos[5] = -5    # Punto 6: 5 negras
+        pos_white = a_perspectiva(conteos, 1, 3, 'white')
+        self.assertEqual(pos_white[24], 2)
+        self.assertEqual(pos_white[19], -5)
+        self.assertEqual(pos_white[25], 1)
+        self.assertEqual(pos_white[0], 3)
+        
+        pos_black = a_perspectiva(conteos, 0, 0, 'black')
+        self.assertEqual(pos_black[6], 5)
+        self.assertEqual(pos_black[1], -2)
+    
+    def test_movimientos_simples_punto_bloqueado(self):
+        """Test que verifica que no se mueve a un punto con 2+ fichas rivales."""
+        pos = [0] * 26
+        pos[10] = 1
+        pos[7] = -2
+        pos[6] = -1
+        self.assertEqual(movimientos_simples(pos, 3), [])
+        self.assertEqual(movimientos_simples(pos, 4), [(10, 6)])
+    
+    def test_aplicar_movimiento_captura(self):
+        """Test que verifica que la captura deja la ficha propia en el punto."""
+        pos = [0] * 26
+        pos[10] = 1
+        pos[6] = -1
+        nueva = aplicar_movimiento(pos, 10, 6)
+        self.assertEqual(nueva[6], 1)
+        self.assertEqual(nueva[10], 0)
+        self.assertEqual(pos[10], 1)
+    
+    def test_posicion_inicial_cantidad_jugadas(self):
+        """Test que verifica la cantidad conocida de jugadas en la apertura."""
+        game = Game()
+        game.iniciar_juego()
+        conteos = game.get_board().get_conteos()
+        self.assertEqual(len(generar_jugadas(conteos, 0, 0, 'white', [3, 1])), 16)
+        self.assertEqual(len(generar_jugadas(conteos, 0, 0, 'black', [3, 1])), 16)
+    
+    def test_debe_usar_ambos_dados(self):
+        """Test que verifica que se descartan jugadas que usan un solo dado."""
+        conteos = conteos_vacios()
+        conteos[0] = 1      # Blanca en punto 1
+        conteos[6] = -2     # Punto 7 bloqueado
+        conteos[4] = -2     # Punto 5 bloqueado
+        # Con 6-4: 1->7 bloqueado, 1->5 bloqueado: ninguna jugada
+        self.assertEqual(generar_jugadas(conteos, 0, 0, 'white', [6, 4]), [])
+        # Con 2-4: 1->5 bloqueado y 1->3->7 bloqueado; solo se puede usar el 2
+        self.assertEqual(generar_jugadas(conteos, 0, 0, 'white', [2, 4]), [((1, 3),)])
+        # Con 2-3: 1->3->6 usa ambos dados y es la única jugada completa
+        self.assertEqual(generar_jugadas(conteos, 0, 0, 'white', [2, 3]), [((1, 3), (3, 6))])
+    
+    def test_debe_usar_dado_mayor(self):
+        """Test que verifica la regla del dado mayor cuando solo entra uno."""
+        conteos = conteos_vacios()
+        conteos[0] = 1      # Blanca en punto 1
+        conteos[9] = -2     # Punto 10 bloqueado: 1+4+5 no llega
+        # Con 5-4 se puede jugar 1->6 o 1->5 pero no ambos: se exige el 5
+        self.assertEqual(generar_jugadas(conteos, 0, 0, 'white', [4, 5]), [((1, 6),)])
+    
+    def test_entrada_desde_barra(self):
+        """Test que verifica que con fichas en la barra primero se entra."""
+        conteos = conteos_vacios()
+        conteos[23] = -1    # Negra en punto 24
+        conteos[2] = -2     # Punto 3 bloqueado
+        jugadas = generar_jugadas(conteos, 1, 14, 'white', [3, 2])
+        self.assertEqual(jugadas, [((0, 2), (2, 5))])
+    
+    def test_bear_off_con_dado_mayor(self):
+        """Test que verifica el bear off desde la ficha más lejana con dado mayor."""
+        conteos = conteos_vacios()
+        conteos[3] = -1     # Negra en punto 4
+        conteos[0] = -1     # Negra en punto 1
+        jugadas = generar_jugadas(conteos, 0, 13, 'black', [6, 5])
+        self.assertEqual(jugadas, [((4, 25), (1, 25))])
+    
+    def test_dobles_jugadas_unicas(self):
+        """Test que verifica que las permutaciones de dobles se colapsan."""
+        conteos = conteos_vacios()
+        conteos[0] = 2
+        jugadas = generar_jugadas(conteos, 0, 0, 'white', [1, 1, 1, 1])
+        # Distribuciones de 4 pasos entre dos fichas iguales: (4,0), (3,1), (2,2)
+        self.assertEqual(len(jugadas), 3)
+        for jugada in jugadas:
+            self.assertEqual(len(jugada), 4)
+    
+    def test_jugada_aleatoria_respeta_las_reglas(self):
+        """Test que verifica que la jugada al azar llega a una posición de las jugadas legales."""
+        rng = random.Random(3)
+        conteos = conteos_vacios()
+        conteos[0] = 1
+        conteos[9] = -2
+        # Solo entra un dado: se exige el mayor aunque la búsqueda al azar no lo encuentre
+        for _ in range(10):
+            self.assertEqual(jugada_aleatoria(conteos, 0, 0, 'white', [4, 5], rng), ((1, 6),))
+        conteos[4] = -2
+        conteos[6] = -2
+        self.assertEqual(jugada_aleatoria(conteos, 0, 0, 'white', [6, 4], rng), ())
+
+        game = Game()
+        game.iniciar_juego()
+        for _ in range(60):
+            game.tirar_dados()
+            color = game.get_jugador_actual().get_color()
+            pos = a_perspectiva(game.get_board().get_conteos(), len(game.get_bar(color)),
+                                len(game.get_home(color)), color)
+            dados = game.get_movimientos_disponibles()
+            finales = generar_jugadas_perspectiva(pos, dados)
+            final = pos
+            for origen, destino, _ in jugada_aleatoria_perspectiva(pos, dados, rng):
+                final = aplicar_movimiento(final, origen, destino)
+            self.assertIn(tuple(final), finales if finales else {tuple(pos)})
+            jugada = game.jugada_aleatoria(rng)
+            if jugada:
+                self.assertTrue(game.aplicar(jugada))
+            if game.esta_terminado():
+                break
+            game.cambiar_turno()
+
+    def test_game_generar_jugadas_aplicables(self):
+        """Test que verifica que cada jugada de Game se puede aplicar."""
+        game = Game()
+        game.iniciar_juego()
+        self.assertEqual(game.generar_jugadas(), [])
+        game.tirar_dados()
+        for jugada in game.generar_jugadas():
+            copia = Game()
+            copia.iniciar_juego()
+            copia.__dict__['__turno__'] = game.get_turno_actual()
+            copia.__dict__['__movimientos_disponibles__'] = game.get_movimientos_disponibles()
+            for desde, hasta in jugada:
+                self.assertTrue(copia.hacer_movimiento(desde, hasta))
+    
+    def test_hacer_movimiento_bear_off_dado_mayor(self):
+        """Test que verifica que hacer_movimiento acepta bear off con dado mayor."""
+        game = Game()
+        game.iniciar_juego()
+        while game.get_jugador_actual().get_color() != 'black':
+            game.cambiar_turno()
+        board = game.get_board()
+        for i in range(1, 25):
+            while board.tiene_fichas(i):
+                board.quitar_ficha(i)
+        board.agregar_ficha(3, Checker('black'))
+        game.__dict__['__movimientos_disponibles__'] = [6, 5]
+        self.assertTrue(game.hacer_movimiento(3, 25))
+        self.assertEqual(len(game.get_home('black')), 1)
+        self.assertEqual(game.get_movimientos_disponibles(), [5])
+
+
+if __name__ == '__main__':
+    unittest.main()
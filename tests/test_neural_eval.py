@@ -0,0 +1,147 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from core import neural_eval
+from core.dice import Dice
+from core.expectiminimax import ExpectiminimaxBot
+from core.game import Game
+from core.move_generator import a_perspectiva, generar_jugadas_perspectiva
+
+np = neural_eval.np
+
+
+@unittest.skipIf(np is None, "NumPy no está instalado")
+class TestNeuralEval(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.game.iniciar_juego("Ana", "Carlos", Dice(semilla=2))
+        self.evaluador = neural_eval.NeuralEvaluator(semilla=1)
+
+    def test_codificacion_posicion_inicial(self):
+        """Test que verifica las 198 entradas de la posición inicial."""
+        pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, 'white')
+        entradas = neural_eval.codificar_lote([pos], 0, 'white')
+        self.assertEqual(entradas.shape, (1, neural_eval.CANTIDAD_ENTRADAS))
+        fila = entradas[0]
+        # Punto 19 de las blancas (a 6 pips): 5 fichas
+        self.assertEqual(list(fila[5 * 4:6 * 4]), [1, 1, 1, 1])
+        # Punto 1 de las blancas (a 24 pips): 2 fichas
+        self.assertEqual(list(fila[23 * 4:24 * 4]), [1, 1, 0, 0])
+        # Las fichas rivales suman 15 en las unidades de conteo
+        rivales = fila[96:192].reshape(24, 4)
+        self.assertEqual(rivales[:, 0].sum(), 4)
+        self.assertEqual(list(fila[192:198]), [0, 0, 0, 0, 1, 0])
+
+    def test_codificar_barra_y_fuera(self):
+        """Test que verifica las unidades de barra y fichas fuera."""
+        pos = [3] + [0] * 24 + [2]
+        pos[1] = 10
+        pos[24] = -13
+        fila = neural_eval.codificar_lote([pos], 1, 'black')[0]
+        self.assertEqual(fila[192], 1.0)     # 2 fichas propias en la barra
+        self.assertEqual(fila[193], 0.5)     # 15 - 1 - 13 = 1 rival en la barra
+        self.assertAlmostEqual(fila[194], 3 / 15)
+        self.assertAlmostEqual(fila[195], 1 / 15)
+        self.assertEqual(list(fila[196:198]), [0, 1])
+
+    def test_codificar_juego(self):
+        """Test que verifica que el juego se codifica desde el jugador que acaba de mover."""
+        self.game.tirar_dados()
+        color = self.game.get_jugador_actual().get_color()
+        jugada, _ = self.evaluador.elegir_jugada(self.game)
+        self.game.aplicar(jugada)
+        self.game.cambiar_turno()
+        pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, color)
+
+        entradas = neural_eval.codificar_juego(self.game)
+        self.assertEqual(entradas.shape, (neural_eval.CANTIDAD_ENTRADAS,))
+        np.testing.assert_array_equal(entradas, neural_eval.codificar_lote([pos], 0, color)[0])
+
+    def test_evaluar_vector(self):
+        """Test que verifica que un vector de codificar_juego se evalúa como lote de uno."""
+        entradas = neural_eval.codificar_juego(self.game)
+        salida = self.evaluador.evaluar_lote(entradas)
+        self.assertEqual(salida.shape, (1, 3))
+        np.testing.assert_array_equal(salida, self.evaluador.evaluar_lote(entradas[None, :]))
+
+    def test_lote_igual_a_evaluacion_individual(self):
+        """Test que verifica que evaluar en lote da lo mismo que de a una posición."""
+        pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, 'white')
+        finales = list(generar_jugadas_perspectiva(pos, [6, 5]))
+        lote = neural_eval.equity(self.evaluador.evaluar_lote(
+            neural_eval.codificar_lote(finales, 0, 'white')))
+        for final, valor in zip(finales, lote):
+            self.assertAlmostEqual(self.evaluador(final, 0, 'white'), float(valor), places=5)
+
+    def test_probabilidades_consistentes(self):
+        """Test que verifica que las salidas son probabilidades coherentes."""
+        pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, 'white')
+        salida = self.evaluador.evaluar_lote(neural_eval.codificar_lote([pos] * 3, 0, 'white'))
+        self.assertEqual(salida.shape, (3, 3))
+        self.assertTrue(np.all((salida >= 0) & (salida <= 1)))
+        self.assertTrue(np.all(salida[:, 1] <= salida[:, 0]))
+        self.assertTrue(np.all(salida[:, 2] <= 1 - salida[:, 0]))
+
+    def test_elegir_jugada(self):
+        """Test que verifica que la jugada elegida es legal."""
+        self.game.tirar_dados()
+        jugada, valor = self.evaluador.elegir_jugada(self.game)
+        self.assertIn(jugada, self.game.generar_jugadas())
+        self.assertTrue(-2 <= valor <= 2)
+        self.assertTrue(self.game.aplicar(jugada))
+
+    def test_sin_dados_no_hay_jugada(self):
+        """Test que verifica que sin dados no se elige jugada."""
+        self.assertEqual(self.evaluador.elegir_jugada(self.game), (None, None))
+
+    def test_como_evaluador_de_expectiminimax(self):
+        """Test que verifica que la red se puede usar como evaluador de la búsqueda."""
+        self.game.tirar_dados()
+        bot = ExpectiminimaxBot(1, evaluador=self.evaluador)
+        jugada, _ = bot.elegir_jugada(self.game)
+        self.assertIn(jugada, self.game.generar_jugadas())
+
+    def test_expectiminimax_pasa_el_color(self):
+        """Test que verifica que la búsqueda evalúa cada posición con el color que movió."""
+        while self.game.get_jugador_actual().get_color() != 'black':
+            self.game.cambiar_turno()
+        self.game.tirar_dados()
+        colores = []
+
+        def evaluar(pos, fuera_rival, color):
+            colores.append(color)
+            return self.evaluador(pos, fuera_rival, color)
+
+        jugada, equity = ExpectiminimaxBot(0, evaluador=evaluar).elegir_jugada(self.game)
+        self.assertEqual(set(colores), {'black'})
+        self.assertAlmostEqual(equity, self.evaluador.elegir_jugada(self.game)[1], places=5)
+
+        colores.clear()
+        ExpectiminimaxBot(1, evaluador=evaluar).elegir_jugada(self.game)
+        self.assertEqual(set(colores), {'white'})
+
+    def test_guardar_y_cargar(self):
+        """Test que verifica que los pesos se guardan y se cargan sin cambios."""
+        directorio = tempfile.mkdtemp()
+        try:
+            ruta = os.path.join(directorio, 'pesos.npz')
+            self.evaluador.guardar(ruta)
+            cargado = neural_eval.NeuralEvaluator.cargar(ruta)
+            for clave, matriz in self.evaluador.get_pesos().items():
+                np.testing.assert_array_equal(cargado.get_pesos()[clave], matriz)
+        finally:
+            shutil.rmtree(directorio)
+
+    def test_pesos_invalidos(self):
+        """Test que verifica que se rechazan pesos con dimensiones incorrectas."""
+        pesos = self.evaluador.get_pesos()
+        pesos['w1'] = pesos['w1'][:10]
+        with self.assertRaises(ValueError):
+            neural_eval.NeuralEvaluator(pesos=pesos)
+
+
+if __name__ == '__main__':
+    unittest.main()
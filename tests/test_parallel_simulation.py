@@ -0,0 +1,47 @@
+import unittest
+
+from core.parallel_simulation import jugar_bloque, simular_en_paralelo
+from core.simulation import politica_aleatoria, politica_pips, simular
+
+
+class TestParallelSimulation(unittest.TestCase):
+    
+    def test_jugar_bloque(self):
+        """Test que verifica el resumen de un bloque de partidas."""
+        resumen = jugar_bloque(0, 3, politica_aleatoria, politica_aleatoria, 1)
+        self.assertEqual(resumen['partidas'], 3)
+        self.assertEqual(sum(resumen['histograma_movimientos'].values()), 3)
+    
+    def test_reproducible_con_distintos_procesos(self):
+        """Test que verifica que el resultado no depende de procesos ni bloques."""
+        uno = simular_en_paralelo(6, semilla=4, procesos=1, tamano_bloque=6)
+        dos = simular_en_paralelo(6, semilla=4, procesos=2, tamano_bloque=2)
+        for clave in ('victorias_white', 'gammons_black', 'turnos_promedio',
+                      'histograma_movimientos'):
+            self.assertEqual(uno[clave], dos[clave])
+        
+        secuencial = simular(6, semilla=4)
+        self.assertEqual(uno['movimientos_promedio'], secuencial['movimientos_promedio'])
+    
+    def test_bloques_se_reciben_a_medida_que_terminan(self):
+        """Test que verifica que cada bloque se entrega al callback."""
+        bloques = []
+        resultado = simular_en_paralelo(5, politica_pips, politica_aleatoria, semilla=2,
+                                        procesos=2, tamano_bloque=2,
+                                        al_recibir_bloque=bloques.append)
+        self.assertEqual(len(bloques), 3)
+        self.assertEqual(sum(b['partidas'] for b in bloques), 5)
+        self.assertEqual(resultado['procesos'], 2)
+        self.assertAlmostEqual(resultado['tasa_victorias_white'],
+                               resultado['victorias_white'] / 5)
+    
+    def test_parametros_invalidos(self):
+        """Test que verifica que se rechazan parámetros inválidos."""
+        with self.assertRaises(ValueError):
+            simular_en_paralelo(0)
+        with self.assertRaises(ValueError):
+            simular_en_paralelo(1, tamano_bloque=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
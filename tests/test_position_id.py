@@ -0,0 +1,97 @@
+import random
+import unittest
+
+from core import position_id
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+
+
+class TestPositionId(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.game.iniciar_juego("Ana", "Carlos")
+
+    def test_ancho_fijo(self):
+        """Test que verifica que el identificador siempre ocupa 11 bytes y 15 caracteres."""
+        identificador = self.game.get_posicion_id(como_texto=False)
+        self.assertEqual(len(identificador), position_id.BYTES_ID)
+        self.assertEqual(len(position_id.a_texto(identificador)), position_id.LARGO_TEXTO)
+        vacio = position_id.codificar([0] * 24, 0, 0, 'white')
+        self.assertEqual(len(vacio), position_id.BYTES_ID)
+
+    def test_ida_y_vuelta(self):
+        """Test que verifica que decodificar devuelve la posición codificada."""
+        conteos = [0] * 24
+        conteos[0] = 3
+        conteos[23] = -2
+        conteos[5] = -13
+        identificador = position_id.codificar(conteos, 4, 0, 'black')
+        self.assertEqual(position_id.decodificar(identificador),
+                         (conteos, {'white': 4, 'black': 0}, {'white': 8, 'black': 0}, 'black'))
+        texto = position_id.a_texto(identificador)
+        self.assertEqual(position_id.desde_texto(texto), identificador)
+
+    def test_turno_cambia_identificador(self):
+        """Test que verifica que el turno forma parte del identificador."""
+        conteos = self.game.get_board().get_conteos()
+        self.assertNotEqual(position_id.codificar(conteos, 0, 0, 'white'),
+                            position_id.codificar(conteos, 0, 0, 'black'))
+
+    def test_posiciones_invalidas(self):
+        """Test que verifica que se rechazan posiciones e identificadores inválidos."""
+        conteos = [0] * 24
+        conteos[0] = 15
+        with self.assertRaises(ValueError):
+            position_id.codificar(conteos, 1, 0, 'white')
+        with self.assertRaises(ValueError):
+            position_id.decodificar(b'\x00' * 5)
+        with self.assertRaises(ValueError):
+            position_id.decodificar(b'\xff' * position_id.BYTES_ID)
+        with self.assertRaises(ValueError):
+            position_id.desde_texto("corto")
+        with self.assertRaises(ValueError):
+            position_id.desde_texto("!" * position_id.LARGO_TEXTO)
+
+    def test_game_desde_posicion_id(self):
+        """Test que verifica que el juego reconstruido es igual al original."""
+        texto = self.game.get_posicion_id()
+        copia = Game.desde_posicion_id(texto, "Ana", "Carlos")
+        self.assertEqual(copia.get_estado_juego(), self.game.get_estado_juego())
+        self.assertEqual(copia.get_hash(), self.game.get_hash())
+        self.assertEqual(copia.get_posicion_id(), texto)
+
+    def test_partida_completa(self):
+        """Test que verifica la ida y vuelta en todas las posiciones de una partida."""
+        game = Game(CompactBoard)
+        game.iniciar_juego("Ana", "Carlos", Dice(semilla=4))
+        rng = random.Random(4)
+        while not game.esta_terminado():
+            game.tirar_dados()
+            jugadas = game.generar_jugadas()
+            if jugadas:
+                game.aplicar(jugadas[rng.randrange(len(jugadas))])
+            game.cambiar_turno()
+            identificador = game.get_posicion_id(como_texto=False)
+            for clase in (CompactBoard, None):
+                copia = (Game.desde_posicion_id(identificador, clase_tablero=clase)
+                         if clase else Game.desde_posicion_id(identificador))
+                self.assertEqual(copia.get_hash(), game.get_hash())
+                self.assertEqual(copia.get_board().get_conteos(),
+                                 game.get_board().get_conteos())
+                for color in ('white', 'black'):
+                    self.assertEqual(copia.get_pip_count(color), game.get_pip_count(color))
+                    self.assertEqual(len(copia.get_bar(color)), len(game.get_bar(color)))
+                    self.assertEqual(len(copia.get_home(color)), len(game.get_home(color)))
+
+    def test_juego_reconstruido_se_puede_jugar(self):
+        """Test que verifica que el juego reconstruido acepta jugadas."""
+        copia = Game.desde_posicion_id(self.game.get_posicion_id(), dados=Dice(semilla=1))
+        copia.tirar_dados()
+        jugadas = copia.generar_jugadas()
+        self.assertTrue(copia.aplicar(jugadas[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
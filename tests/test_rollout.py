@@ -0,0 +1,101 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from core.checker import Checker
+from core.game import Game
+from core.move_generator import a_perspectiva
+from core.dice import expandir_tirada
+from core.rollout import PRIMERAS_TIRADAS, jugar_prueba, main, politica_aleatoria, rollout
+
+
+class TestRollout(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.game.iniciar_juego("Ana", "Carlos")
+
+    def test_resultado_de_prueba(self):
+        """Test que verifica que una prueba completa termina con 1 o 2 puntos."""
+        pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, 'white')
+        for indice in range(3):
+            self.assertIn(abs(jugar_prueba(pos, 0, indice, semilla=1)), (1, 2))
+
+    def test_prueba_truncada(self):
+        """Test que verifica que una prueba truncada devuelve una evaluación estática."""
+        pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, 'white')
+        resultado = jugar_prueba(pos, 0, 0, semilla=1, truncar=2)
+        self.assertLess(abs(resultado), 1)
+
+    def test_rollout_estadisticas(self):
+        """Test que verifica las estadísticas reportadas por el rollout."""
+        resultado = rollout(self.game, 36, truncar=6, semilla=3)
+        self.assertEqual(resultado['pruebas'], 36)
+        minimo, maximo = resultado['intervalo_95']
+        self.assertLessEqual(minimo, resultado['equity'])
+        self.assertLessEqual(resultado['equity'], maximo)
+        self.assertGreaterEqual(resultado['error_estandar'], 0)
+        self.assertTrue(0 <= resultado['victorias'] <= 1)
+
+    def test_rollout_reproducible(self):
+        """Test que verifica que la misma semilla da la misma equity."""
+        primera = rollout(self.game, 12, truncar=8, semilla=5, politica=politica_aleatoria)
+        segunda = rollout(self.game, 12, truncar=8, semilla=5, politica=politica_aleatoria)
+        self.assertEqual(primera['equity'], segunda['equity'])
+
+    def test_rollout_paralelo_igual_a_secuencial(self):
+        """Test que verifica que repartir las pruebas en procesos no cambia el resultado."""
+        secuencial = rollout(self.game, 12, truncar=4, semilla=9, procesos=1)
+        paralelo = rollout(self.game, 12, truncar=4, semilla=9, procesos=2, tamano_bloque=5)
+        self.assertAlmostEqual(secuencial['equity'], paralelo['equity'])
+        self.assertEqual(paralelo['procesos'], 2)
+
+    def test_rotacion_primera_tirada(self):
+        """Test que verifica que la primera tirada sale del índice de la prueba."""
+        # Con truncar=1 solo se juega la primera tirada, que no depende de la semilla
+        pos = a_perspectiva(self.game.get_board().get_conteos(), 0, 0, 'white')
+        self.assertEqual(jugar_prueba(pos, 0, 7, semilla=1, truncar=1),
+                         jugar_prueba(pos, 0, 7, semilla=2, truncar=1))
+
+    def test_primeras_tiradas_cubren_las_36(self):
+        """Test que verifica que la rotación tiene cada tirada tantas veces como sus combinaciones."""
+        esperadas = sorted(tuple(sorted(expandir_tirada(dado1, dado2)))
+                           for dado1 in range(1, 7) for dado2 in range(1, 7))
+        self.assertEqual(sorted(tuple(sorted(tirada)) for tirada in PRIMERAS_TIRADAS), esperadas)
+
+    def test_ultima_ficha_gana(self):
+        """Test que verifica que una posición ganada en una tirada vale una victoria."""
+        while self.game.get_jugador_actual().get_color() != 'white':
+            self.game.cambiar_turno()
+        board = self.game.get_board()
+        for i in range(1, 25):
+            while board.tiene_fichas(i):
+                board.quitar_ficha(i)
+        board.agregar_ficha(24, Checker('white'))
+        board.agregar_ficha(1, Checker('black'))
+        self.game.__dict__['__home__']['white'] = [Checker('white')] * 14
+        self.game.__dict__['__home__']['black'] = [Checker('black')] * 14
+        resultado = rollout(self.game, 36, semilla=1)
+        self.assertEqual(resultado['equity'], 1.0)
+        self.assertEqual(resultado['error_estandar'], 0.0)
+
+    def test_parametros_invalidos(self):
+        """Test que verifica que se rechazan parámetros fuera de rango."""
+        with self.assertRaises(ValueError):
+            rollout(self.game, 0)
+        with self.assertRaises(ValueError):
+            rollout(self.game, 10, truncar=-1)
+        with self.assertRaises(ValueError):
+            rollout(self.game, 10, tamano_bloque=0)
+
+    def test_main(self):
+        """Test que verifica el punto de entrada de línea de comandos."""
+        with redirect_stdout(io.StringIO()) as salida:
+            resultado = main(['--pruebas', '6', '--procesos', '1', '--truncar', '2',
+                              '--semilla', '1'])
+        self.assertEqual(resultado['pruebas'], 6)
+        self.assertIn('intervalo_95', salida.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+import asyncio
+import json
+import random
+import unittest
+
+from server.main import LIMITE_LINEA, GameServer
+from server.session_store import SessionStore
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.servidor = GameServer()
+        self.puerto = await self.servidor.iniciar()
+        self.conexiones = []
+        self.lector, self.escritor = await self.conectar()
+
+    async def asyncTearDown(self):
+        for _, escritor in self.conexiones:
+            escritor.close()
+        await self.servidor.detener()
+
+    async def conectar(self):
+        """Abre una conexión al servidor de prueba."""
+        conexion = await asyncio.open_connection('127.0.0.1', self.puerto)
+        self.conexiones.append(conexion)
+        return conexion
+
+    async def pedir(self, pedido, conexion=None):
+        """Envía un pedido y espera su respuesta."""
+        lector, escritor = conexion or (self.lector, self.escritor)
+        escritor.write(json.dumps(pedido).encode('utf-8') + b'\n')
+        await escritor.drain()
+        return json.loads(await lector.readline())
+
+    async def test_nueva_partida_y_estado(self):
+        """Test que verifica crear una partida y consultar su estado."""
+        respuesta = await self.pedir({'comando': 'nueva', 'jugadores': ['Ana', 'Carlos']})
+        self.assertTrue(respuesta['ok'])
+        self.assertEqual(self.servidor.get_cantidad_sesiones(), 1)
+        estado = (await self.pedir({'comando': 'estado', 'sesion': respuesta['sesion']}))['estado']
+        self.assertIn(estado['jugador_actual'], ('Ana', 'Carlos'))
+        self.assertEqual(estado['pips_white'], 167)
+        self.assertEqual(len(estado['tablero']), 24)
+        self.assertEqual(len(estado['posicion_id']), 15)
+
+    async def test_tirar_jugadas_y_mover(self):
+        """Test que verifica un turno completo: tirar, listar jugadas y mover."""
+        sesion = (await self.pedir({'comando': 'nueva', 'semilla': 3}))['sesion']
+        tirada = await self.pedir({'comando': 'tirar', 'sesion': sesion})
+        self.assertTrue(tirada['ok'])
+        self.assertIn(len(tirada['dados']), (2, 4))
+        color = tirada['estado']['color_actual']
+
+        jugadas = (await self.pedir({'comando': 'jugadas', 'sesion': sesion}))['jugadas']
+        self.assertTrue(jugadas)
+        respuesta = await self.pedir({'comando': 'mover', 'sesion': sesion,
+                                      'movimientos': jugadas[0]})
+        self.assertTrue(respuesta['ok'])
+        self.assertTrue(respuesta['turno_terminado'])
+        self.assertNotEqual(respuesta['estado']['color_actual'], color)
+
+    async def test_partida_completa(self):
+        """Test que verifica que una partida se puede jugar entera por el protocolo."""
+        sesion = (await self.pedir({'comando': 'nueva', 'semilla': 8}))['sesion']
+        rng = random.Random(8)
+        estado = None
+        for _ in range(2000):
+            respuesta = await self.pedir({'comando': 'tirar', 'sesion': sesion})
+            estado = respuesta['estado']
+            if respuesta['turno_terminado']:
+                continue
+            jugadas = (await self.pedir({'comando': 'jugadas', 'sesion': sesion}))['jugadas']
+            respuesta = await self.pedir({'comando': 'mover', 'sesion': sesion,
+                                          'movimientos': rng.choice(jugadas)})
+            estado = respuesta['estado']
+            if estado['terminado']:
+                break
+        self.assertTrue(estado['terminado'])
+        self.assertIsNotNone(estado['ganador'])
+        respuesta = await self.pedir({'comando': 'tirar', 'sesion': sesion})
+        self.assertFalse(respuesta['ok'])
+
+    async def test_errores(self):
+        """Test que verifica que los pedidos inválidos reciben un error y la conexión sigue."""
+        sesion = (await self.pedir({'comando': 'nueva'}))['sesion']
+        self.escritor.write(b'esto no es json\n')
+        self.assertFalse(json.loads(await self.lector.readline())['ok'])
+
+        casos = [
+            {'comando': 'volar'},
+            {'comando': 'estado', 'sesion': 'no-existe'},
+            {'comando': 'estado', 'sesion': ['lista']},
+            {'comando': 'mover', 'sesion': sesion, 'movimientos': [[1, 2]]},
+            {'comando': 'mover', 'sesion': sesion, 'movimientos': 'nada'},
+            {'comando': 'nueva', 'jugadores': ['Solo']},
+            {'comando': 'nueva', 'semilla': 'abc'},
+        ]
+        for pedido in casos:
+            respuesta = await self.pedir(pedido)
+            self.assertFalse(respuesta['ok'], pedido)
+            self.assertIn('error', respuesta)
+
+        await self.pedir({'comando': 'tirar', 'sesion': sesion})
+        self.assertFalse((await self.pedir({'comando': 'tirar', 'sesion': sesion}))['ok'])
+        respuesta = await self.pedir({'comando': 'mover', 'sesion': sesion,
+                                      'movimientos': [[24, 1]]})
+        self.assertEqual(respuesta['error'], "Movimiento inválido")
+        self.assertTrue((await self.pedir({'comando': 'estado', 'sesion': sesion}))['ok'])
+
+    async def test_mover_exige_jugada_completa(self):
+        """Test que verifica que se rechazan las jugadas parciales y se aceptan en otro orden."""
+        sesion = (await self.pedir({'comando': 'nueva', 'semilla': 3}))['sesion']
+        await self.pedir({'comando': 'tirar', 'sesion': sesion})
+        antes = (await self.pedir({'comando': 'estado', 'sesion': sesion}))['estado']
+        jugadas = (await self.pedir({'comando': 'jugadas', 'sesion': sesion}))['jugadas']
+        jugada = next(jugada for jugada in jugadas if len(jugada) == 2 and
+                      jugada[0][0] not in (0, jugada[1][0]) and jugada[0][1] != jugada[1][0])
+
+        respuesta = await self.pedir({'comando': 'mover', 'sesion': sesion,
+                                      'movimientos': jugada[:1]})
+        self.assertFalse(respuesta['ok'])
+        self.assertIn('ambos dados', respuesta['error'])
+        estado = (await self.pedir({'comando': 'estado', 'sesion': sesion}))['estado']
+        self.assertEqual(estado, antes)
+
+        respuesta = await self.pedir({'comando': 'mover', 'sesion': sesion,
+                                      'movimientos': jugada[::-1]})
+        self.assertTrue(respuesta['ok'])
+        self.assertTrue(respuesta['turno_terminado'])
+
+    def test_tipos_inesperados(self):
+        """Test que verifica que un campo con otro tipo responde un error y no una excepción."""
+        for pedido in ({'comando': ['nueva']}, {'comando': {'a': 1}}):
+            respuesta = self.servidor.procesar_linea(json.dumps(pedido))
+            self.assertFalse(respuesta['ok'], pedido)
+            self.assertIn('error', respuesta)
+
+    async def test_detener_cancela_las_conexiones(self):
+        """Test que verifica que las conexiones abiertas terminan canceladas al detener."""
+        await self.pedir({'comando': 'nueva'})
+        tareas = set(self.servidor.__dict__['__conexiones__'])
+        self.assertTrue(tareas)
+        await self.servidor.detener()
+        self.assertTrue(all(tarea.cancelled() for tarea in tareas))
+
+    async def test_id_del_pedido(self):
+        """Test que verifica que el id del pedido vuelve en la respuesta."""
+        respuesta = await self.pedir({'comando': 'nueva', 'id': 41})
+        self.assertEqual(respuesta['id'], 41)
+        respuesta = await self.pedir({'comando': 'volar', 'id': 'x'})
+        self.assertEqual(respuesta['id'], 'x')
+
+    async def test_sesion_compartida_entre_conexiones(self):
+        """Test que verifica que una sesión no depende de la conexión que la creó."""
+        sesion = (await self.pedir({'comando': 'nueva'}))['sesion']
+        self.escritor.close()
+        otra = await self.conectar()
+        self.assertTrue((await self.pedir({'comando': 'estado', 'sesion': sesion}, otra))['ok'])
+        self.assertTrue((await self.pedir({'comando': 'cerrar', 'sesion': sesion}, otra))['ok'])
+        self.assertFalse((await self.pedir({'comando': 'estado', 'sesion': sesion}, otra))['ok'])
+        self.assertEqual(self.servidor.get_cantidad_sesiones(), 0)
+
+    async def test_muchas_conexiones_y_sesiones(self):
+        """Test que verifica conexiones concurrentes con muchas sesiones cada una."""
+        async def cliente():
+            conexion = await self.conectar()
+            for _ in range(50):
+                respuesta = await self.pedir({'comando': 'nueva'}, conexion)
+                self.assertTrue(respuesta['ok'])
+        await asyncio.gather(*(cliente() for _ in range(40)))
+        self.assertEqual(self.servidor.get_cantidad_sesiones(), 2000)
+
+    async def test_sesiones_estacionadas_son_transparentes(self):
+        """Test que verifica que una partida estacionada sigue respondiendo igual."""
+        await self.servidor.detener()
+        almacen = SessionStore(max_activas=1)
+        self.servidor = GameServer(almacen=almacen)
+        self.puerto = await self.servidor.iniciar()
+        conexion = await self.conectar()
+
+        primera = (await self.pedir({'comando': 'nueva', 'semilla': 1}, conexion))['sesion']
+        tirada = await self.pedir({'comando': 'tirar', 'sesion': primera}, conexion)
+        await self.pedir({'comando': 'nueva'}, conexion)
+        self.assertEqual(almacen.get_estadisticas()['estacionadas'], 1)
+
+        estado = await self.pedir({'comando': 'estado', 'sesion': primera}, conexion)
+        self.assertEqual(estado['estado'], tirada['estado'])
+        self.assertEqual(almacen.get_estadisticas()['rehidrataciones'], 1)
+        almacen.cerrar()
+
+    async def test_linea_demasiado_larga(self):
+        """Test que verifica que una línea enorme se rechaza sin tumbar el servidor."""
+        self.escritor.write(b'x' * (LIMITE_LINEA + 10) + b'\n')
+        respuesta = json.loads(await self.lector.readline())
+        self.assertFalse(respuesta['ok'])
+        otra = await self.conectar()
+        self.assertTrue((await self.pedir({'comando': 'nueva'}, otra))['ok'])
+
+
+if __name__ == '__main__':
+    unittest.main()
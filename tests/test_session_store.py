@@ -0,0 +1,160 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from server.session_store import SessionStore, desempaquetar, empaquetar
+
+
+def nueva_partida(semilla=None):
+    """Crea una partida iniciada con tablero compacto."""
+    game = Game(CompactBoard)
+    game.iniciar_juego("Ana", "Carlos", Dice(semilla=semilla) if semilla is not None else None)
+    return game
+
+
+class TestEmpaquetar(unittest.TestCase):
+
+    def test_ida_y_vuelta_en_toda_una_partida(self):
+        """Test que verifica que cada estado de una partida se rehidrata igual."""
+        game = nueva_partida(5)
+        rng = random.Random(5)
+        while not game.esta_terminado():
+            game.tirar_dados()
+            jugadas = game.generar_jugadas()
+            if jugadas and rng.random() < 0.5:
+                # A mitad de turno: quedan dados disponibles
+                game.hacer_movimiento(*jugadas[0][0])
+            for clase in (CompactBoard, Board):
+                copia = desempaquetar(empaquetar(game), clase)
+                self.assertEqual(copia.get_estado_juego(), game.get_estado_juego())
+                self.assertEqual(copia.get_hash(), game.get_hash())
+                self.assertEqual(copia.get_ultimo_roll(), game.get_ultimo_roll())
+                self.assertEqual(copia.get_board().get_conteos(), game.get_board().get_conteos())
+            jugadas = game.generar_jugadas()
+            if jugadas:
+                game.aplicar(jugadas[0])
+            game.cambiar_turno()
+
+    def test_tamano_compacto(self):
+        """Test que verifica que una partida estacionada ocupa unas pocas decenas de bytes."""
+        game = nueva_partida(1)
+        game.tirar_dados()
+        self.assertLess(len(empaquetar(game)), 48)
+
+    def test_estacionar_no_cambia_los_dados(self):
+        """Test que verifica que una partida estacionada tira lo mismo que una que nunca se estacionó."""
+        for bloque in (0, 16):
+            estacionada = Game(CompactBoard)
+            estacionada.iniciar_juego("Ana", "Carlos", Dice(semilla=9, bloque=bloque))
+            testigo = Game(CompactBoard)
+            testigo.iniciar_juego("Ana", "Carlos", Dice(semilla=9, bloque=bloque))
+            for turno in range(60):
+                if turno % 3 == 0:
+                    estacionada = desempaquetar(empaquetar(estacionada))
+                    self.assertEqual(estacionada.get_dice().get_valores(),
+                                     testigo.get_dice().get_valores())
+                self.assertEqual(estacionada.tirar_dados(), testigo.tirar_dados())
+                jugadas = testigo.generar_jugadas()
+                if jugadas:
+                    testigo.aplicar(jugadas[0])
+                    estacionada.aplicar(jugadas[0])
+                if turno % 3 == 1:
+                    # También a mitad de turno, con los dados ya tirados
+                    estacionada = desempaquetar(empaquetar(estacionada))
+                if testigo.esta_terminado():
+                    break
+                estacionada.cambiar_turno()
+                testigo.cambiar_turno()
+
+    def test_dados_reproducibles(self):
+        """Test que verifica que la partida rehidratada sigue con dados deterministas."""
+        datos = empaquetar(nueva_partida(2))
+        self.assertEqual(desempaquetar(datos).tirar_dados(), desempaquetar(datos).tirar_dados())
+
+
+class TestSessionStore(unittest.TestCase):
+
+    def setUp(self):
+        self.ahora = 0.0
+        self.almacen = SessionStore(max_activas=3, max_estacionadas=4, segundos_inactividad=60,
+                                    reloj=lambda: self.ahora)
+
+    def tearDown(self):
+        self.almacen.cerrar()
+
+    def test_estaciona_por_inactividad(self):
+        """Test que verifica que las partidas inactivas se estacionan y se rehidratan."""
+        game = nueva_partida(3)
+        game.tirar_dados()
+        self.almacen.agregar('a', game)
+        self.almacen.agregar('b', nueva_partida())
+        self.ahora = 30
+        self.almacen.obtener('b')
+        self.ahora = 70
+        self.assertEqual(self.almacen.estacionar_inactivas(), 1)
+        estadisticas = self.almacen.get_estadisticas()
+        self.assertEqual((estadisticas['activas'], estadisticas['estacionadas']), (1, 1))
+
+        recuperada = self.almacen.obtener('a')
+        self.assertIsNot(recuperada, game)
+        self.assertEqual(recuperada.get_estado_juego(), game.get_estado_juego())
+        self.assertIs(self.almacen.obtener('a'), recuperada)
+
+    def test_limite_de_activas_y_disco(self):
+        """Test que verifica el desalojo LRU de activas a memoria compacta y luego a disco."""
+        partidas = {str(i): nueva_partida(i) for i in range(10)}
+        for sesion, game in partidas.items():
+            self.almacen.agregar(sesion, game)
+        estadisticas = self.almacen.get_estadisticas()
+        self.assertEqual((estadisticas['activas'], estadisticas['estacionadas'],
+                          estadisticas['en_disco']), (3, 4, 3))
+        self.assertEqual(len(self.almacen), 10)
+
+        # Las primeras fueron a disco y vuelven igual
+        for sesion in ('0', '1', '9'):
+            self.assertIn(sesion, self.almacen)
+            self.assertEqual(self.almacen.obtener(sesion).get_hash(), partidas[sesion].get_hash())
+        self.assertEqual(self.almacen.get_estadisticas()['desde_disco'], 2)
+        self.assertEqual(len(self.almacen), 10)
+
+    def test_eliminar(self):
+        """Test que verifica eliminar sesiones en cualquier nivel."""
+        for i in range(10):
+            self.almacen.agregar(str(i), nueva_partida())
+        for sesion in ('0', '5', '9'):
+            self.assertTrue(self.almacen.eliminar(sesion))
+            self.assertNotIn(sesion, self.almacen)
+            self.assertIsNone(self.almacen.obtener(sesion))
+        self.assertFalse(self.almacen.eliminar('0'))
+        self.assertEqual(len(self.almacen), 7)
+
+    def test_almacen_en_disco_persistente(self):
+        """Test que verifica que las sesiones sobreviven a cerrar y reabrir el almacén."""
+        directorio = tempfile.mkdtemp()
+        vieja = nueva_partida(4)
+        try:
+            with SessionStore(directorio, max_activas=1, max_estacionadas=0) as almacen:
+                almacen.agregar('vieja', vieja)
+                almacen.agregar('nueva', nueva_partida(6))
+            self.assertTrue(os.listdir(directorio))
+            with SessionStore(directorio) as almacen:
+                self.assertEqual(len(almacen), 2)
+                self.assertEqual(almacen.obtener('vieja').get_hash(), vieja.get_hash())
+                self.assertIsNotNone(almacen.obtener('nueva'))
+        finally:
+            shutil.rmtree(directorio)
+
+    def test_limites_invalidos(self):
+        """Test que verifica que se rechazan límites sin sentido."""
+        with self.assertRaises(ValueError):
+            SessionStore(max_activas=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import io
+import random
+import unittest
+from contextlib import redirect_stdout
+
+from core.game import Game
+from core.simulation import (
+    jugar_partida, main, politica_aleatoria, politica_pips, simular
+)
+
+
+class TestSimulation(unittest.TestCase):
+    
+    def test_jugar_partida_termina(self):
+        """Test que verifica que una partida simulada llega al final."""
+        resultado = jugar_partida(politica_aleatoria, politica_aleatoria, 3)
+        self.assertIn(resultado['ganador'], ['white', 'black'])
+        self.assertGreater(resultado['turnos'], 0)
+        self.assertGreater(resultado['movimientos'], 0)
+        self.assertIsInstance(resultado['gammon'], bool)
+    
+    def test_simular_estadisticas(self):
+        """Test que verifica las estadísticas de una simulación corta."""
+        estadisticas = simular(3, semilla=7)
+        self.assertEqual(estadisticas['partidas'], 3)
+        self.assertEqual(estadisticas['victorias_white'] + estadisticas['victorias_black'], 3)
+        self.assertGreater(estadisticas['turnos_promedio'], 0)
+        self.assertGreater(estadisticas['partidas_por_segundo'], 0)
+    
+    def test_simular_reproducible(self):
+        """Test que verifica que la misma semilla da los mismos resultados."""
+        primera = simular(2, politica_pips, politica_aleatoria, semilla=11)
+        segunda = simular(2, politica_pips, politica_aleatoria, semilla=11)
+        for clave in ('victorias_white', 'gammons_white', 'turnos_promedio', 'movimientos_promedio'):
+            self.assertEqual(primera[clave], segunda[clave])
+    
+    def test_simular_cantidad_invalida(self):
+        """Test que verifica que se rechaza una cantidad de partidas no positiva."""
+        with self.assertRaises(ValueError):
+            simular(0)
+    
+    def test_politica_pips_prefiere_capturar(self):
+        """Test que verifica que la política de pips elige la captura."""
+        game = Game()
+        game.iniciar_juego()
+        while game.get_jugador_actual().get_color() != 'white':
+            game.cambiar_turno()
+        board = game.get_board()
+        board.quitar_ficha(8)
+        board.quitar_ficha(8)
+        game.__dict__['__movimientos_disponibles__'] = [6, 1]
+        
+        jugada = politica_pips(game, random.Random(0))
+        self.assertTrue(game.aplicar(jugada))
+        self.assertEqual(len(game.get_bar('black')), 1)
+    
+    def test_politicas_dan_jugadas_legales(self):
+        """Test que verifica que ambas políticas eligen jugadas completas legales."""
+        rng = random.Random(4)
+        game = Game()
+        game.iniciar_juego()
+        for _ in range(40):
+            game.tirar_dados()
+            legales = game.generar_jugadas()
+            for politica in (politica_aleatoria, politica_pips):
+                jugada = politica(game, rng)
+                self.assertEqual(bool(jugada), bool(legales))
+                if jugada:
+                    self.assertTrue(game.aplicar(jugada))
+                    self.assertEqual(len(jugada), len(legales[0]))
+                    game.deshacer()
+            if legales:
+                game.aplicar(politica_aleatoria(game, rng))
+            if game.esta_terminado():
+                break
+            game.cambiar_turno()
+
+    def test_main_imprime_estadisticas(self):
+        """Test que verifica el punto de entrada de línea de comandos."""
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            estadisticas = main(['--partidas', '1', '--semilla', '5', '--blancas', 'pips'])
+        self.assertEqual(estadisticas['partidas'], 1)
+        self.assertIn('partidas_por_segundo', salida.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import copy
+import random
+import unittest
+
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+
+
+def jugar_turnos(game, turnos, semilla):
+    """Juega turnos con jugadas al azar y deja los dados tirados."""
+    rng = random.Random(semilla)
+    for _ in range(turnos):
+        game.tirar_dados()
+        jugadas = game.generar_jugadas()
+        if jugadas:
+            game.aplicar(jugadas[rng.randrange(len(jugadas))])
+        game.cambiar_turno()
+    game.tirar_dados()
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.game = Game(verificar_hash=True)
+        self.game.iniciar_juego("Ana", "Carlos", Dice(semilla=7))
+        jugar_turnos(self.game, 30, 7)
+
+    def estado(self, game):
+        """Retorna una foto comparable del estado del juego."""
+        return (game.get_board().get_conteos(), game.get_estado_juego(), game.get_hash(),
+                game.get_board().get_mas_lejana('white'), game.get_board().get_mas_lejana('black'),
+                game.get_board().get_fuera_de_casa('white'),
+                game.get_board().get_fuera_de_casa('black'))
+
+    def test_snapshot_es_inmutable(self):
+        """Test que verifica que la instantánea es una tupla que no cambia al jugar."""
+        instantanea = self.game.snapshot()
+        self.assertIsInstance(instantanea, tuple)
+        hash(instantanea)
+        jugar_turnos(self.game, 3, 1)
+        self.assertNotEqual(self.game.snapshot(), instantanea)
+
+    def test_restaurar(self):
+        """Test que verifica que restaurar vuelve exactamente al estado guardado."""
+        antes = self.estado(self.game)
+        instantanea = self.game.snapshot()
+        jugar_turnos(self.game, 5, 2)
+        self.game.restaurar(instantanea)
+        self.assertEqual(self.estado(self.game), antes)
+        self.assertFalse(self.game.deshacer())
+
+        jugadas = self.game.generar_jugadas()
+        if jugadas:
+            self.assertTrue(self.game.aplicar(jugadas[0]))
+
+    def test_clonar_es_independiente(self):
+        """Test que verifica que la copia no comparte estado mutable con el original."""
+        antes = self.estado(self.game)
+        copia = self.game.clonar(dados=Dice(semilla=3))
+        self.assertEqual(self.estado(copia), antes)
+        self.assertIs(copia.get_players(), self.game.get_players())
+
+        jugar_turnos(copia, 5, 3)
+        self.assertEqual(self.estado(self.game), antes)
+
+    def test_copiar_tablero_es_independiente(self):
+        """Test que verifica que la copia de cada tablero no comparte puntos ni contadores."""
+        for clase in (Board, CompactBoard):
+            game = Game(clase, verificar_hash=True)
+            game.iniciar_juego("Ana", "Carlos", Dice(semilla=11))
+            jugar_turnos(game, 15, 11)
+            antes = self.estado(game)
+            copia = game.clonar(dados=Dice(semilla=4))
+            self.assertIsNot(copia.get_board(), game.get_board())
+            self.assertEqual(copia.get_board().get_estado(), game.get_board().get_estado())
+
+            jugar_turnos(copia, 10, 4)
+            self.assertEqual(self.estado(game), antes, clase.__name__)
+
+    def test_estado_entre_tableros(self):
+        """Test que verifica que Board y CompactBoard comparten el formato de estado."""
+        board = self.game.get_board()
+        compacto = CompactBoard.desde_estado(board.get_estado())
+        self.assertEqual(compacto.get_estado(), board.get_estado())
+        self.assertEqual(Board.desde_estado(compacto.get_estado()).get_estado(),
+                         board.get_estado())
+
+        game = Game(CompactBoard)
+        game.iniciar_juego("Ana", "Carlos")
+        game.restaurar(self.game.snapshot())
+        self.assertEqual(game.snapshot(), self.game.snapshot())
+
+    def test_ida_y_vuelta_en_ambos_tableros(self):
+        """Test que verifica que snapshot, restaurar y clonar conservan todo el estado."""
+        for clase in (Board, CompactBoard):
+            game = Game(clase, verificar_hash=True)
+            game.iniciar_juego("Ana", "Carlos", Dice(semilla=5))
+            jugar_turnos(game, 20, 5)
+            antes = self.estado(game)
+
+            copia = Game(clase)
+            copia.iniciar_juego("Ana", "Carlos")
+            copia.restaurar(game.snapshot())
+            self.assertEqual(self.estado(copia), antes, clase.__name__)
+            self.assertEqual(self.estado(game.clonar()), antes, clase.__name__)
+            self.assertEqual(self.estado(copy.deepcopy(game)), antes, clase.__name__)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import random
+import unittest
+
+from core import zobrist
+from core.checker import Checker
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.move_generator import _MOVIMIENTOS, a_perspectiva, generar_jugadas_perspectiva
+
+
+class TestZobrist(unittest.TestCase):
+    
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.game = Game(verificar_hash=True)
+        self.game.iniciar_juego("Ana", "Carlos")
+        while self.game.get_jugador_actual().get_color() != 'white':
+            self.game.cambiar_turno()
+    
+    def test_clave_punto_vacio_es_cero(self):
+        """Test que verifica que un punto vacío no aporta a la clave."""
+        for posicion in range(1, 25):
+            self.assertEqual(zobrist.clave_punto(posicion, 0), 0)
+        self.assertEqual(zobrist.clave_barra('white', 0), 0)
+        self.assertEqual(zobrist.clave_fuera('black', 0), 0)
+    
+    def test_hash_juego_no_iniciado(self):
+        """Test que verifica que un juego sin iniciar tiene clave 0."""
+        self.assertEqual(Game().get_hash(), 0)
+    
+    def test_hash_igual_en_ambos_tableros(self):
+        """Test que verifica que la clave no depende de la implementación del tablero."""
+        compacto = Game(CompactBoard)
+        compacto.iniciar_juego()
+        while compacto.get_jugador_actual().get_color() != 'white':
+            compacto.cambiar_turno()
+        self.assertEqual(compacto.get_hash(), self.game.get_hash())
+    
+    def test_hash_cambia_con_el_turno(self):
+        """Test que verifica que el turno forma parte de la clave."""
+        clave = self.game.get_hash()
+        self.game.cambiar_turno()
+        self.assertEqual(self.game.get_hash(), clave ^ zobrist.TURNO_BLACK)
+        self.game.cambiar_turno()
+        self.assertEqual(self.game.get_hash(), clave)
+    
+    def test_hash_incremental_en_movimiento_normal(self):
+        """Test que verifica la clave tras un movimiento normal."""
+        clave = self.game.get_hash()
+        self.game.__dict__['__movimientos_disponibles__'] = [3, 1]
+        self.assertTrue(self.game.hacer_movimiento(1, 4))
+        self.assertNotEqual(self.game.get_hash(), clave)
+        self.assertTrue(self.game.hacer_movimiento(4, 5))
+    
+    def test_transposicion_misma_clave(self):
+        """Test que verifica que distinto orden de movimientos da la misma clave."""
+        otro = Game(verificar_hash=True)
+        otro.iniciar_juego()
+        while otro.get_jugador_actual().get_color() != 'white':
+            otro.cambiar_turno()
+        
+        self.game.__dict__['__movimientos_disponibles__'] = [3, 1]
+        self.game.hacer_movimiento(17, 20)
+        self.game.hacer_movimiento(19, 20)
+        otro.__dict__['__movimientos_disponibles__'] = [3, 1]
+        otro.hacer_movimiento(19, 20)
+        otro.hacer_movimiento(17, 20)
+        self.assertEqual(self.game.get_hash(), otro.get_hash())
+    
+    def test_hash_incremental_captura_y_barra(self):
+        """Test que verifica la clave tras una captura y la entrada desde la barra."""
+        board = self.game.get_board()
+        board.quitar_ficha(8)
+        board.quitar_ficha(8)
+        # Los cambios directos al tablero no pasan por Game: se recalcula la clave
+        self.game.__dict__['__clave_zobrist__'] = self.game.__calcular_hash__()
+        self.game.__dict__['__movimientos_disponibles__'] = [6, 1]
+        self.assertTrue(self.game.hacer_movimiento(1, 7))
+        self.assertTrue(self.game.hacer_movimiento(7, 8))
+        self.assertEqual(len(self.game.get_bar('black')), 1)
+        
+        self.game.cambiar_turno()
+        self.game.__dict__['__movimientos_disponibles__'] = [4, 2]
+        self.assertTrue(self.game.hacer_movimiento(0, 21))
+        self.assertEqual(len(self.game.get_bar('black')), 0)
+    
+    def test_hash_incremental_bear_off(self):
+        """Test que verifica la clave tras sacar fichas."""
+        board = self.game.get_board()
+        for i in range(1, 25):
+            while board.tiene_fichas(i):
+                board.quitar_ficha(i)
+        board.agregar_ficha(24, Checker('white'))
+        board.agregar_ficha(22, Checker('white'))
+        self.game.__dict__['__clave_zobrist__'] = self.game.__calcular_hash__()
+        
+        self.game.__dict__['__movimientos_disponibles__'] = [6, 1]
+        self.assertTrue(self.game.hacer_movimiento(24, 25))
+        self.assertTrue(self.game.hacer_movimiento(22, 25))
+        self.assertEqual(len(self.game.get_home('white')), 2)
+    
+    def test_clave_perspectiva_coincide_con_el_juego(self):
+        """Test que verifica que la clave de una posición en perspectiva es la del juego."""
+        rng = random.Random(4)
+        game = Game(verificar_hash=True)
+        game.iniciar_juego("Ana", "Carlos", Dice(semilla=4))
+        while not game.esta_terminado():
+            game.tirar_dados()
+            color = game.get_jugador_actual().get_color()
+            rival = 'black' if color == 'white' else 'white'
+            pos = a_perspectiva(game.get_board().get_conteos(), len(game.get_bar(color)),
+                                len(game.get_home(color)), color)
+            jugadas = generar_jugadas_perspectiva(pos, game.get_movimientos_disponibles())
+            if jugadas:
+                final = rng.choice(list(jugadas))
+                clave = zobrist.clave_perspectiva(final, len(game.get_home(rival)), color)
+                tabla = _MOVIMIENTOS[color]
+                game.aplicar(tuple(tabla[origen][destino] for origen, destino, _ in jugadas[final]))
+            else:
+                clave = zobrist.clave_perspectiva(pos, len(game.get_home(rival)), color)
+            game.cambiar_turno()
+            self.assertEqual(clave, game.get_hash())
+    
+    def test_verificacion_detecta_desincronizacion(self):
+        """Test que verifica que el modo depuración detecta claves incorrectas."""
+        self.game.get_board().quitar_ficha(1)
+        with self.assertRaises(AssertionError):
+            self.game.get_hash()
+
+
+if __name__ == '__main__':
+    unittest.main()